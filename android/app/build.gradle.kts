@@ -46,3 +46,8 @@ android {
 flutter {
     source = "../.."
 }
+
+dependencies {
+    // MainActivity의 업데이트 APK 설치(FileProvider)
+    implementation("androidx.core:core:1.13.1")
+}
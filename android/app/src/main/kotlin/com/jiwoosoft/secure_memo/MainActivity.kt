@@ -1,5 +1,37 @@
 package com.jiwoosoft.secure_memo
 
+import android.content.Intent
+import androidx.core.content.FileProvider
 import io.flutter.embedding.android.FlutterActivity
+import io.flutter.embedding.engine.FlutterEngine
+import io.flutter.plugin.common.MethodChannel
+import java.io.File
 
-class MainActivity : FlutterActivity()
+class MainActivity : FlutterActivity() {
+    override fun configureFlutterEngine(flutterEngine: FlutterEngine) {
+        super.configureFlutterEngine(flutterEngine)
+        // UpdateService가 SHA-256 검증을 마친 APK의 설치 화면 열기
+        MethodChannel(flutterEngine.dartExecutor.binaryMessenger, UPDATE_CHANNEL).setMethodCallHandler { call, result ->
+            if (call.method != "installApk") {
+                result.notImplemented()
+                return@setMethodCallHandler
+            }
+            val path = call.argument<String>("path")
+            if (path == null) {
+                result.error("INVALID_ARGUMENT", "path is required", null)
+                return@setMethodCallHandler
+            }
+            val uri = FileProvider.getUriForFile(this, "$packageName.update_provider", File(path))
+            val intent = Intent(Intent.ACTION_VIEW).apply {
+                setDataAndType(uri, "application/vnd.android.package-archive")
+                addFlags(Intent.FLAG_GRANT_READ_URI_PERMISSION or Intent.FLAG_ACTIVITY_NEW_TASK)
+            }
+            startActivity(intent)
+            result.success(true)
+        }
+    }
+
+    companion object {
+        private const val UPDATE_CHANNEL = "com.jiwoosoft.secure_memo/update"
+    }
+}
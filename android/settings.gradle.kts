@@ -23,3 +23,19 @@ plugins {
 }
 
 include(":app")
+
+// 배포 파이프라인(gradle_cache.py)이 빌드 중에 띄우는 캐시 서버
+// 모든 조회가 이 서버를 거쳐야 빌드별 적중률을 집계할 수 있으므로 로컬 디렉터리 캐시는 끔
+val buildCacheUrl: String? = System.getenv("GRADLE_BUILD_CACHE_URL")
+if (buildCacheUrl != null) {
+    buildCache {
+        local {
+            isEnabled = false
+        }
+        remote<HttpBuildCache> {
+            url = uri(buildCacheUrl)
+            isAllowInsecureProtocol = true
+            isPush = true
+        }
+    }
+}
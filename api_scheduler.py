@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 호출 스케줄러 (할당량 인식 토큰 버킷)
+Google Drive, GitHub REST 호출이 모두 이 스케줄러를 거치도록 하여
+사용자별 할당량(403 rateLimitExceeded, 429, GitHub 2차 속도 제한)에 걸리지 않게 합니다.
+
+- API별 토큰 버킷으로 초당 호출 수 제한
+- 우선순위: CRITICAL(APK/version.json 업로드) > NORMAL > COSMETIC(README/릴리즈 노트 갱신)
+  토큰이 부족하면 높은 우선순위부터 처리하고, 낮은 우선순위는 버킷 일부를 남겨 둔 채로만 실행
+- 속도 제한 응답을 받으면 호출 속도를 절반으로 줄이고, 성공할 때마다 조금씩 회복 (AIMD)
+- GitHub X-RateLimit-Remaining/Reset, Retry-After 헤더를 읽어 남은 예산에 맞춰 속도 조정
+
+사용 예:
+  from api_scheduler import get_scheduler, CRITICAL
+  get_scheduler('drive').execute(service.files().list(q=query), CRITICAL)
+  get_scheduler('github').request(lambda: requests.get(url, headers=headers))
+"""
+
+import time
+import heapq
+import itertools
+import threading
+
+CRITICAL, NORMAL, COSMETIC = 0, 1, 2
+PRIORITY_NAMES = {CRITICAL: 'critical', NORMAL: 'normal', COSMETIC: 'cosmetic'}
+# 우선순위별로 남겨 두어야 하는 버킷 비율 (낮은 우선순위는 높은 우선순위 몫을 쓰지 않음)
+PRIORITY_RESERVE = {CRITICAL: 0.0, NORMAL: 0.25, COSMETIC: 0.5}
+
+# API별 기본 한도 (초당 호출 수, 버스트 크기)
+#   Drive: 사용자별 분당 수천 건이지만 쓰기 호출은 훨씬 빨리 제한되므로 보수적으로 설정
+#   GitHub: 인증 사용자 시간당 5,000건, 콘텐츠 생성은 분당 80건 이하 권장
+DEFAULT_LIMITS = {
+    'drive': (10.0, 20),
+    'github': (1.0, 10),
+}
+MIN_RATE = 0.1
+RECOVERY_STEP = 0.05
+MAX_RETRIES = 5
+DRIVE_RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+
+
+def _header(headers, name):
+    value = headers.get(name) if headers else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class ApiScheduler:
+    """우선순위를 지원하는 적응형 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, name, rate, burst):
+        self.name = name
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.condition = threading.Condition()
+        self.waiting = []
+        self.sequence = itertools.count()
+        self.stats = {'calls': 0, 'throttled': 0, 'waited_seconds': 0.0}
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, priority=NORMAL, cost=1):
+        """토큰을 얻을 때까지 대기 (같은 우선순위는 도착 순서대로)"""
+        cost = min(cost, self.capacity)
+        started = time.monotonic()
+        with self.condition:
+            ticket = (priority, next(self.sequence))
+            heapq.heappush(self.waiting, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    # 남겨 둘 몫은 이번 호출 비용을 뺀 나머지에서 계산 (비용이 버킷 크기에 가까워도 언젠가 충족)
+                    needed = cost + (self.capacity - cost) * PRIORITY_RESERVE[priority]
+                    if self.waiting[0] == ticket and now >= self.paused_until and self.tokens >= needed:
+                        self.tokens -= cost
+                        break
+                    wait = max(self.paused_until - now, (needed - self.tokens) / self.rate, 0.01)
+                    self.condition.wait(wait)
+            finally:
+                self.waiting.remove(ticket)
+                heapq.heapify(self.waiting)
+                self.condition.notify_all()
+            self.stats['calls'] += cost
+            self.stats['waited_seconds'] += time.monotonic() - started
+
+    def throttled(self, retry_after=None):
+        """속도 제한 응답 반영: 호출 속도 절반, Retry-After가 있으면 그동안 일시 중지"""
+        with self.condition:
+            self.rate = max(self.rate / 2, MIN_RATE)
+            self.tokens = 0.0
+            self.stats['throttled'] += 1
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self.paused_until = max(self.paused_until, time.monotonic() + pause)
+        print(f"⏳ {self.name} API 속도 제한: {pause:.1f}초 대기 후 초당 {self.rate:.2f}회로 재개")
+
+    def succeeded(self):
+        """성공한 호출마다 기본 속도까지 조금씩 회복"""
+        with self.condition:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * RECOVERY_STEP)
+
+    def observe_headers(self, headers):
+        """GitHub 할당량 헤더(X-RateLimit-*, Retry-After)로 호출 속도 조정"""
+        retry_after = _header(headers, 'Retry-After')
+        if retry_after is not None:
+            self.throttled(retry_after)
+            return
+
+        remaining = _header(headers, 'X-RateLimit-Remaining')
+        reset = _header(headers, 'X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        seconds_left = max(reset - time.time(), 1.0)
+        with self.condition:
+            # 남은 예산을 초기화 시각까지 고르게 나눠 쓰도록 속도 조정
+            self.rate = min(self.base_rate, max(remaining / seconds_left, MIN_RATE))
+            if remaining <= 0:
+                self.paused_until = max(self.paused_until, time.monotonic() + seconds_left)
+        if remaining <= 0:
+            print(f"⏳ {self.name} API 할당량 소진: {seconds_left:.0f}초 후 초기화")
+
+    def execute(self, request, priority=NORMAL, cost=1, max_retries=MAX_RETRIES):
+        """
+        googleapiclient 요청(HttpRequest, BatchHttpRequest) 실행
+
+        Drive 속도 제한(429, 403 rateLimitExceeded)이면 속도를 줄여 재시도하고,
+        그 밖의 오류는 그대로 발생시킵니다.
+        """
+        for attempt in range(max_retries + 1):
+            self.acquire(priority, cost)
+            try:
+                response = request.execute()
+            except Exception as error:
+                if attempt < max_retries and is_drive_rate_limited(error):
+                    self.throttled(_header(getattr(error, 'resp', None), 'retry-after'))
+                    continue
+                raise
+            self.succeeded()
+            return response
+
+    def request(self, send, priority=NORMAL, max_retries=MAX_RETRIES):
+        """
+        HTTP 요청 함수(send → requests.Response) 실행
+
+        응답 헤더로 할당량을 갱신하고, 속도 제한 응답이면 대기 후 재시도합니다.
+        """
+        for attempt in range(max_retries + 1):
+            self.acquire(priority)
+            response = send()
+            self.observe_headers(response.headers)
+            if attempt < max_retries and is_github_rate_limited(response):
+                if 'Retry-After' not in response.headers:
+                    self.throttled()
+                continue
+            self.succeeded()
+            return response
+
+    def print_summary(self):
+        print(f"📊 {self.name} API 호출 {self.stats['calls']}회, 속도 제한 {self.stats['throttled']}회, "
+              f"대기 {self.stats['waited_seconds']:.1f}초 (현재 초당 {self.rate:.2f}회)")
+
+
+def is_drive_rate_limited(error):
+    """Drive 속도 제한 오류인지 판단 (HttpError 429 또는 403 rateLimitExceeded)"""
+    resp = getattr(error, 'resp', None)
+    status = getattr(resp, 'status', None)
+    if status == 429:
+        return True
+    return status == 403 and any(r in str(getattr(error, 'content', '')) for r in DRIVE_RATE_LIMIT_REASONS)
+
+
+def is_github_rate_limited(response):
+    """GitHub 1차/2차 속도 제한 응답인지 판단"""
+    if response.status_code == 429:
+        return True
+    if response.status_code != 403:
+        return False
+    return (response.headers.get('X-RateLimit-Remaining') == '0'
+            or 'Retry-After' in response.headers
+            or 'rate limit' in response.text.lower())
+
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(name):
+    """API 이름별 공유 스케줄러 (프로세스 내 모든 호출이 같은 버킷 사용)"""
+    with _schedulers_lock:
+        if name not in _schedulers:
+            rate, burst = DEFAULT_LIMITS.get(name, (5.0, 10))
+            _schedulers[name] = ApiScheduler(name, rate, burst)
+        return _schedulers[name]
+
+
+def call_counts():
+    """API 이름별 누적 호출 수 (이 프로세스에서 만든 스케줄러 기준)"""
+    with _schedulers_lock:
+        return {name: scheduler.stats['calls'] for name, scheduler in _schedulers.items()}
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대용량 릴리즈 아티팩트 입출력 (메모리 상한 보장)
+APK뿐 아니라 AAB, 난독화 매핑, --split-debug-info 심볼 압축 파일처럼 수백 MB~수 GB인 파일을
+고정 크기 창(window) 단위로 mmap하여 처리합니다.
+한 번에 하나의 창만 매핑하고, 다 쓴 창은 MADV_DONTNEED로 페이지를 돌려준 뒤 닫으므로
+파일 크기와 관계없이 상주 메모리(RSS)가 창 크기 정도로 유지됩니다.
+
+- 해시 계산: 매핑된 버퍼의 memoryview를 그대로 hashlib에 전달 (복사 없음)
+- 청크 업로드: read_range()로 필요한 구간만 매핑해 전달 (google_drive_uploader.MappedMediaUpload)
+- RSS 상한: 창을 바꿀 때마다 현재 RSS를 확인해 상한을 넘으면 MemoryError
+
+사용법:
+  python artifact_io.py build/app/outputs/bundle/release/app-release.aab
+  python artifact_io.py symbols.zip --window-mb 32 --rss-limit-mb 256
+"""
+
+import os
+import sys
+import mmap
+import time
+import hashlib
+import argparse
+
+DEFAULT_WINDOW_SIZE = 64 * 1024 * 1024
+DEFAULT_RSS_LIMIT = int(os.environ.get('ARTIFACT_RSS_LIMIT_MB', '512')) * 1024 * 1024
+HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def current_rss():
+    """현재 프로세스 RSS(바이트), 확인할 수 없으면 None"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def peak_rss():
+    """프로세스 최대 RSS(바이트), 확인할 수 없으면 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class MappedFile:
+    """창 단위로 mmap하는 읽기 전용 파일"""
+
+    def __init__(self, path, window_size=DEFAULT_WINDOW_SIZE, rss_limit=DEFAULT_RSS_LIMIT):
+        self.path = path
+        self.size = os.path.getsize(path)
+        # 창 크기는 mmap 오프셋 정렬 단위의 배수여야 함
+        granularity = mmap.ALLOCATIONGRANULARITY
+        self.window_size = max(granularity, window_size - window_size % granularity)
+        self.rss_limit = rss_limit
+        self._file = open(path, 'rb')
+        self._window = None
+        self._window_start = 0
+        self._window_end = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _release_window(self):
+        if self._window is None:
+            return
+        if hasattr(self._window, 'madvise') and hasattr(mmap, 'MADV_DONTNEED'):
+            # 닫기 전에 페이지를 즉시 반납 (페이지 캐시는 커널이 관리)
+            self._window.madvise(mmap.MADV_DONTNEED)
+        self._window.close()
+        self._window = None
+
+    def _check_rss(self):
+        if not self.rss_limit:
+            return
+        rss = current_rss()
+        if rss is not None and rss > self.rss_limit:
+            raise MemoryError(f"RSS {rss / 1024 / 1024:.0f}MB가 상한 "
+                              f"{self.rss_limit / 1024 / 1024:.0f}MB를 넘었습니다: {self.path}")
+
+    def _map(self, begin, end):
+        """[begin, end) 구간을 포함하는 창을 매핑하고 창 기준 오프셋 반환"""
+        if self._window is None or not (self._window_start <= begin and end <= self._window_end):
+            self._release_window()
+            self._check_rss()
+            start = begin - begin % mmap.ALLOCATIONGRANULARITY
+            length = min(max(self.window_size, end - start), self.size - start)
+            self._window = mmap.mmap(self._file.fileno(), length, offset=start, access=mmap.ACCESS_READ)
+            self._window_start = start
+            self._window_end = start + length
+        return begin - self._window_start
+
+    def read_range(self, begin, length):
+        """지정 구간을 bytes로 반환 (HTTP 클라이언트처럼 bytes가 필요한 곳에서 사용)"""
+        end = min(begin + length, self.size)
+        if begin >= end:
+            return b''
+        offset = self._map(begin, end)
+        return self._window[offset:offset + (end - begin)]
+
+    def iter_views(self, block_size=HASH_BLOCK_SIZE):
+        """
+        파일 전체를 memoryview 블록으로 순회 (복사 없음)
+
+        다음 블록으로 넘어가면 이전 블록의 memoryview는 해제되므로 보관하지 말아야 합니다.
+        """
+        position = 0
+        while position < self.size:
+            window_offset = self._map(position, min(position + block_size, self.size))
+            available = min(block_size, self._window_end - position)
+            view = memoryview(self._window)[window_offset:window_offset + available]
+            try:
+                yield view
+            finally:
+                view.release()
+            position += available
+
+    def close(self):
+        self._release_window()
+        self._file.close()
+
+
+def sha256_file(path, window_size=DEFAULT_WINDOW_SIZE, rss_limit=DEFAULT_RSS_LIMIT):
+    """매핑된 버퍼로 SHA-256 계산 (메모리 사용량은 창 크기로 제한)"""
+    digest = hashlib.sha256()
+    if os.path.getsize(path) == 0:
+        return digest.hexdigest()
+    with MappedFile(path, window_size, rss_limit) as mapped:
+        for view in mapped.iter_views():
+            digest.update(view)
+    return digest.hexdigest()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='대용량 아티팩트 해시 및 메모리 사용량 확인')
+    parser.add_argument('path', help='아티팩트 파일 경로')
+    parser.add_argument('--window-mb', type=int, default=DEFAULT_WINDOW_SIZE // 1024 // 1024)
+    parser.add_argument('--rss-limit-mb', type=int, default=DEFAULT_RSS_LIMIT // 1024 // 1024)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"❌ 파일을 찾을 수 없습니다: {args.path}")
+        return False
+
+    size = os.path.getsize(args.path)
+    started = time.monotonic()
+    try:
+        checksum = sha256_file(args.path, args.window_mb * 1024 * 1024, args.rss_limit_mb * 1024 * 1024)
+    except MemoryError as e:
+        print(f"❌ {e}")
+        return False
+    seconds = time.monotonic() - started
+
+    print(f"🔒 SHA-256: {checksum}")
+    print(f"📦 크기: {size / 1024 / 1024:.1f}MB, {seconds:.1f}초 "
+          f"({size / max(seconds, 1e-9) / 1024 / 1024:.0f}MB/s)")
+    peak = peak_rss()
+    if peak:
+        print(f"🧠 최대 RSS: {peak / 1024 / 1024:.1f}MB (상한 {args.rss_limit_mb}MB)")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 APK 아티팩트 저장소 (콘텐츠 주소 기반) 및 즉시 승격/롤백
+빌드한 APK를 SHA-256 기준으로 .deploy/artifacts에 보관하고
+커밋, 버전, 소스 해시와 함께 인덱스에 기록합니다.
+promote / rollback 명령은 Flutter 빌드 없이 저장된 APK를 바로 다시 배포합니다.
+(Google Drive 업로드 → version.json → README.md 링크 갱신)
+
+사용법:
+  python artifact_store.py list
+  python artifact_store.py store --version 2.2.31 --build 119
+  python artifact_store.py promote 2.2.30        # 버전 또는 SHA-256 접두어
+  python artifact_store.py rollback              # 직전에 배포된 아티팩트로 되돌리기
+"""
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import subprocess
+from datetime import datetime
+
+from artifact_io import sha256_file
+from release_lock import atomic_write_text, release_lock
+
+STORE_DIR = os.path.join('.deploy', 'artifacts')
+INDEX_PATH = os.path.join(STORE_DIR, 'index.json')
+APK_PATH = "build/app/outputs/flutter-apk/app-release.apk"
+# 소스 해시에 포함할 경로 (앱 빌드 결과에 영향을 주는 파일)
+SOURCE_PATHS = ['lib', 'android', 'assets', 'pubspec.yaml', 'pubspec.lock']
+
+
+def _git(*args):
+    result = subprocess.run(['git', *args], capture_output=True, text=True, encoding='utf-8')
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def compute_source_hash():
+    """빌드 입력 파일(추적 중인 파일의 작업 트리 내용) 해시"""
+    listing = _git('ls-files', '--', *SOURCE_PATHS) or ''
+    digest = hashlib.sha256()
+    for path in sorted(listing.splitlines()):
+        if os.path.isfile(path):
+            digest.update(path.encode('utf-8') + b'\0')
+            digest.update(sha256_file(path).encode('ascii'))
+    return digest.hexdigest()
+
+
+def load_index():
+    try:
+        with open(INDEX_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'artifacts': [], 'history': []}
+
+
+def save_index(index):
+    """인덱스 저장 (읽기→수정→저장은 'artifacts' 잠금 안에서)"""
+    os.makedirs(STORE_DIR, exist_ok=True)
+    atomic_write_text(INDEX_PATH, json.dumps(index, ensure_ascii=False, indent=2))
+
+
+def object_path(sha256):
+    return os.path.join(STORE_DIR, 'objects', sha256[:2], f'{sha256}.apk')
+
+
+def store_artifact(apk_path, version, build):
+    """APK를 저장소에 보관하고 인덱스 항목 반환 (같은 내용이면 중복 저장하지 않음)"""
+    if not os.path.exists(apk_path):
+        print(f"❌ APK 파일을 찾을 수 없습니다: {apk_path}")
+        return None
+
+    sha256 = sha256_file(apk_path)
+    target = object_path(sha256)
+    # 동시에 실행 중인 다른 배포와 인덱스 항목을 서로 덮어쓰지 않도록 잠금
+    with release_lock('artifacts'):
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(apk_path, f'{target}.tmp')
+            os.replace(f'{target}.tmp', target)
+
+        index = load_index()
+        entry = next((a for a in index['artifacts']
+                      if a['sha256'] == sha256 and a['version'] == version and a['build'] == build), None)
+        if entry is None:
+            entry = {
+                'sha256': sha256,
+                'version': version,
+                'build': build,
+                'commit': _git('rev-parse', 'HEAD'),
+                'source_hash': compute_source_hash(),
+                'size': os.path.getsize(target),
+                'stored_at': datetime.now().isoformat(timespec='seconds'),
+            }
+            index['artifacts'].append(entry)
+            save_index(index)
+
+    print(f"📦 아티팩트 보관: v{version}+{build} ({sha256[:12]}…)")
+    return entry
+
+
+def find_artifact(ref, index=None):
+    """버전(2.2.30, 2.2.30+118) 또는 SHA-256 접두어로 가장 최근 아티팩트 검색"""
+    index = index or load_index()
+    for entry in reversed(index['artifacts']):
+        if ref in (entry['version'], f"{entry['version']}+{entry['build']}"):
+            return entry
+        if len(ref) >= 8 and entry['sha256'].startswith(ref):
+            return entry
+    return None
+
+
+def record_publish(entry, link):
+    """배포 이력 기록 (rollback 기준)"""
+    with release_lock('artifacts'):
+        index = load_index()
+        index['history'].append({
+            'sha256': entry['sha256'],
+            'version': entry['version'],
+            'build': entry['build'],
+            'link': link,
+            'published_at': datetime.now().isoformat(timespec='seconds'),
+        })
+        save_index(index)
+
+
+def promote(entry):
+    """저장된 아티팩트를 빌드 없이 다시 배포 (Drive 업로드 → version.json → README.md)"""
+    from google_drive_uploader import GoogleDriveUploader, publish_apk
+    from update_version import create_version_json
+    from rollout import full_rollout_fields
+
+    path = object_path(entry['sha256'])
+    if not os.path.exists(path) or sha256_file(path) != entry['sha256']:
+        print(f"❌ 저장된 아티팩트가 없거나 손상되었습니다: {path}")
+        return False
+
+    print(f"🚀 v{entry['version']}+{entry['build']} 배포 ({entry['sha256'][:12]}…, 커밋 {str(entry['commit'])[:10]})")
+    uploader = GoogleDriveUploader()
+    result = publish_apk(path, entry['version'], uploader=uploader, publish_latest=True)
+    if not result:
+        print("❌ Google Drive 업로드 실패")
+        return False
+
+    # 롤백/재배포는 이미 검증된 빌드이므로 단계적 배포 없이 전체 설치본에 바로 안내
+    create_version_json(entry['version'], entry['build'], result['link'], rollout=full_rollout_fields(),
+                        apk_path=path, apk_sha256=entry['sha256'])
+    if not uploader.upload_version_json(folder_id=uploader.folder_id):
+        print("❌ version.json 업로드 실패")
+        return False
+
+    record_publish(entry, result['link'])
+    print(f"✅ 배포 완료: {result['link']}")
+    return True
+
+
+def previous_published(index=None):
+    """
+    현재 배포본이 처음 배포되기 직전에 배포된 (다른) 아티팩트
+
+    롤백도 이력에 기록되므로 바로 앞 항목을 고르면 rollback을 반복할 때 같은 두 아티팩트를 오가게 됩니다.
+    현재 아티팩트의 첫 배포 지점부터 거슬러 올라가야 rollback을 반복할수록 더 이전 배포본으로 돌아갑니다.
+    """
+    index = index or load_index()
+    history = index['history']
+    if not history:
+        return None
+    current = history[-1]['sha256']
+    first = next(i for i, item in enumerate(history) if item['sha256'] == current)
+    if first == 0:
+        return None
+    return find_artifact(history[first - 1]['sha256'], index)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='로컬 APK 아티팩트 저장소')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('list', help='저장된 아티팩트 목록')
+    store_parser = subparsers.add_parser('store', help='현재 APK 보관')
+    store_parser.add_argument('--apk', default=APK_PATH)
+    store_parser.add_argument('--version', required=True)
+    store_parser.add_argument('--build', type=int, required=True)
+    promote_parser = subparsers.add_parser('promote', help='저장된 아티팩트 배포')
+    promote_parser.add_argument('ref', help='버전(2.2.30 / 2.2.30+118) 또는 SHA-256 접두어')
+    subparsers.add_parser('rollback', help='직전 배포본으로 되돌리기')
+
+    args = parser.parse_args()
+    index = load_index()
+
+    if args.command == 'list':
+        current = index['history'][-1]['sha256'] if index['history'] else None
+        for entry in index['artifacts']:
+            marker = '👉' if entry['sha256'] == current else '  '
+            print(f"{marker} v{entry['version']}+{entry['build']}  {entry['sha256'][:12]}  "
+                  f"{entry['size'] / 1024 / 1024:.1f}MB  {entry['stored_at']}  {str(entry['commit'])[:10]}")
+        return True
+
+    if args.command == 'store':
+        return store_artifact(args.apk, args.version, args.build) is not None
+
+    if args.command == 'promote':
+        entry = find_artifact(args.ref, index)
+        if not entry:
+            print(f"❌ 아티팩트를 찾을 수 없습니다: {args.ref}")
+            return False
+        return promote(entry)
+
+    entry = previous_published(index)
+    if not entry:
+        print("❌ 되돌릴 이전 배포본이 없습니다.")
+        return False
+    print(f"⏪ 롤백 대상: v{entry['version']}+{entry['build']}")
+    return promote(entry)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+asyncio 기반 Google Drive 업로더
+GoogleDriveUploader와 같은 인터페이스(create_folder, upload_file, make_file_public,
+upload_apk_and_get_link)를 Drive REST API 위에서 비동기로 제공합니다.
+하나의 aiohttp 세션(공유 커넥션 풀)으로 메타데이터 호출, 권한 설정,
+여러 파일 업로드를 동시에 처리할 수 있습니다.
+
+사용법:
+  python async_drive_uploader.py [APK파일경로] --version 1.0.4
+  python async_drive_uploader.py app-release.apk app-debug.apk   # 여러 파일 동시 업로드
+"""
+
+import os
+import sys
+import asyncio
+import argparse
+
+try:
+    import aiohttp
+    from google.auth.transport.requests import Request
+except ImportError:
+    print("❌ 비동기 업로더에 필요한 라이브러리가 설치되지 않았습니다.")
+    print("📦 다음 명령어로 설치하세요:")
+    print("pip install aiohttp google-auth google-auth-oauthlib")
+    sys.exit(1)
+
+from google_drive_uploader import (GoogleDriveUploader, get_current_version, backoff_delay,
+                                   RETRYABLE_STATUS, MAX_CHUNK_RETRIES, STABLE_FILE_NAMES,
+                                   LATEST_APK_NAME)
+from upload_metrics import UploadMetrics, export_metrics
+from api_scheduler import CRITICAL, DRIVE_RATE_LIMIT_REASONS, MAX_RETRIES, get_scheduler
+
+DRIVE_API_URL = 'https://www.googleapis.com/drive/v3'
+DRIVE_UPLOAD_URL = 'https://www.googleapis.com/upload/drive/v3'
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+# 재개 가능 업로드 청크 크기 (256KB의 배수여야 함)
+CHUNK_SIZE = 8 * 1024 * 1024
+# 공유 커넥션 풀 최대 연결 수
+MAX_CONNECTIONS = 8
+
+
+class DriveApiError(Exception):
+    """Drive REST API 호출 실패"""
+
+    def __init__(self, status, message):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+
+class AsyncGoogleDriveUploader:
+    def __init__(self, credentials_path='credentials.json', token_path='token.json',
+                 max_connections=MAX_CONNECTIONS):
+        """
+        비동기 Google Drive 업로더 초기화
+
+        Args:
+            credentials_path (str): Google Cloud Console에서 다운로드한 credentials.json 파일 경로
+            token_path (str): 인증 토큰 저장 파일 경로
+            max_connections (int): 공유 커넥션 풀의 최대 연결 수
+        """
+        self.credentials_path = credentials_path
+        self.token_path = token_path
+        self.max_connections = max_connections
+        self.creds = None
+        self.session = None
+        self._refresh_lock = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """공유 커넥션 풀(aiohttp 세션) 생성"""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self.session = aiohttp.ClientSession(connector=connector)
+            self._refresh_lock = asyncio.Lock()
+
+    async def close(self):
+        """커넥션 풀 정리"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def authenticate(self):
+        """Google Drive API 인증 처리 (토큰 로드/갱신은 동기 업로더와 공유)"""
+        # OAuth 플로우와 토큰 파일 처리는 블로킹이므로 스레드에서 실행
+        loader = GoogleDriveUploader(self.credentials_path, self.token_path)
+        self.creds = await asyncio.to_thread(loader.load_credentials)
+        if not self.creds:
+            return False
+
+        await self.open()
+        print("✅ Google Drive API 인증 완료 (비동기)")
+        return True
+
+    async def _headers(self):
+        """만료된 토큰은 한 번만 갱신하고 Authorization 헤더 반환"""
+        async with self._refresh_lock:
+            if not self.creds.valid:
+                await asyncio.to_thread(self.creds.refresh, Request())
+        return {'Authorization': f'Bearer {self.creds.token}'}
+
+    async def _request(self, method, url, expected=(200,), **kwargs):
+        """Drive REST 호출 후 JSON 응답 반환 (동기 업로더와 같은 할당량 스케줄러 사용)"""
+        body, _ = await self._request_with_headers(method, url, expected, **kwargs)
+        return body
+
+    async def _request_with_headers(self, method, url, expected=(200,), **kwargs):
+        """
+        Drive REST 호출 후 (JSON 응답, 응답 헤더) 반환
+
+        속도 제한(429, 403 rateLimitExceeded)이면 스케줄러 속도를 줄여 재시도하고,
+        5xx 일시 오류면 백오프 후 재시도합니다.
+        """
+        headers = await self._headers()
+        headers.update(kwargs.pop('headers', {}))
+        scheduler = get_scheduler('drive')
+        for attempt in range(MAX_RETRIES + 1):
+            await asyncio.to_thread(scheduler.acquire, CRITICAL)
+            async with self.session.request(method, url, headers=headers, **kwargs) as resp:
+                if resp.status in expected:
+                    scheduler.succeeded()
+                    if resp.status == 204:
+                        return {}, resp.headers
+                    return await resp.json(content_type=None) or {}, resp.headers
+                text = await resp.text()
+            rate_limited = resp.status == 429 or (
+                resp.status == 403 and any(r in text for r in DRIVE_RATE_LIMIT_REASONS))
+            if attempt >= MAX_RETRIES or not (rate_limited or resp.status in RETRYABLE_STATUS):
+                raise DriveApiError(resp.status, text)
+            if rate_limited:
+                scheduler.throttled()
+            else:
+                delay = backoff_delay(attempt + 1)
+                print(f"⚠️ Drive API 일시 오류 (HTTP {resp.status}), {delay:.1f}초 후 재시도")
+                await asyncio.sleep(delay)
+
+    async def create_folder(self, folder_name, parent_id=None):
+        """Google Drive에 폴더 생성 (이미 존재하면 기존 폴더 사용)"""
+        try:
+            query = f"name='{folder_name}' and mimeType='{FOLDER_MIME_TYPE}'"
+            if parent_id:
+                query += f" and parents in '{parent_id}'"
+
+            results = await self._request('GET', f'{DRIVE_API_URL}/files',
+                                          params={'q': query, 'fields': 'files(id)'})
+            items = results.get('files', [])
+
+            if items:
+                folder_id = items[0]['id']
+                print(f"📁 기존 폴더 사용: {folder_name} (ID: {folder_id})")
+                return folder_id
+
+            folder_metadata = {'name': folder_name, 'mimeType': FOLDER_MIME_TYPE}
+            if parent_id:
+                folder_metadata['parents'] = [parent_id]
+
+            folder = await self._request('POST', f'{DRIVE_API_URL}/files',
+                                         params={'fields': 'id'}, json=folder_metadata)
+            folder_id = folder.get('id')
+            print(f"📁 새 폴더 생성: {folder_name} (ID: {folder_id})")
+            return folder_id
+
+        except (DriveApiError, aiohttp.ClientError) as error:
+            print(f"❌ 폴더 생성 실패: {error}")
+            return None
+
+    async def _find_file(self, file_name, folder_id=None):
+        """같은 이름의 파일 검색 (없으면 None)"""
+        query = f"name='{file_name}' and trashed=false"
+        if folder_id:
+            query += f" and parents in '{folder_id}'"
+        results = await self._request('GET', f'{DRIVE_API_URL}/files',
+                                      params={'q': query, 'fields': 'files(id, name)'})
+        items = results.get('files', [])
+        return items[0] if items else None
+
+    async def upload_file(self, file_path, folder_id=None, file_name=None, update_in_place=None):
+        """
+        파일을 Google Drive에 재개 가능(resumable) 방식으로 업로드
+
+        Args:
+            file_path (str): 업로드할 파일 경로
+            folder_id (str): 업로드할 폴더 ID (선택사항)
+            file_name (str): 업로드할 파일명 (선택사항)
+            update_in_place (bool): 같은 이름의 파일이 있으면 내용만 교체하여 파일 ID 유지
+                (기본: STABLE_FILE_NAMES만)
+
+        Returns:
+            str: 업로드된 파일 ID
+        """
+        try:
+            if not os.path.exists(file_path):
+                print(f"❌ 파일을 찾을 수 없습니다: {file_path}")
+                return None
+
+            file_name = file_name or os.path.basename(file_path)
+            if update_in_place is None:
+                update_in_place = file_name in STABLE_FILE_NAMES
+            file_size = os.path.getsize(file_path)
+            print(f"📤 업로드 시작: {file_name} ({file_size / 1024 / 1024:.1f}MB)")
+
+            existing_file = await self._find_file(file_name, folder_id)
+            if existing_file and update_in_place:
+                # 기존 파일 내용만 교체 (파일 ID, 공유 권한, 링크 유지)
+                print(f"🔄 기존 파일 내용 교체: {existing_file['name']} (ID: {existing_file['id']})")
+                method = 'PATCH'
+                upload_url = f"{DRIVE_UPLOAD_URL}/files/{existing_file['id']}"
+                file_metadata = {}
+            else:
+                if existing_file:
+                    print(f"🔄 기존 파일 발견: {existing_file['name']} (ID: {existing_file['id']})")
+                    await self._request('DELETE', f"{DRIVE_API_URL}/files/{existing_file['id']}",
+                                        expected=(204,))
+                    print("✅ 기존 파일 삭제 완료")
+
+                method = 'POST'
+                upload_url = f'{DRIVE_UPLOAD_URL}/files'
+                file_metadata = {'name': file_name}
+                if folder_id:
+                    file_metadata['parents'] = [folder_id]
+
+            # 업로드 세션 시작 (다른 호출과 같은 스케줄러/재시도 경로)
+            _, response_headers = await self._request_with_headers(
+                method, upload_url, params={'uploadType': 'resumable', 'fields': 'id'},
+                headers={'X-Upload-Content-Length': str(file_size)}, json=file_metadata)
+            session_url = response_headers['Location']
+
+            metrics = UploadMetrics(file_name, file_size, backend='async')
+            metrics.start()
+            response = None
+            try:
+                response = await self._upload_chunks(session_url, file_path, file_size,
+                                                     file_name, metrics)
+            finally:
+                metrics.finish(response is not None)
+                metrics.print_summary()
+                export_metrics()
+
+            file_id = response.get('id')
+            print(f"✅ 업로드 완료: {file_name} (ID: {file_id})")
+            return file_id
+
+        except (DriveApiError, aiohttp.ClientError) as error:
+            print(f"❌ 업로드 실패: {error}")
+            return None
+
+    async def _upload_chunks(self, session_url, file_path, file_size, file_name, metrics):
+        """업로드 세션 URL로 청크를 순서대로 전송하고 최종 응답 반환"""
+        offset = 0
+        attempt = 0
+        query_offset = False
+        with open(file_path, 'rb') as f:
+            while True:
+                # 재시도 직후에는 빈 PUT으로 서버에 커밋된 오프셋부터 조회
+                chunk = b'' if query_offset else await asyncio.to_thread(f.read, CHUNK_SIZE)
+                end = offset + len(chunk) - 1
+                headers = await self._headers()
+                if chunk:
+                    headers['Content-Range'] = f'bytes {offset}-{end}/{file_size}'
+                else:
+                    headers['Content-Range'] = f'bytes */{file_size}'
+
+                try:
+                    async with self.session.put(session_url, headers=headers, data=chunk) as resp:
+                        if resp.status in (200, 201):
+                            metrics.chunk_sent(file_size - offset)
+                            return await resp.json(content_type=None)
+                        if resp.status != 308:
+                            raise DriveApiError(resp.status, await resp.text())
+                        # 308 Resume Incomplete: 서버가 받은 마지막 바이트 위치로 이동
+                        committed = resp.headers.get('Range')
+                        new_offset = int(committed.split('-')[1]) + 1 if committed else 0
+                        metrics.chunk_sent(new_offset - offset)
+                        offset = new_offset
+                except (DriveApiError, aiohttp.ClientError, asyncio.TimeoutError) as error:
+                    retryable = not isinstance(error, DriveApiError) or error.status in RETRYABLE_STATUS
+                    if not retryable or attempt >= MAX_CHUNK_RETRIES:
+                        raise
+                    attempt += 1
+                    delay = backoff_delay(attempt)
+                    metrics.retry()
+                    print(f"⚠️ 청크 전송 실패 ({file_name}): {error}")
+                    print(f"🔁 {delay:.1f}초 후 재시도 "
+                          f"(청크 재시도 예산 {MAX_CHUNK_RETRIES - attempt}/{MAX_CHUNK_RETRIES} 남음)")
+                    await asyncio.sleep(delay)
+                    query_offset = True
+                    continue
+
+                if not query_offset:
+                    attempt = 0
+                query_offset = False
+                f.seek(offset)
+                print(f"📈 업로드 진행률 ({file_name}): {int(offset / file_size * 100)}%")
+
+    async def make_file_public(self, file_id):
+        """파일을 공개로 설정하고 공유 링크 생성"""
+        try:
+            file_info = await self._request('GET', f'{DRIVE_API_URL}/files/{file_id}',
+                                            params={'fields': 'webViewLink, permissions(type, role)'})
+            share_link = file_info.get('webViewLink')
+
+            # 내용만 교체한 파일은 이미 공개 상태이므로 권한 부여 생략
+            if any(p.get('type') == 'anyone' for p in file_info.get('permissions', [])):
+                print(f"🔗 기존 공유 링크 유지: {share_link}")
+                return share_link
+
+            await self._request('POST', f'{DRIVE_API_URL}/files/{file_id}/permissions',
+                                json={'role': 'reader', 'type': 'anyone'})
+
+            print(f"🔗 공유 링크 생성: {share_link}")
+            return share_link
+
+        except (DriveApiError, aiohttp.ClientError) as error:
+            print(f"❌ 공유 링크 생성 실패: {error}")
+            return None
+
+    async def upload_apk_and_get_link(self, apk_path, version=None, publish_latest=False):
+        """APK 파일 업로드 및 공유 링크 반환"""
+        links = await self.upload_apks_and_get_links([apk_path], version, publish_latest)
+        return links[0]
+
+    async def upload_apks_and_get_links(self, apk_paths, version=None, publish_latest=False):
+        """
+        여러 APK를 동시에 업로드하고 각 파일의 공유 링크 목록 반환
+
+        첫 번째 파일은 SecureMemo_v{version}.apk (버전이 없으면 SecureMemo_latest.apk)로,
+        나머지 파일은 원래 파일명으로 업로드됩니다.
+        publish_latest이면 첫 번째 파일로 SecureMemo_latest.apk도 제자리 교체합니다.
+        """
+        if not self.creds and not await self.authenticate():
+            return [None] * len(apk_paths)
+
+        folder_name = "SecureMemo_APK"
+        folder_id = await self.create_folder(folder_name)
+
+        if not folder_id:
+            print("❌ 폴더 생성 실패")
+            return [None] * len(apk_paths)
+
+        main_name = f"SecureMemo_v{version}.apk" if version else LATEST_APK_NAME
+        file_names = [main_name] + [os.path.basename(p) for p in apk_paths[1:]]
+
+        async def upload_one(path, name):
+            file_id = await self.upload_file(path, folder_id, name)
+            if not file_id:
+                return None
+            share_link = await self.make_file_public(file_id)
+            if share_link:
+                print("🎉 APK 업로드 완료!")
+                print(f"📱 APK 파일: {name}")
+                print(f"🔗 다운로드 링크: {share_link}")
+            return share_link
+
+        uploads = [upload_one(p, n) for p, n in zip(apk_paths, file_names)]
+        if publish_latest and version:
+            uploads.append(upload_one(apk_paths[0], LATEST_APK_NAME))
+        links = await asyncio.gather(*uploads)
+        if len(links) > len(apk_paths) and not links[-1]:
+            print(f"⚠️ {LATEST_APK_NAME} 갱신 실패 (버전별 링크는 정상 배포됨)")
+        return links[:len(apk_paths)]
+
+
+async def _upload_with_session(apk_paths, version, publish_latest=False):
+    async with AsyncGoogleDriveUploader() as uploader:
+        return await uploader.upload_apks_and_get_links(apk_paths, version, publish_latest)
+
+
+def upload_apk_and_get_link(apk_path, version=None, publish_latest=False):
+    """비동기 업로더를 사용하는 동기 래퍼 (GoogleDriveUploader.upload_apk_and_get_link 대체용)"""
+    return asyncio.run(_upload_with_session([apk_path], version, publish_latest))[0]
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Google Drive APK 비동기 업로더')
+    parser.add_argument('apk_paths', nargs='*',
+                        default=['build/app/outputs/flutter-apk/app-release.apk'],
+                        help='APK 파일 경로 (여러 개 지정 시 동시 업로드)')
+    parser.add_argument('--version', help='버전 번호 (선택사항)')
+    parser.add_argument('--latest', action='store_true',
+                        help='SecureMemo_latest.apk도 같은 파일 ID로 내용 교체')
+
+    args = parser.parse_args()
+
+    missing = [p for p in args.apk_paths if not os.path.exists(p)]
+    if missing:
+        for path in missing:
+            print(f"❌ APK 파일을 찾을 수 없습니다: {path}")
+        return False
+
+    version = args.version or get_current_version()
+
+    print("🚀 Google Drive APK 비동기 업로더 시작")
+    links = asyncio.run(_upload_with_session(args.apk_paths, version, args.latest))
+
+    if not all(links):
+        print("❌ 일부 APK 업로드 실패")
+        return False
+
+    print("\n🎉 모든 작업이 완료되었습니다!")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
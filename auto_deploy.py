@@ -17,13 +17,72 @@ import re
 import argparse
 import subprocess
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 
+import changelog_gen
+import artifact_store
+import gradle_cache
+import pub_cache
+import release_history
+import release_journal
+import release_profiler
+import upload_metrics
+from release_git import GitError, snapshot_file
+from release_lock import atomic_write_text, release_lock
+
 # 현재 디렉터리를 스크립트 파일 위치로 변경
 script_dir = os.path.dirname(os.path.abspath(__file__))
 os.chdir(script_dir)
 
+APK_PATH = "build/app/outputs/flutter-apk/app-release.apk"
+
+# 이번 배포에서 파이프라인이 수정한 파일과 그 시점 내용의 blob SHA (릴리즈 커밋에는 이 파일들만 포함)
+MUTATED_FILES = {}
+
+def record_mutation(*paths):
+    """
+    릴리즈 커밋에 포함할 파일 기록
+
+    파일을 쓴 잠금 안에서 호출하면 그 시점의 내용을 Git 객체로 저장해 두므로,
+    Git 단계 전에 동시 배포가 pubspec.yaml이나 CHANGELOG.md를 다시 고쳐도 이 배포의 내용이 커밋됩니다.
+    """
+    for path in paths:
+        try:
+            MUTATED_FILES[path] = snapshot_file(path)
+        except GitError:
+            # Git 저장소가 아니면 커밋 시점의 작업 트리 내용 사용
+            MUTATED_FILES[path] = None
+
+def restore_mutations(paths, snapshots):
+    """진행 기록에 저장된 파일 목록과 스냅숏 복원 (--resume)"""
+    for path in paths:
+        MUTATED_FILES[path] = snapshots.get(path)
+
+# 이전 릴리즈 태그 이후 커밋에서 만든 변경사항 (CHANGELOG와 릴리즈 본문에 재사용)
+_release_notes = None
+
+def get_release_notes(version):
+    """Git 히스토리에서 변경사항을 한 번만 생성하여 반환 (이번 릴리즈 태그 v<version>은 기준에서 제외)"""
+    global _release_notes
+    if _release_notes is None:
+        _release_notes = changelog_gen.build_release_notes(current_tag=f'v{version}')
+    return _release_notes
+
+def restore_release_notes(notes):
+    """진행 기록에 저장된 변경사항을 사용 (없으면 다음 호출 때 새로 계산)"""
+    global _release_notes
+    if notes is not None:
+        _release_notes = notes
+
+def reset_run_state():
+    """배포 한 번 단위의 기록 초기화 (배포 데몬처럼 한 프로세스에서 여러 번 배포할 때 이전 배포 내용이 섞이지 않도록)"""
+    global _release_notes
+    MUTATED_FILES.clear()
+    _release_notes = None
+    upload_metrics.reset()
+
 def run_command(command, check=True, capture_output=False):
     """명령어 실행 및 결과 반환"""
     try:
@@ -64,7 +123,17 @@ def get_current_version():
         return None, None
 
 def update_version(version_type):
-    """버전 업데이트"""
+    """
+    버전 업데이트 (원자적 버전/빌드 번호 할당)
+    
+    동시에 시작된 배포가 같은 빌드 번호를 받지 않도록 pubspec.yaml 읽기부터 쓰기까지
+    'version' 잠금 안에서 처리합니다.
+    """
+    with release_lock('version'):
+        return _bump_pubspec_version(version_type)
+
+def _bump_pubspec_version(version_type):
+    """pubspec.yaml 버전 증가 ('version' 잠금 안에서 호출)"""
     current_version, current_build = get_current_version()
     
     if not current_version:
@@ -111,8 +180,8 @@ def update_version(version_type):
         
         updated_content = content.replace(old_version_line, new_version_line)
         
-        with open('pubspec.yaml', 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        atomic_write_text('pubspec.yaml', updated_content)
+        record_mutation('pubspec.yaml')
         
         print("✅ pubspec.yaml 업데이트 완료")
         return new_version, new_build
@@ -122,7 +191,11 @@ def update_version(version_type):
         return None, None
 
 def update_changelog(version, build):
-    """CHANGELOG.md 업데이트"""
+    """CHANGELOG.md 업데이트 (동시 배포와 겹치지 않도록 'docs' 잠금 안에서 처리)"""
+    with release_lock('docs'):
+        _prepend_changelog_entry(version, build)
+
+def _prepend_changelog_entry(version, build):
     changelog_path = 'CHANGELOG.md'
     
     if not os.path.exists(changelog_path):
@@ -133,17 +206,10 @@ def update_changelog(version, build):
             changelog_content = f.read()
     
     # 새 버전 항목 추가
+    sections = changelog_gen.render_sections(get_release_notes(version))
     new_entry = f"""## v{version}+{build} ({datetime.now().strftime('%Y-%m-%d')})
 
-### 추가된 기능
-- [여기에 새로운 기능을 추가하세요]
-
-### 개선사항
-- [여기에 개선사항을 추가하세요]
-
-### 버그 수정
-- [여기에 버그 수정사항을 추가하세요]
-
+{sections}
 ---
 
 """
@@ -157,70 +223,121 @@ def update_changelog(version, build):
     else:
         updated_content = f"# 변경사항\n\n{new_entry}{changelog_content}"
     
-    with open(changelog_path, 'w', encoding='utf-8') as f:
-        f.write(updated_content)
+    atomic_write_text(changelog_path, updated_content)
+    record_mutation(changelog_path)
     
     print("✅ CHANGELOG.md 업데이트 완료")
 
-def flutter_build():
-    """Flutter APK 빌드"""
+def flutter_build(version=None, build=None, preflight=True):
+    """
+    Flutter APK 빌드
+    
+    version/build를 지정하면 pubspec.yaml 대신 할당받은 번호로 빌드하므로
+    그 사이 다른 배포가 pubspec.yaml을 바꿔도 영향을 받지 않습니다.
+    preflight가 True이면 flutter analyze/test를 빌드와 동시에 실행하고 실패 시 빌드를 중단합니다.
+    """
     print("🏗️ Flutter APK 빌드 시작...")
     
-    # 의존성 업데이트
-    if not run_command("flutter pub get"):
+    # 의존성 해석 (로컬 pub 미러 사용, pubspec.lock과 캐시가 그대로면 건너뜀)
+    if not pub_cache.ensure_dependencies():
         return False
     
-    # 릴리즈 APK 빌드
-    if not run_command("flutter build apk --release"):
+    # 릴리즈 APK 빌드 (의존성은 위에서 해석했으므로 --no-pub)
+    build_args = f" --build-name={version} --build-number={build}" if version and build else ""
+    build_command = f"flutter build apk --release --no-pub{build_args}"
+    # Android 쪽 컴파일 결과는 파이프라인 관리 Gradle 빌드 캐시로 재사용
+    with gradle_cache.build_cache(f"{version}+{build}" if version and build else None):
+        if preflight:
+            from preflight import run_with_checks
+            built = run_with_checks(build_command)
+        else:
+            built = run_command(build_command)
+    if not built:
         return False
     
     # 빌드 파일 확인
-    apk_path = "build/app/outputs/flutter-apk/app-release.apk"
-    if not os.path.exists(apk_path):
-        print(f"❌ APK 파일을 찾을 수 없습니다: {apk_path}")
+    if not os.path.exists(APK_PATH):
+        print(f"❌ APK 파일을 찾을 수 없습니다: {APK_PATH}")
         return False
     
     # 파일 크기 확인
-    file_size = os.path.getsize(apk_path)
+    file_size = os.path.getsize(APK_PATH)
     print(f"✅ APK 빌드 완료: {file_size / 1024 / 1024:.1f}MB")
     
     return True
 
-def upload_to_google_drive(version):
-    """Google Drive에 APK 업로드"""
-    print("☁️ Google Drive 업로드 시작...")
-    
-    # google_drive_uploader.py 스크립트 실행
-    upload_command = f"python google_drive_uploader.py --version {version}"
-    
-    if not run_command(upload_command):
-        print("❌ Google Drive 업로드 실패")
-        return False
-    
-    print("✅ Google Drive 업로드 완료")
-    return True
+def publish_release(version, targets=('drive',), uploader=None, apk_path=APK_PATH):
+    """
+    APK를 배포 저장소들에 동시에 업로드 (프로세스 내 호출)
+    
+    Args:
+        targets: 배포 대상 목록 (drive, local:경로, s3://버킷/접두어)
+        uploader (GoogleDriveUploader): drive 대상에 재사용할 인증된 업로더
+        apk_path (str): 배포할 APK 경로
+    
+    Returns:
+        dict: {배포 대상: 결과 dict}, 하나라도 실패하면 None
+    """
+    print(f"☁️ APK 배포 시작: {', '.join(targets)}")
+    
+    # 저장소별 라이브러리(Google API, boto3)는 업로드할 때만 필요하므로 여기서 임포트
+    from publishers import publish_all
+    
+    results = publish_all(list(targets), apk_path, version, uploader=uploader)
+    failed = [target for target, result in results.items() if not result]
+    if failed:
+        print(f"❌ 배포 실패: {', '.join(failed)}")
+        return None
+    
+    for result in results.values():
+        # README.md는 'docs' 잠금 안에서 찍어 둔 스냅숏을 사용 (없으면 커밋 시점의 작업 트리)
+        snapshots = result.get('snapshots', {})
+        for path in result.get('updated_files', []):
+            MUTATED_FILES[path] = snapshots.get(path)
+    drive = results.get('drive')
+    if drive:
+        print(f"✅ Google Drive 업로드 완료 ({drive['timings']['total']:.1f}초, SHA-256 {drive['sha256'][:12]}…)")
+    return results
 
 def git_commit_and_push(version, build):
-    """Git 커밋 및 푸시"""
+    """Git 커밋, 태그 및 푸시 (파이프라인이 수정한 파일만 커밋)"""
     print("📝 Git 커밋 및 푸시 시작...")
     
-    # 변경사항 추가
-    if not run_command("git add ."):
-        return False
+    from release_git import commit_tag_and_push, push_atomic, tag_commit
     
-    # 커밋
-    commit_message = f"🚀 Release v{version}+{build} - 자동 배포"
-    if not run_command(f'git commit -m "{commit_message}"'):
-        return False
+    tag_name = f"v{version}"
+    tagged = tag_commit(tag_name)
+    if tagged and tagged == run_command("git rev-parse HEAD", capture_output=True):
+        # 이전 시도에서 커밋과 태그는 만들었지만 push가 실패한 경우 (--resume)
+        print(f"🔁 {tag_name} 릴리즈 커밋이 이미 있어 push만 다시 시도합니다.")
+        try:
+            push_atomic('main', [tag_name])
+        except GitError as e:
+            print(f"❌ Git 명령 실행 실패: {e}")
+            return False
+        print("✅ Git 푸시 완료")
+        return True
+    
+    if not MUTATED_FILES:
+        print("⏭️ 변경된 파일이 없어 Git 커밋을 건너뜁니다.")
+        return True
     
-    # 푸시
-    if not run_command("git push origin main"):
+    commit_message = f"🚀 Release v{version}+{build} - 자동 배포"
+    if tagged:
+        # --current 재배포처럼 태그가 이미 이전 릴리즈 커밋을 가리키면 태그는 그대로 두고 문서 변경만 커밋
+        print(f"ℹ️ {tag_name} 태그가 이미 {tagged[:10]}에 있어 태그 없이 커밋합니다.")
+        tag_name = None
+    try:
+        commit_tag_and_push(sorted(MUTATED_FILES), commit_message,
+                            tag_name, f"Release v{version}+{build}", snapshots=MUTATED_FILES)
+    except GitError as e:
+        print(f"❌ Git 명령 실행 실패: {e}")
         return False
     
     print("✅ Git 커밋 및 푸시 완료")
     return True
 
-def create_github_release(version, build, google_drive_link=None):
+def create_github_release(version, build, google_drive_link=None, apk_path=APK_PATH):
     """GitHub 릴리즈 생성"""
     print("🏷️ GitHub 릴리즈 생성 시작...")
     
@@ -256,20 +373,17 @@ def create_github_release(version, build, google_drive_link=None):
 
 """
     
+    changes = changelog_gen.render_sections(get_release_notes(version))
+    apk_size = f"{os.path.getsize(apk_path) / 1024 / 1024:.1f}MB" if os.path.exists(apk_path) else "약 60MB"
+    
     release_notes = f"""## 🚀 v{version}+{build} 릴리즈
 
-{download_section}### ✨ **새로운 기능**
-- 🔍 **메모 검색 기능** - 카테고리명, 메모 제목, 내용 검색 지원
-- 🔄 **메모 정렬 옵션** - 생성일, 수정일, 제목, 내용별 정렬 (오름차순/내림차순)
-- 🎨 **다크/라이트 테마** - 시스템 설정 연동 또는 수동 선택
-- 📝 **폰트 크기 조정** - 4단계 폰트 크기 (작게/보통/크게/매우 크게)
-- 🏷️ **메모 태그 기능** - 태그 추가, 태그별 필터링, 태그 관리
-
+{download_section}{changes}
 ### 🔧 **기술 정보**
 - **버전**: v{version}+{build}
 - **빌드 날짜**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 - **최소 Android 버전**: Android 5.0 (API 21+)
-- **파일 크기**: 약 60MB
+- **파일 크기**: {apk_size}
 
 ### 📋 **설치 방법**
 1. 위 Google Drive 링크에서 APK 파일 다운로드
@@ -284,8 +398,12 @@ def create_github_release(version, build, google_drive_link=None):
 💡 **문제가 있으신가요?** [GitHub Issues](https://github.com/jiwoosoft/android-memo/issues)에 문의해주세요!
 """
     
-    # GitHub 릴리즈 생성
-    release_command = f'gh release create v{version} --title "v{version} - 자동 배포" --notes "{release_notes}"'
+    # GitHub 릴리즈 생성 (커밋 제목의 따옴표 등이 셸에서 깨지지 않도록 파일로 전달)
+    notes_path = os.path.join('.deploy', 'release_notes.md')
+    os.makedirs(os.path.dirname(notes_path), exist_ok=True)
+    with open(notes_path, 'w', encoding='utf-8') as f:
+        f.write(release_notes)
+    release_command = f'gh release create v{version} --title "v{version} - 자동 배포" --notes-file "{notes_path}"'
     
     if not run_command(release_command):
         print("❌ GitHub 릴리즈 생성 실패")
@@ -294,42 +412,85 @@ def create_github_release(version, build, google_drive_link=None):
     print("✅ GitHub 릴리즈 생성 완료")
     return True
 
-def main():
-    """메인 함수"""
-    parser = argparse.ArgumentParser(description='안전한 메모장 앱 자동 배포')
-    parser.add_argument('version_type', nargs='?', default='patch',
-                       choices=['major', 'minor', 'patch', 'current'],
-                       help='버전 업데이트 타입 (기본: patch)')
-    parser.add_argument('--current', action='store_true',
-                       help='현재 버전으로 재배포')
-    parser.add_argument('--no-upload', action='store_true',
-                       help='Google Drive 업로드 건너뛰기')
-    parser.add_argument('--no-git', action='store_true',
-                       help='Git 커밋/푸시 건너뛰기')
-    parser.add_argument('--no-release', action='store_true',
-                       help='GitHub 릴리즈 생성 건너뛰기')
-    
-    args = parser.parse_args()
+# 진행 기록에 남겨 --resume 때 그대로 다시 쓰는 run_pipeline 옵션
+JOURNAL_OPTIONS = ('upload', 'git', 'release', 'skip_build', 'drive_link', 'publish_targets', 'preflight')
+
+def run_pipeline(version_type, upload=True, git=True, release=True,
+                 skip_build=False, drive_link=None, uploader=None, publish_targets=None,
+                 preflight=True, resume=False, commit_files=()):
+    """
+    배포 파이프라인 실행 (버전 → 빌드 → 업로드 → Git → 릴리즈)
+    
+    Args:
+        version_type (str): major/minor/patch/current
+        uploader (GoogleDriveUploader): 인증된 업로더를 넘기면 프로세스 내에서 바로 업로드
+            (배포 데몬처럼 인증/클라이언트를 재사용하는 경우)
+        publish_targets (list): 배포 대상 목록 (기본: ['drive'])
+        preflight (bool): 빌드와 동시에 flutter analyze/test 실행
+        resume (bool): 가장 최근의 미완료 배포를 첫 번째 미완료 단계부터 이어서 진행
+            (처음 배포할 때의 옵션을 사용하며 나머지 옵션은 무시)
+        commit_files (list): 다른 프로세스(Fleet 모드의 이전 단계)에서 수정해 릴리즈 커밋에 포함할 파일
+    
+    버전이 정해진 뒤에는 성공/실패와 관계없이 단계별 지표를 릴리즈 성능 기록에 남깁니다.
+    (이번 실행에서 빌드하지 않은 재배포/재개는 기준선을 흐리므로 기록하지 않음)
+    """
+    reset_run_state()
+    recorder = release_history.ReleaseRecorder()
+    success = False
+    try:
+        success = _run_pipeline(recorder, version_type, upload, git, release, skip_build,
+                                drive_link, uploader, publish_targets, preflight, resume, commit_files)
+        return success
+    finally:
+        if recorder.version and 'build_seconds' in recorder.metrics:
+            recorder.finish(recorder.version, recorder.build, success)
+
+def _stored_apk(journal):
+    """진행 기록의 빌드 결과 APK 경로 (파일이 없거나 내용이 바뀌었으면 None)"""
+    from artifact_io import sha256_file
+    
+    outputs = journal.outputs('build')
+    apk_path = outputs.get('apk_path')
+    if not apk_path or not os.path.exists(apk_path):
+        return None
+    return apk_path if sha256_file(apk_path) == outputs.get('apk_sha256') else None
+
+def _run_pipeline(recorder, version_type, upload, git, release, skip_build,
+                  drive_link, uploader, publish_targets, preflight, resume, commit_files):
+    print("🚀 안전한 메모장 앱 자동 배포 시작")
+    record_mutation(*commit_files)
     
-    # 현재 버전 재배포인지 확인
-    if args.current:
-        version_type = 'current'
+    journal = None
+    if resume:
+        journal = release_journal.find_resumable()
+        if not journal:
+            print("❌ 이어서 진행할 미완료 배포가 없습니다.")
+            return False
+        print(f"⏯️ 미완료 배포 재개: {journal.describe()}")
+        version_type = journal.data['version_type']
+        upload, git, release, skip_build, drive_link, publish_targets, preflight = (
+            journal.options[key] for key in JOURNAL_OPTIONS)
+        # 이전 실행에서 수정한 파일도 릴리즈 커밋에 포함
+        restore_mutations(journal.data['mutated_files'], journal.data.get('snapshots', {}))
     else:
-        version_type = args.version_type
+        pending = release_journal.find_resumable()
+        if pending:
+            print(f"⚠️ 미완료 배포가 있습니다: {pending.describe()} (이어서 진행: --resume)")
+    options = {'upload': upload, 'git': git, 'release': release, 'skip_build': skip_build,
+               'drive_link': drive_link, 'publish_targets': publish_targets, 'preflight': preflight}
     
-    print("🚀 안전한 메모장 앱 자동 배포 시작")
     print(f"🏷️  버전 타입: {version_type}")
     print("=" * 50)
     
     # 1단계: 버전 업데이트
-    if version_type != 'current':
+    release_profiler.begin_stage('version')
+    if journal:
+        new_version, new_build = journal.version, journal.build
+    elif version_type != 'current':
         new_version, new_build = update_version(version_type)
         if not new_version:
             print("❌ 버전 업데이트 실패")
             return False
-        
-        # CHANGELOG.md 업데이트
-        update_changelog(new_version, new_build)
     else:
         # 현재 버전 정보 가져오기
         new_version, new_build = get_current_version()
@@ -337,59 +498,211 @@ def main():
             print("❌ 현재 버전을 찾을 수 없습니다.")
             return False
         print(f"🔄 현재 버전으로 재배포: {new_version}+{new_build}")
+    recorder.version, recorder.build = new_version, new_build
     
-    # 2단계: Flutter 빌드
-    if not flutter_build():
-        print("❌ Flutter 빌드 실패")
+    # 버전이 정해진 뒤부터 단계별 결과를 기록 (실패하면 --resume으로 재개)
+    if journal is None:
+        journal = release_journal.ReleaseJournal.create(new_version, new_build, version_type, options)
+    
+    def failed(stage, message):
+        print(message)
+        journal.fail(stage)
+        print(f"💡 문제를 해결한 뒤 이어서 진행: python auto_deploy.py --resume")
         return False
     
-    # 3단계: Google Drive 업로드
-    if not args.no_upload:
-        if not upload_to_google_drive(new_version):
-            print("❌ Google Drive 업로드 실패")
-            return False
+    if not journal.is_done('version'):
+        if version_type != 'current':
+            # CHANGELOG.md 업데이트
+            update_changelog(new_version, new_build)
+        journal.record_mutations(MUTATED_FILES)
+        # 변경사항은 태그를 만들기 전인 지금 한 번만 계산해 기록 (재개나 다른 프로세스의 릴리즈 단계에서 재사용)
+        journal.complete('version', version=f"{new_version}+{new_build}",
+                         notes=get_release_notes(new_version))
     else:
-        print("⏭️ Google Drive 업로드 건너뛰기")
+        restore_release_notes(journal.outputs('version').get('notes'))
+    
+    # 2단계: Flutter 빌드
+    release_profiler.begin_stage('build')
+    apk_path = None
+    if journal.is_done('build'):
+        apk_path = _stored_apk(journal)
+        if apk_path:
+            print(f"⏭️ 빌드 완료된 APK 사용: {apk_path}")
+        elif journal.is_done('publish'):
+            # 이미 배포된 APK를 다시 빌드하면 내용이 달라지므로 빌드하지 않음
+            print("⚠️ 빌드 결과를 찾을 수 없어 APK 정보 없이 진행합니다.")
+            apk_path = APK_PATH
+        else:
+            print("⚠️ 빌드 결과를 찾을 수 없거나 바뀌어 다시 빌드합니다.")
+            journal.invalidate('build')
+    
+    if not journal.is_done('build'):
+        # 같은 체크아웃의 build/ 디렉터리를 공유하므로 빌드와 보관까지 'build' 잠금 안에서 처리
+        with release_lock('build'):
+            if skip_build:
+                if not os.path.exists(APK_PATH):
+                    return failed('build', f"❌ APK 파일을 찾을 수 없습니다: {APK_PATH}")
+                print("⏭️ Flutter 빌드 건너뛰기 (기존 APK 사용)")
+            else:
+                build_started = time.monotonic()
+                built = flutter_build(new_version, new_build, preflight)
+                recorder.set(build_seconds=time.monotonic() - build_started)
+                if not built:
+                    return failed('build', "❌ Flutter 빌드 실패")
+            
+            # 빌드 결과를 로컬 아티팩트 저장소에 보관 (promote/rollback 용)
+            release_profiler.begin_stage('artifact')
+            try:
+                artifact = artifact_store.store_artifact(APK_PATH, new_version, new_build)
+            except OSError as e:
+                print(f"⚠️ 아티팩트 보관 실패: {e}")
+                artifact = None
+        
+            # 이후 단계는 보관본을 사용 (다른 배포가 build/를 다시 덮어써도 영향 없음)
+            if artifact:
+                apk_path, apk_sha256 = artifact_store.object_path(artifact['sha256']), artifact['sha256']
+            else:
+                from artifact_io import sha256_file
+                apk_path, apk_sha256 = APK_PATH, sha256_file(APK_PATH)
+        journal.complete('build', apk_path=apk_path, apk_sha256=apk_sha256, apk_size=os.path.getsize(apk_path))
+    if os.path.exists(apk_path):
+        recorder.set(apk_size=os.path.getsize(apk_path))
+    
+    # 3단계: APK 배포 (Google Drive 및 추가 저장소)
+    release_profiler.begin_stage('publish')
+    if journal.is_done('publish'):
+        drive_link = drive_link or journal.outputs('publish').get('drive_link')
+        print(f"⏭️ APK 배포 완료됨: {drive_link or '링크 없음'}")
+    elif upload:
+        publish_started = time.monotonic()
+        publish_results = publish_release(new_version, publish_targets or ['drive'], uploader, apk_path)
+        if not publish_results:
+            return failed('publish', "❌ APK 배포 실패")
+        # 업로드 처리량은 Drive 청크 지표 우선, 없으면 배포 단계 전체 시간 기준
+        drive_metrics = (publish_results.get('drive') or {}).get('upload_metrics')
+        if drive_metrics and drive_metrics.get('average_bytes_per_second'):
+            throughput = drive_metrics['average_bytes_per_second']
+        else:
+            throughput = os.path.getsize(apk_path) / max(time.monotonic() - publish_started, 1e-9)
+        recorder.set(upload_bytes_per_second=throughput)
+        # 릴리즈 링크는 Drive 링크 우선, Drive에 올리지 않았으면 첫 번째 저장소 링크 사용
+        primary = publish_results.get('drive') or next(iter(publish_results.values()))
+        drive_link = drive_link or primary['url']
+        artifact_entry = artifact_store.find_artifact(journal.outputs('build').get('apk_sha256', ''))
+        if artifact_entry:
+            artifact_store.record_publish(artifact_entry, primary['url'])
+        journal.record_mutations(MUTATED_FILES)
+        journal.complete('publish', drive_link=drive_link,
+                         links={target: result['url'] for target, result in publish_results.items()})
+    else:
+        print("⏭️ APK 배포 건너뛰기")
+        journal.complete('publish', skipped=True)
     
     # 4단계: Git 커밋 및 푸시
-    if not args.no_git:
+    release_profiler.begin_stage('git')
+    if journal.is_done('git'):
+        print(f"⏭️ Git 커밋/푸시 완료됨: {journal.outputs('git').get('commit', '건너뜀')}")
+    elif git:
         if not git_commit_and_push(new_version, new_build):
-            print("❌ Git 커밋/푸시 실패")
-            return False
+            return failed('git', "❌ Git 커밋/푸시 실패")
+        journal.complete('git', commit=run_command("git rev-parse HEAD", capture_output=True))
     else:
         print("⏭️ Git 커밋/푸시 건너뛰기")
+        journal.complete('git', skipped=True)
     
     # 5단계: GitHub 릴리즈 생성
-    if not args.no_release:
-        # Google Drive 링크 추출 (google_drive_uploader.py 실행 후 README.md에서 가져옴)
-        google_drive_link = None
+    release_profiler.begin_stage('release')
+    release_url = f"https://github.com/jiwoosoft/android-memo/releases/tag/v{new_version}"
+    if journal.is_done('release'):
+        print("⏭️ GitHub 릴리즈 생성 완료됨")
+    elif release:
+        # 이번 업로드 링크가 없으면 README.md에서 기존 링크 추출
+        google_drive_link = drive_link
         try:
-            with open('README.md', 'r', encoding='utf-8') as f:
-                readme_content = f.read()
-            
-            import re
-            pattern = r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)/[^)\s]*'
-            match = re.search(pattern, readme_content)
-            if match:
-                google_drive_link = match.group(0)
-                print(f"📋 README.md에서 Google Drive 링크 추출: {google_drive_link}")
+            if not google_drive_link:
+                with open('README.md', 'r', encoding='utf-8') as f:
+                    readme_content = f.read()
+                
+                import re
+                pattern = r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)/[^)\s]*'
+                match = re.search(pattern, readme_content)
+                if match:
+                    google_drive_link = match.group(0)
+                    print(f"📋 README.md에서 Google Drive 링크 추출: {google_drive_link}")
         except Exception as e:
             print(f"⚠️ README.md 읽기 실패: {e}")
         
-        if not create_github_release(new_version, new_build, google_drive_link):
-            print("❌ GitHub 릴리즈 생성 실패")
-            return False
+        if not create_github_release(new_version, new_build, google_drive_link, apk_path):
+            return failed('release', "❌ GitHub 릴리즈 생성 실패")
+        journal.complete('release', url=release_url)
     else:
         print("⏭️ GitHub 릴리즈 생성 건너뛰기")
+        journal.complete('release', skipped=True)
     
+    journal.finish()
     print("=" * 50)
     print("🎉 자동 배포 완료!")
     print(f"📱 새 버전: v{new_version}+{new_build}")
-    print(f"🔗 GitHub 릴리즈: https://github.com/jiwoosoft/android-memo/releases/tag/v{new_version}")
+    print(f"🔗 GitHub 릴리즈: {release_url}")
     print(f"📥 다운로드: README.md 참조")
     
     return True
 
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='안전한 메모장 앱 자동 배포')
+    parser.add_argument('version_type', nargs='?', default='patch',
+                       choices=['major', 'minor', 'patch', 'current'],
+                       help='버전 업데이트 타입 (기본: patch)')
+    parser.add_argument('--current', action='store_true',
+                       help='현재 버전으로 재배포')
+    parser.add_argument('--no-upload', action='store_true',
+                       help='Google Drive 업로드 건너뛰기')
+    parser.add_argument('--no-git', action='store_true',
+                       help='Git 커밋/푸시 건너뛰기')
+    parser.add_argument('--no-release', action='store_true',
+                       help='GitHub 릴리즈 생성 건너뛰기')
+    parser.add_argument('--skip-build', action='store_true',
+                       help='Flutter 빌드 건너뛰기 (이미 빌드된 APK 사용)')
+    parser.add_argument('--drive-link',
+                       help='GitHub 릴리즈에 사용할 Google Drive 링크 (지정 시 README.md에서 추출하지 않음)')
+    parser.add_argument('--publish', default='drive',
+                       help='배포 대상 (쉼표 구분, 예: drive,local:/srv/www/apk,s3://bucket/apk)')
+    parser.add_argument('--no-preflight', action='store_true',
+                       help='빌드와 동시에 실행하는 flutter analyze/test 건너뛰기')
+    parser.add_argument('--profile', action='store_true',
+                       help='cProfile/tracemalloc 프로파일 기록 (.deploy/profile)')
+    parser.add_argument('--resume', action='store_true',
+                       help='실패한 배포를 첫 번째 미완료 단계부터 이어서 진행 (.deploy/journal)')
+    parser.add_argument('--commit-files', nargs='+', default=[], metavar='PATH',
+                       help='이전 단계(별도 프로세스)에서 수정해 릴리즈 커밋에 포함할 파일 (Fleet 모드)')
+    
+    args = parser.parse_args()
+    
+    # 현재 버전 재배포인지 확인
+    if args.current:
+        version_type = 'current'
+    else:
+        version_type = args.version_type
+    
+    if args.profile:
+        release_profiler.start('auto_deploy')
+    try:
+        return run_pipeline(
+            version_type,
+            upload=not args.no_upload,
+            git=not args.no_git,
+            release=not args.no_release,
+            skip_build=args.skip_build,
+            drive_link=args.drive_link,
+            publish_targets=[t.strip() for t in args.publish.split(',') if t.strip()],
+            preflight=not args.no_preflight,
+            resume=args.resume,
+            commit_files=args.commit_files,
+        )
+    finally:
+        release_profiler.stop()
+
 if __name__ == '__main__':
     success = main()
     sys.exit(0 if success else 1) 
\ No newline at end of file
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git 히스토리 기반 변경사항 자동 생성
+이전 릴리즈 태그 이후의 커밋을 `git log`로 스트리밍하며 읽어 Conventional Commits 타입별로 묶고,
+CHANGELOG.md / README.md / GitHub 릴리즈 본문에 같은 결과를 재사용합니다.
+마지막으로 처리한 커밋을 캐시(.deploy/changelog_cache.json)에 저장하므로
+다음 실행에서는 그 이후 커밋만 읽습니다.
+
+사용법:
+  python changelog_gen.py            # 이전 태그 이후 변경사항 미리보기
+  python changelog_gen.py --since v2.2.30
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+from release_lock import atomic_write_text
+
+CACHE_PATH = os.path.join('.deploy', 'changelog_cache.json')
+
+# Conventional Commits 타입 → (섹션 제목, 표시 순서)
+SECTIONS = {
+    'feat': ('🆕 새로운 기능', 0),
+    'fix': ('🐛 버그 수정', 1),
+    'perf': ('⚡ 성능 개선', 2),
+    'refactor': ('🔧 개선사항', 3),
+    'style': ('🔧 개선사항', 3),
+    'docs': ('📝 문서', 4),
+}
+OTHER_SECTION = ('🧹 기타 변경사항', 5)
+
+COMMIT_PATTERN = re.compile(r'^(?P<type>\w+)(?:\((?P<scope>[^)]*)\))?(?P<breaking>!)?:\s*(?P<subject>.+)$')
+# 파이프라인이 만든 릴리즈 커밋은 변경사항에서 제외
+RELEASE_COMMIT_PATTERN = re.compile(r'Release v\d+\.\d+\.\d+')
+FIELD_SEP = '\x1f'
+
+
+def _git(*args):
+    result = subprocess.run(['git', *args], capture_output=True, text=True, encoding='utf-8')
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def find_previous_tag(current_tag=None):
+    """
+    HEAD에서 가장 가까운 릴리즈 태그 (없으면 None)
+
+    current_tag(이번 릴리즈 태그)는 제외합니다. 재개나 재배포처럼 HEAD가 이미 태그된 뒤에
+    다시 계산해도 `vNEW..HEAD`가 비지 않고 이전 릴리즈부터의 변경사항이 나오도록 합니다.
+    """
+    args = ['describe', '--tags', '--abbrev=0', '--match', 'v*']
+    if current_tag:
+        args += ['--exclude', current_tag]
+    return _git(*args)
+
+
+def parse_commit(sha, subject):
+    """커밋 제목을 {'sha', 'type', 'scope', 'subject', 'breaking'}으로 변환"""
+    match = COMMIT_PATTERN.match(subject)
+    if match:
+        return {
+            'sha': sha,
+            'type': match.group('type').lower(),
+            'scope': match.group('scope'),
+            'subject': match.group('subject').strip(),
+            'breaking': bool(match.group('breaking')),
+        }
+    return {'sha': sha, 'type': 'other', 'scope': None, 'subject': subject.strip(), 'breaking': False}
+
+
+def stream_commits(rev_range):
+    """git log 출력을 한 줄씩 읽으며 커밋을 생성 (최신 커밋부터)"""
+    command = ['git', 'log', '--no-merges', f'--format=%H{FIELD_SEP}%s', rev_range]
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                          text=True, encoding='utf-8') as process:
+        for line in process.stdout:
+            sha, _, subject = line.rstrip('\n').partition(FIELD_SEP)
+            if sha and not RELEASE_COMMIT_PATTERN.search(subject):
+                yield parse_commit(sha, subject)
+
+
+def _load_cache():
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    atomic_write_text(CACHE_PATH, json.dumps(cache, ensure_ascii=False, indent=2))
+
+
+def collect_commits(since_tag=None, current_tag=None):
+    """
+    이전 태그 이후 커밋 목록 반환 (최신 커밋부터)
+
+    같은 기준 태그로 이미 처리한 커밋은 캐시에서 가져오고, 마지막 처리 커밋 이후만 새로 읽습니다.
+    """
+    head = _git('rev-parse', 'HEAD')
+    if not head:
+        return []
+
+    base = since_tag or find_previous_tag(current_tag)
+    rev_range = f'{base}..HEAD' if base else 'HEAD'
+    cached = []
+
+    cache = _load_cache()
+    last = cache.get('last_commit')
+    if cache.get('base') == base and last:
+        if last == head:
+            return cache.get('commits', [])
+        # 캐시된 커밋이 여전히 HEAD의 조상일 때만 증분 처리 (rebase 등으로 바뀌었으면 다시 읽음)
+        is_ancestor = subprocess.run(['git', 'merge-base', '--is-ancestor', last, head],
+                                     capture_output=True).returncode == 0
+        if is_ancestor:
+            cached = cache.get('commits', [])
+            rev_range = f'{last}..HEAD'
+
+    commits = list(stream_commits(rev_range)) + cached
+    _save_cache({'base': base, 'last_commit': head, 'commits': commits})
+    return commits
+
+
+def group_commits(commits):
+    """커밋을 섹션별로 묶어 [(섹션 제목, [커밋...]), ...] 순서대로 반환"""
+    groups = {}
+    for commit in commits:
+        title, order = SECTIONS.get(commit['type'], OTHER_SECTION)
+        groups.setdefault((order, title), []).append(commit)
+    return [(title, items) for (order, title), items in sorted(groups.items())]
+
+
+def _format_commit(commit):
+    scope = f"**{commit['scope']}**: " if commit['scope'] else ''
+    breaking = '⚠️ ' if commit['breaking'] else ''
+    return f"- {breaking}{scope}{commit['subject']} ({commit['sha'][:7]})"
+
+
+def render_sections(groups, heading='###'):
+    """섹션별 마크다운 목록 생성 (변경사항이 없으면 안내 문구)"""
+    if not groups:
+        return f"{heading} 🔧 개선사항\n- 세부 변경사항 없음\n"
+    blocks = []
+    for title, commits in groups:
+        lines = [f"{heading} {title}"] + [_format_commit(c) for c in commits]
+        blocks.append('\n'.join(lines))
+    return '\n\n'.join(blocks) + '\n'
+
+
+def summary_line(groups, limit=3):
+    """README 다운로드 히스토리 등에 쓰는 한 줄 요약"""
+    subjects = [c['subject'] for _, commits in groups for c in commits]
+    if not subjects:
+        return ''
+    more = f" 외 {len(subjects) - limit}건" if len(subjects) > limit else ''
+    return ', '.join(subjects[:limit]) + more
+
+
+def build_release_notes(since_tag=None, current_tag=None):
+    """이전 태그 이후 변경사항을 섹션별로 묶은 결과 반환 (current_tag: 이번 릴리즈 태그, 기준에서 제외)"""
+    return group_commits(collect_commits(since_tag, current_tag))
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Git 히스토리 기반 변경사항 미리보기')
+    parser.add_argument('--since', help='기준 태그 (기본: HEAD에서 가장 가까운 v* 태그)')
+    args = parser.parse_args()
+
+    base = args.since or find_previous_tag()
+    print(f"🔍 기준 태그: {base or '(없음 - 전체 히스토리)'}")
+    groups = build_release_notes(args.since)
+    print(render_sections(groups))
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
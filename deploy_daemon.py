@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상주형 배포 데몬
+한 번 실행해 두면 Google 인증, Drive 클라이언트, APK 폴더 ID, Flutter/Gradle 데몬을
+따뜻하게 유지한 채 릴리즈 요청을 순서대로 처리합니다.
+요청은 로컬 소켓 또는 큐 디렉터리(.deploy/queue/*.json)로 받을 수 있습니다.
+큐 요청 파일은 처리가 끝나면 삭제하고, 실패한 요청은 .deploy/queue/failed/로 옮겨 둡니다.
+(결과는 .deploy/queue/results.jsonl에 기록)
+
+사용법:
+  python deploy_daemon.py serve                 # 데몬 실행 (127.0.0.1:8765, .deploy/queue 감시)
+  python deploy_daemon.py submit patch          # 실행 중인 데몬에 릴리즈 요청
+  python deploy_daemon.py submit --current --no-release
+
+큐 디렉터리 요청 파일 예시 (.deploy/queue/20250707-hotfix.json):
+  {"version_type": "patch", "upload": true, "git": true, "release": false}
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import socket
+import argparse
+import threading
+import subprocess
+import socketserver
+from datetime import datetime
+
+import auto_deploy
+from google_drive_uploader import GoogleDriveUploader
+
+DAEMON_HOST = '127.0.0.1'
+DAEMON_PORT = 8765
+QUEUE_DIR = os.path.join('.deploy', 'queue')
+QUEUE_POLL_SECONDS = 2.0
+
+# 요청에서 허용하는 run_pipeline 옵션
+REQUEST_OPTIONS = ('upload', 'git', 'release', 'skip_build', 'drive_link', 'publish_targets', 'preflight',
+                   'resume')
+
+
+def normalize_request(request):
+    """요청 JSON을 검증하고 run_pipeline 인자로 변환"""
+    version_type = request.get('version_type', 'patch')
+    if version_type not in ('major', 'minor', 'patch', 'current'):
+        raise ValueError(f"잘못된 버전 타입: {version_type}")
+    options = {key: request[key] for key in REQUEST_OPTIONS if key in request}
+    return version_type, options
+
+
+class DeployDaemon:
+    """릴리즈 요청을 받아 하나씩 순서대로 처리하는 상주 프로세스"""
+
+    def __init__(self, host=DAEMON_HOST, port=DAEMON_PORT, queue_dir=QUEUE_DIR):
+        self.host = host
+        self.port = port
+        self.queue_dir = queue_dir
+        self.requests = queue.Queue()
+        self.uploader = GoogleDriveUploader()
+        self.stopping = threading.Event()
+        self.processed = 0
+
+    def warm_up(self):
+        """인증, 폴더 조회, 빌드 도구 예열"""
+        print("🔥 배포 데몬 예열 시작...")
+        if not self.uploader.authenticate():
+            return False
+        self.uploader.folder_id = self.uploader.create_folder("SecureMemo_APK")
+
+        # Flutter 도구 스냅샷 로드 및 Gradle 데몬 기동 (이후 빌드는 데몬을 재사용)
+        auto_deploy.run_command("flutter --version", check=False)
+        gradlew = 'gradlew.bat' if os.name == 'nt' else 'gradlew'
+        if os.path.exists(os.path.join('android', gradlew)):
+            command = gradlew if os.name == 'nt' else f'./{gradlew}'
+            subprocess.run(f"{command} help -q", shell=True, cwd='android', check=False)
+        print("✅ 배포 데몬 예열 완료")
+        return True
+
+    def submit(self, request, source, claimed=None):
+        """요청을 처리 대기열에 추가하고 대기 순번 반환 (claimed: 처리 후 정리할 큐 요청 파일)"""
+        version_type, options = normalize_request(request)
+        self.requests.put((version_type, options, source, claimed))
+        position = self.requests.qsize()
+        print(f"📥 릴리즈 요청 접수 ({source}): {version_type} {options} → 대기 {position}번")
+        return position
+
+    def _serve_socket(self):
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline().decode('utf-8').strip()
+                try:
+                    position = daemon.submit(json.loads(line), f"socket {self.client_address[0]}")
+                    reply = {'accepted': True, 'position': position}
+                except (ValueError, json.JSONDecodeError) as e:
+                    reply = {'accepted': False, 'error': str(e)}
+                self.wfile.write((json.dumps(reply, ensure_ascii=False) + '\n').encode('utf-8'))
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        with socketserver.ThreadingTCPServer((self.host, self.port), Handler) as server:
+            server.timeout = 1.0
+            print(f"🔌 소켓 대기 중: {self.host}:{self.port}")
+            while not self.stopping.is_set():
+                server.handle_request()
+
+    def _watch_queue_dir(self):
+        """큐 디렉터리의 *.json 요청을 파일명 순서대로 접수"""
+        os.makedirs(self.queue_dir, exist_ok=True)
+        print(f"📂 큐 디렉터리 감시 중: {self.queue_dir}")
+        while not self.stopping.is_set():
+            self._claim_queue_files()
+            self.stopping.wait(QUEUE_POLL_SECONDS)
+
+    def _claim_queue_files(self):
+        for name in sorted(os.listdir(self.queue_dir)):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.queue_dir, name)
+            claimed = f"{path}.accepted"
+            try:
+                os.replace(path, claimed)
+            except OSError as e:
+                print(f"⚠️ 큐 요청 처리 실패 ({name}): {e}")
+                continue
+            try:
+                with open(claimed, 'r', encoding='utf-8') as f:
+                    self.submit(json.load(f), f"queue {name}", claimed)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 큐 요청 처리 실패 ({name}): {e}")
+                self._retire_claimed(claimed, False)
+
+    def _retire_claimed(self, claimed, success):
+        """처리가 끝난 큐 요청 파일 정리 (성공하면 삭제, 실패하면 다시 제출할 수 있도록 failed/로 이동)"""
+        if not claimed:
+            return
+        try:
+            if success:
+                os.remove(claimed)
+            else:
+                failed_dir = os.path.join(self.queue_dir, 'failed')
+                os.makedirs(failed_dir, exist_ok=True)
+                name = os.path.basename(claimed)[:-len('.accepted')]
+                os.replace(claimed, os.path.join(failed_dir, name))
+        except OSError as e:
+            print(f"⚠️ 큐 요청 파일 정리 실패 ({claimed}): {e}")
+
+    def _record_result(self, version_type, options, source, success, seconds):
+        os.makedirs(self.queue_dir, exist_ok=True)
+        result = {
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'source': source,
+            'version_type': version_type,
+            'options': options,
+            'success': success,
+            'seconds': round(seconds, 1),
+        }
+        with open(os.path.join(self.queue_dir, 'results.jsonl'), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(result, ensure_ascii=False) + '\n')
+
+    def _process(self, version_type, options, source, claimed=None):
+        """요청 하나를 실행하고 결과 기록"""
+        started = time.monotonic()
+        try:
+            success = auto_deploy.run_pipeline(version_type, uploader=self.uploader, **options)
+        except Exception as e:
+            print(f"❌ 배포 중 예외 발생: {e}")
+            success = False
+        seconds = time.monotonic() - started
+        self.processed += 1
+        self._record_result(version_type, options, source, success, seconds)
+        self._retire_claimed(claimed, success)
+        print(f"{'✅' if success else '❌'} 요청 처리 {'완료' if success else '실패'} "
+              f"({seconds:.1f}초, 누적 {self.processed}건)")
+        return success
+
+    def serve_forever(self):
+        """요청을 하나씩 순서대로 처리 (Ctrl+C로 종료)"""
+        for target in (self._serve_socket, self._watch_queue_dir):
+            threading.Thread(target=target, daemon=True).start()
+
+        print("🚀 배포 데몬 실행 중 (종료: Ctrl+C)")
+        try:
+            while True:
+                try:
+                    request = self.requests.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+                self._process(*request)
+        except KeyboardInterrupt:
+            print("\n👋 배포 데몬 종료")
+        finally:
+            self.stopping.set()
+
+
+def submit_to_daemon(request, host=DAEMON_HOST, port=DAEMON_PORT):
+    """실행 중인 데몬에 릴리즈 요청 전송"""
+    try:
+        with socket.create_connection((host, port), timeout=5) as conn:
+            conn.sendall((json.dumps(request) + '\n').encode('utf-8'))
+            reply = json.loads(conn.makefile('r', encoding='utf-8').readline())
+    except OSError as e:
+        print(f"❌ 배포 데몬에 연결할 수 없습니다: {e}")
+        print("💡 먼저 'python deploy_daemon.py serve'로 데몬을 실행하세요.")
+        return False
+
+    if not reply.get('accepted'):
+        print(f"❌ 요청 거부: {reply.get('error')}")
+        return False
+    print(f"✅ 릴리즈 요청 접수 완료 (대기 {reply['position']}번)")
+    return True
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='상주형 배포 데몬')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='데몬 실행')
+    serve_parser.add_argument('--host', default=DAEMON_HOST)
+    serve_parser.add_argument('--port', type=int, default=DAEMON_PORT)
+    serve_parser.add_argument('--queue-dir', default=QUEUE_DIR, help='감시할 큐 디렉터리')
+
+    submit_parser = subparsers.add_parser('submit', help='실행 중인 데몬에 릴리즈 요청')
+    submit_parser.add_argument('version_type', nargs='?', default='patch',
+                               choices=['major', 'minor', 'patch', 'current'])
+    submit_parser.add_argument('--current', action='store_true', help='현재 버전으로 재배포')
+    submit_parser.add_argument('--no-upload', action='store_true')
+    submit_parser.add_argument('--no-git', action='store_true')
+    submit_parser.add_argument('--no-release', action='store_true')
+    submit_parser.add_argument('--host', default=DAEMON_HOST)
+    submit_parser.add_argument('--port', type=int, default=DAEMON_PORT)
+
+    args = parser.parse_args()
+
+    if args.command == 'submit':
+        request = {
+            'version_type': 'current' if args.current else args.version_type,
+            'upload': not args.no_upload,
+            'git': not args.no_git,
+            'release': not args.no_release,
+        }
+        return submit_to_daemon(request, args.host, args.port)
+
+    daemon = DeployDaemon(args.host, args.port, args.queue_dir)
+    if not daemon.warm_up():
+        print("❌ 배포 데몬 예열 실패")
+        return False
+    daemon.serve_forever()
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 개발 루프 (업데이트/설치 흐름 테스트용)
+lib/, assets/, pubspec.yaml이 바뀌면 디버그 APK를 다시 빌드하고,
+같은 네트워크의 기기가 받을 수 있도록 최신 APK와 version.json을 로컬 HTTP 서버로 제공합니다.
+Drive 업로드나 실제 배포 없이 업데이트 확인 → 다운로드 → 검증 → 설치를 몇 초 만에 반복할 수 있습니다.
+
+- 디버그 빌드는 --dart-define=UPDATE_MANIFEST_URL로 이 서버의 version.json을 확인
+- 빌드마다 빌드 번호를 1씩 올려 기기에 설치된 이전 빌드가 업데이트를 감지
+- ETag(If-None-Match → 304)와 Range 요청(206) 지원
+- 디버그 빌드에서만 평문 HTTP 허용 (android/app/src/debug/res/xml/network_security_config.xml)
+
+사용법:
+  python dev_server.py                  # 변경 감시 + 자동 빌드 + 서버 (기본 포트 8780)
+  python dev_server.py --once           # 한 번만 빌드하고 서버만 실행
+  python dev_server.py --no-build       # 이미 빌드된 디버그 APK를 그대로 제공
+  python dev_server.py --url http://192.168.0.10:8780   # 기기에서 접속할 주소 직접 지정
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import socket
+import shutil
+import argparse
+import threading
+import subprocess
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import gradle_cache
+import pub_cache
+from artifact_io import sha256_file
+from release_lock import atomic_write_text
+
+DEV_DIR = os.path.join('.deploy', 'dev')
+STATE_PATH = os.path.join(DEV_DIR, 'state.json')
+DEBUG_APK_PATH = "build/app/outputs/flutter-apk/app-debug.apk"
+WATCH_PATHS = ['lib', 'assets', 'pubspec.yaml']
+DEFAULT_PORT = int(os.environ.get('DEV_SERVER_PORT', '8780'))
+POLL_SECONDS = 1.0
+# 저장이 연달아 일어나는 동안에는 기다렸다가 한 번만 빌드
+SETTLE_SECONDS = 0.5
+# 기기가 내려받는 중인 APK가 지워지지 않도록 직전 빌드 몇 개는 남겨 둠
+KEEP_APKS = 3
+
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def read_pubspec_version():
+    with open('pubspec.yaml', 'r', encoding='utf-8') as f:
+        match = re.search(r'^version:\s*(\d+\.\d+\.\d+)\+(\d+)', f.read(), re.MULTILINE)
+    return (match.group(1), int(match.group(2))) if match else (None, None)
+
+
+def load_state():
+    if not os.path.exists(STATE_PATH):
+        return {}
+    with open(STATE_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_state(state):
+    os.makedirs(DEV_DIR, exist_ok=True)
+    atomic_write_text(STATE_PATH, json.dumps(state, ensure_ascii=False, indent=2))
+
+
+def next_build_number(state):
+    """pubspec.yaml 빌드 번호와 마지막 개발 빌드 번호 중 큰 값 + 1 (서버를 다시 켜도 줄어들지 않음)"""
+    _, pubspec_build = read_pubspec_version()
+    return max(pubspec_build or 0, state.get('build', 0)) + 1
+
+
+def lan_address():
+    """기기에서 접속할 이 머신의 LAN 주소 (실제로 패킷을 보내지는 않음)"""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        try:
+            s.connect(('10.255.255.255', 1))
+            return s.getsockname()[0]
+        except OSError:
+            return '127.0.0.1'
+
+
+def snapshot(paths=WATCH_PATHS):
+    """감시 대상 파일의 수정 시각과 크기"""
+    files = {}
+    for root in paths:
+        if os.path.isfile(root):
+            stat = os.stat(root)
+            files[root] = (stat.st_mtime_ns, stat.st_size)
+            continue
+        for directory, _, names in os.walk(root):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+class DevRelease:
+    """서버가 제공하는 개발 빌드 하나"""
+
+    def __init__(self, path, version, build):
+        self.path = path
+        self.version = version
+        self.build = build
+        self.sha256 = sha256_file(path)
+        self.size = os.path.getsize(path)
+        self.built_at = datetime.now().isoformat(timespec='seconds')
+
+    @property
+    def etag(self):
+        return f'"{self.sha256}"'
+
+    def manifest(self, base_url):
+        """앱의 UpdateService가 읽는 version.json (단계적 배포 없음, 매번 확인)"""
+        apk_url = f'{base_url}/app.apk'
+        return {
+            'version': self.version,
+            'build': self.build,
+            'apk_url': apk_url,
+            'apk_download_url': apk_url,
+            'apk_sha256': self.sha256,
+            'apk_size': self.size,
+            'release_date': self.built_at[:10],
+            'description': f'{self.version}+{self.build} 개발 빌드 ({self.built_at})',
+            'min_check_interval_hours': 0,
+        }
+
+
+def publish_build(apk_path, version, build):
+    """빌드 결과를 .deploy/dev로 복사해 제공 (다음 빌드가 원본을 덮어써도 내려받는 중인 파일은 유지)"""
+    os.makedirs(DEV_DIR, exist_ok=True)
+    target = os.path.join(DEV_DIR, f'app-{build}.apk')
+    shutil.copyfile(apk_path, target)
+    old = sorted((name for name in os.listdir(DEV_DIR) if re.fullmatch(r'app-\d+\.apk', name)),
+                 key=lambda name: int(name[4:-4]))
+    for name in old[:-KEEP_APKS]:
+        os.remove(os.path.join(DEV_DIR, name))
+    return DevRelease(target, version, build)
+
+
+def build_debug_apk(version, build, manifest_url):
+    """디버그 APK 증분 빌드 (pub/Gradle 캐시 사용), 성공 여부 반환"""
+    if not pub_cache.ensure_dependencies():
+        print("❌ flutter pub get 실패")
+        return False
+    command = ['flutter', 'build', 'apk', '--debug', '--no-pub',
+               f'--build-name={version}', f'--build-number={build}',
+               f'--dart-define=UPDATE_MANIFEST_URL={manifest_url}']
+    started = time.monotonic()
+    try:
+        with gradle_cache.build_cache(f'dev {version}+{build}'):
+            result = subprocess.run(command, capture_output=True, text=True)
+    except FileNotFoundError:
+        print("❌ Flutter가 설치되지 않았거나 PATH에 없습니다.")
+        return False
+    if result.returncode != 0:
+        print(f"❌ 디버그 빌드 실패:\n{result.stderr[-2000:]}")
+        return False
+    print(f"✅ 디버그 빌드 완료: {version}+{build} ({time.monotonic() - started:.1f}초)")
+    return True
+
+
+class DevHandler(BaseHTTPRequestHandler):
+    """/version.json과 /app.apk 제공 (ETag, Range 지원)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._dispatch(send_body=True)
+
+    def do_HEAD(self):
+        self._dispatch(send_body=False)
+
+    def _dispatch(self, send_body):
+        release = self.server.release
+        path = self.path.split('?', 1)[0]
+        if path not in ('/version.json', '/app.apk'):
+            self.send_error(404)
+            return
+        if release is None:
+            self.send_error(503, 'No build yet')
+            return
+        if path == '/version.json':
+            self._send_manifest(release, send_body)
+        else:
+            self._send_apk(release, send_body)
+
+    def _not_modified(self, etag):
+        if etag not in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+            return False
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        return True
+
+    def _send_manifest(self, release, send_body):
+        body = json.dumps(release.manifest(self.server.base_url), ensure_ascii=False, indent=2).encode('utf-8')
+        etag = f'"{release.sha256[:16]}-{release.build}"'
+        if self._not_modified(etag):
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _requested_range(self, release):
+        """
+        Range 헤더 해석 (단일 범위만 지원, 여러 범위는 전체 응답)
+
+        Returns:
+            (start, end) 포함 범위, 범위 요청이 아니면 None, 만족할 수 없으면 False
+        """
+        header = self.headers.get('Range')
+        if not header:
+            return None
+        # If-Range가 현재 APK와 다르면 이어받기 대신 전체 파일을 보냄
+        if_range = self.headers.get('If-Range')
+        if if_range and if_range != release.etag:
+            return None
+        match = RANGE_PATTERN.match(header.strip())
+        if not match or match.groups() == ('', ''):
+            return None
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = min(int(last), release.size - 1) if last else release.size - 1
+            if last and int(last) < start:
+                return None
+        else:
+            start, end = max(release.size - int(last), 0), release.size - 1
+        if start >= release.size or release.size == 0:
+            return False
+        return start, end
+
+    def _send_apk(self, release, send_body):
+        if self._not_modified(release.etag):
+            return
+        requested = self._requested_range(release)
+        if requested is False:
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{release.size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        start, end = requested or (0, release.size - 1)
+        length = end - start + 1
+        self.send_response(206 if requested else 200)
+        self.send_header('Content-Type', 'application/vnd.android.package-archive')
+        self.send_header('Content-Length', str(length))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('ETag', release.etag)
+        if requested:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{release.size}')
+        self.end_headers()
+        if not send_body:
+            return
+        with open(release.path, 'rb') as f:
+            f.seek(start)
+            while length > 0:
+                block = f.read(min(1024 * 1024, length))
+                if not block:
+                    break
+                self.wfile.write(block)
+                length -= len(block)
+
+    def log_message(self, format, *args):
+        print(f"📲 {self.address_string()} {format % args}")
+
+
+def create_server(host, port, base_url):
+    server = ThreadingHTTPServer((host, port), DevHandler)
+    server.daemon_threads = True
+    server.base_url = base_url
+    server.release = None
+    return server
+
+
+def rebuild(server, state):
+    version, _ = read_pubspec_version()
+    build = next_build_number(state)
+    if not build_debug_apk(version, build, f'{server.base_url}/version.json'):
+        return False
+    if not os.path.exists(DEBUG_APK_PATH):
+        print(f"❌ APK 파일을 찾을 수 없습니다: {DEBUG_APK_PATH}")
+        return False
+    server.release = publish_build(DEBUG_APK_PATH, version, build)
+    state.update(build=build, version=version, apk=server.release.path)
+    save_state(state)
+    print(f"📦 제공 중: {server.base_url}/app.apk ({server.release.size / 1024 / 1024:.1f}MB, "
+          f"sha256 {server.release.sha256[:12]}…)")
+    return True
+
+
+def watch(server, state):
+    """변경 감시 루프 (Ctrl+C로 종료)"""
+    print(f"👀 변경 감시 중: {', '.join(WATCH_PATHS)}")
+    last = snapshot()
+    while True:
+        time.sleep(POLL_SECONDS)
+        current = snapshot()
+        if current == last:
+            continue
+        # 저장이 끝날 때까지 기다림
+        while True:
+            time.sleep(SETTLE_SECONDS)
+            settled = snapshot()
+            if settled == current:
+                break
+            current = settled
+        changed = sorted(set(current.items()) ^ set(last.items()))
+        names = sorted({path for path, _ in changed})
+        print(f"\n🔄 변경 감지: {', '.join(names[:5])}{' 외' if len(names) > 5 else ''}")
+        last = current
+        rebuild(server, state)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='로컬 개발 루프 (디버그 빌드 + 업데이트 서버)')
+    parser.add_argument('--host', default='0.0.0.0', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='포트')
+    parser.add_argument('--url', help='기기에서 접속할 서버 주소 (기본: 이 머신의 LAN 주소)')
+    parser.add_argument('--once', action='store_true', help='한 번만 빌드하고 변경 감시는 하지 않음')
+    parser.add_argument('--no-build', action='store_true', help='빌드 없이 기존 디버그 APK 제공')
+    args = parser.parse_args()
+
+    base_url = (args.url or f'http://{lan_address()}:{args.port}').rstrip('/')
+    try:
+        server = create_server(args.host, args.port, base_url)
+    except OSError as e:
+        print(f"❌ 서버 시작 실패: {e}")
+        return False
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"🌐 개발 업데이트 서버: {base_url}/version.json")
+
+    state = load_state()
+    try:
+        if args.no_build:
+            if not os.path.exists(DEBUG_APK_PATH):
+                print(f"❌ APK 파일을 찾을 수 없습니다: {DEBUG_APK_PATH}")
+                return False
+            # 이 APK에 박힌 빌드 번호는 알 수 없으므로 마지막 개발 빌드 번호로 안내
+            version, pubspec_build = read_pubspec_version()
+            server.release = publish_build(DEBUG_APK_PATH, version, state.get('build', pubspec_build))
+            print(f"📦 제공 중: {base_url}/app.apk")
+        elif not rebuild(server, state) and args.once:
+            return False
+
+        if args.once or args.no_build:
+            while True:
+                time.sleep(3600)
+        watch(server, state)
+    except KeyboardInterrupt:
+        print("\n🛑 개발 서버 종료")
+    finally:
+        server.shutdown()
+        server.server_close()
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Google Drive APK 보관 정책 (오래된 APK 정리) 스크립트
+SecureMemo_APK 폴더에 쌓이는 SecureMemo_v{버전}.apk 중
+"최근 N개 + 각 메이저 버전의 마지막 릴리즈"만 남기고 나머지를 삭제합니다.
+README.md, releases/README.md, version.json, 최근 릴리즈 노트(CHANGELOG.md)에서
+참조 중인 파일은 절대 삭제하지 않습니다.
+
+사용법:
+  python drive_retention.py                # 삭제 대상 미리보기 (dry-run)
+  python drive_retention.py --keep 10      # 최근 10개 유지
+  python drive_retention.py --apply        # 실제 삭제 (확인 후)
+  python drive_retention.py --apply --yes  # 확인 없이 삭제
+"""
+
+import os
+import re
+import sys
+import argparse
+
+from api_scheduler import MAX_RETRIES, NORMAL, get_scheduler, is_drive_rate_limited
+
+APK_FOLDER_NAME = "SecureMemo_APK"
+APK_NAME_PATTERN = re.compile(r'^SecureMemo_v(\d+)\.(\d+)\.(\d+)\.apk$')
+# Drive 파일 ID 참조 패턴 (/file/d/<id>/ 또는 ?id=<id>)
+DRIVE_ID_PATTERN = re.compile(r'(?:/file/d/|[?&]id=)([a-zA-Z0-9_-]{10,})')
+APK_REFERENCE_PATTERN = re.compile(r'SecureMemo_v\d+\.\d+\.\d+\.apk')
+
+# 참조 검사 대상 문서
+REFERENCE_FILES = ['README.md', 'releases/README.md', 'version.json']
+# 보호할 최근 릴리즈 노트 수 (CHANGELOG.md 상단 기준)
+RECENT_RELEASE_NOTES = 5
+# Drive 배치 요청 최대 크기
+BATCH_SIZE = 100
+
+
+def list_apk_files(service, folder_id):
+    """폴더의 APK 목록을 최소 필드만 요청하며 페이지 단위로 조회"""
+    query = f"'{folder_id}' in parents and trashed=false and name contains 'SecureMemo_v'"
+    page_token = None
+    files = []
+
+    while True:
+        results = get_scheduler('drive').execute(service.files().list(
+            q=query,
+            fields='nextPageToken, files(id, name, size)',
+            pageSize=1000,
+            pageToken=page_token
+        ), NORMAL)
+        files.extend(results.get('files', []))
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            break
+
+    apks = []
+    for item in files:
+        match = APK_NAME_PATTERN.match(item['name'])
+        if match:
+            item['version'] = tuple(map(int, match.groups()))
+            item['size'] = int(item.get('size', 0))
+            apks.append(item)
+    return apks
+
+
+def collect_protected_references():
+    """문서에서 참조 중인 Drive 파일 ID와 APK 파일명 수집"""
+    texts = []
+    for path in REFERENCE_FILES:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                texts.append(f.read())
+
+    if os.path.exists('CHANGELOG.md'):
+        with open('CHANGELOG.md', 'r', encoding='utf-8') as f:
+            changelog = f.read()
+        # '## ' 로 시작하는 릴리즈 섹션 중 최근 항목만 보호
+        sections = re.split(r'\n(?=## )', changelog)
+        release_sections = [s for s in sections if s.lstrip().startswith('## ')]
+        texts.extend(release_sections[:RECENT_RELEASE_NOTES])
+
+    content = '\n'.join(texts)
+    protected_ids = set(DRIVE_ID_PATTERN.findall(content))
+    protected_names = set(APK_REFERENCE_PATTERN.findall(content))
+    return protected_ids, protected_names
+
+
+def select_deletions(apks, keep_last, protected_ids, protected_names):
+    """보관 정책 적용: (삭제 대상, 유지 대상) 반환"""
+    ordered = sorted(apks, key=lambda f: f['version'], reverse=True)
+    keep_ids = {f['id'] for f in ordered[:keep_last]}
+
+    # 각 메이저 버전의 마지막 릴리즈 유지
+    latest_per_major = {}
+    for item in ordered:
+        latest_per_major.setdefault(item['version'][0], item)
+    keep_ids.update(f['id'] for f in latest_per_major.values())
+
+    keep_ids.update(f['id'] for f in ordered if f['id'] in protected_ids)
+    keep_ids.update(f['id'] for f in ordered if f['name'] in protected_names)
+
+    deletions = [f for f in ordered if f['id'] not in keep_ids]
+    kept = [f for f in ordered if f['id'] in keep_ids]
+    return deletions, kept
+
+
+def delete_files_batched(service, files, max_retries=MAX_RETRIES):
+    """
+    배치 요청으로 파일 삭제, (삭제 성공, 삭제 실패) 목록 반환
+
+    스케줄러는 배치 속도만 조절하고 배치를 다시 실행하지 않습니다.
+    (같은 배치를 재실행하면 이미 삭제된 항목의 콜백이 다시 호출됨)
+    배치 안에서 속도 제한(429, 403 rateLimitExceeded)에 걸린 항목만 모아 새 배치로 재시도합니다.
+    """
+    deleted = []
+    failed = []
+    pending = {}
+    retry = []
+
+    def callback(request_id, response, exception):
+        item = pending.pop(request_id)
+        if exception and is_drive_rate_limited(exception):
+            retry.append(item)
+        elif exception:
+            failed.append(item)
+            print(f"❌ 삭제 실패: {item['name']} ({exception})")
+        else:
+            deleted.append(item)
+            print(f"🗑️ 삭제 완료: {item['name']}")
+
+    scheduler = get_scheduler('drive')
+    # 배치 안의 요청도 각각 할당량에 포함되므로 요청 수만큼 토큰을 쓰고,
+    # 한 배치의 비용이 버킷 크기를 넘지 않도록 배치 크기를 버킷 크기로 제한
+    batch_size = max(1, min(BATCH_SIZE, scheduler.capacity))
+    queue = list(files)
+    for attempt in range(max_retries + 1):
+        for start in range(0, len(queue), batch_size):
+            pending.clear()
+            batch = service.new_batch_http_request(callback=callback)
+            for item in queue[start:start + batch_size]:
+                pending[item['id']] = item
+                batch.add(service.files().delete(fileId=item['id']), request_id=item['id'])
+            throttled_before = len(retry)
+            scheduler.acquire(NORMAL, cost=len(pending))
+            try:
+                batch.execute()
+            except Exception as error:
+                if not is_drive_rate_limited(error):
+                    raise
+                # 배치 요청 자체가 제한됨 → 콜백을 받지 못한 항목만 다시 시도
+                retry.extend(pending.values())
+            if len(retry) > throttled_before:
+                scheduler.throttled()
+            else:
+                scheduler.succeeded()
+
+        if not retry:
+            break
+        queue, retry = retry, []
+        if attempt == max_retries:
+            for item in queue:
+                failed.append(item)
+                print(f"❌ 삭제 실패: {item['name']} (속도 제한 재시도 {max_retries}회 초과)")
+            break
+        print(f"🔁 속도 제한으로 삭제하지 못한 {len(queue)}개를 새 배치로 재시도합니다.")
+
+    return deleted, failed
+
+
+def format_size(size):
+    return f"{size / 1024 / 1024:.1f}MB"
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Google Drive APK 보관 정책 적용')
+    parser.add_argument('--keep', type=int, default=5,
+                       help='유지할 최근 버전 수 (기본: 5)')
+    parser.add_argument('--apply', action='store_true',
+                       help='실제로 삭제 (지정하지 않으면 미리보기만)')
+    parser.add_argument('--yes', action='store_true',
+                       help='삭제 전 확인 생략')
+
+    args = parser.parse_args()
+
+    from google_drive_uploader import GoogleDriveUploader
+    from googleapiclient.errors import HttpError
+
+    uploader = GoogleDriveUploader()
+    if not uploader.authenticate():
+        return False
+    service = uploader.service
+
+    try:
+        query = (f"name='{APK_FOLDER_NAME}' and mimeType='application/vnd.google-apps.folder'"
+                 " and trashed=false")
+        folders = get_scheduler('drive').execute(
+            service.files().list(q=query, fields='files(id)'), NORMAL).get('files', [])
+        if not folders:
+            print(f"⚠️ {APK_FOLDER_NAME} 폴더가 없습니다. 정리할 파일이 없습니다.")
+            return True
+        folder_id = folders[0]['id']
+
+        apks = list_apk_files(service, folder_id)
+        print(f"📁 {APK_FOLDER_NAME}: APK {len(apks)}개 "
+              f"({format_size(sum(f['size'] for f in apks))})")
+
+        protected_ids, protected_names = collect_protected_references()
+        deletions, kept = select_deletions(apks, args.keep, protected_ids, protected_names)
+
+        print(f"✅ 유지: {len(kept)}개")
+        for item in kept:
+            print(f"   📱 {item['name']}")
+
+        if not deletions:
+            print("🎉 삭제할 APK가 없습니다.")
+            return True
+
+        reclaim = sum(f['size'] for f in deletions)
+        print(f"🗑️ 삭제 대상: {len(deletions)}개 ({format_size(reclaim)})")
+        for item in deletions:
+            print(f"   📱 {item['name']} ({format_size(item['size'])})")
+
+        if not args.apply:
+            print("💡 미리보기 모드입니다. 실제로 삭제하려면 --apply 옵션을 사용하세요.")
+            return True
+
+        if not args.yes:
+            confirm = input(f"{len(deletions)}개 파일을 삭제하시겠습니까? (y/N): ").strip().lower()
+            if confirm != 'y':
+                print("🚫 삭제가 취소되었습니다.")
+                return True
+
+        deleted, failed = delete_files_batched(service, deletions)
+        reclaimed = sum(f['size'] for f in deleted)
+        print(f"\n📊 정리 결과: {len(deleted)}개 삭제, {len(failed)}개 실패")
+        print(f"💾 확보된 저장 공간: {format_size(reclaimed)}")
+        return not failed
+
+    except HttpError as error:
+        print(f"❌ Drive 정리 실패: {error}")
+        return False
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 앱/플레이버 일괄 배포 (Fleet 모드)
+매니페스트에 나열된 프로젝트들의 배포 파이프라인을 제한된 작업자 풀에서 동시에 실행합니다.
+Google Drive 인증과 APK 폴더 조회는 한 번만 수행하여 모든 프로젝트가 공유하고,
+Gradle 데몬도 같은 사용자 환경에서 재사용됩니다.
+
+사용법:
+  python fleet_deploy.py fleet.json
+  python fleet_deploy.py fleet.json --workers 2 --no-release
+
+매니페스트 예시 (fleet.json):
+  {
+    "workers": 3,
+    "projects": [
+      {"name": "secure_memo", "path": ".", "version_type": "patch",
+       "drive_prefix": "SecureMemo"},
+      {"name": "secure_memo_pro", "path": "../android-memo-pro", "version_type": "current",
+       "drive_prefix": "SecureMemoPro", "release": false}
+    ]
+  }
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import threading
+import subprocess
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from google_drive_uploader import GoogleDriveUploader, update_readme_download_link
+from release_journal import JOURNAL_DIR, load_journals
+
+APK_RELATIVE_PATH = os.path.join('build', 'app', 'outputs', 'flutter-apk', 'app-release.apk')
+APK_FOLDER_NAME = "SecureMemo_APK"
+FLEET_LOG_ROOT = os.path.join('.deploy', 'fleet')
+
+
+class _ThreadRoutedStream:
+    """작업자 스레드별로 출력을 프로젝트 로그 파일로 보내는 stdout 대체 스트림"""
+
+    def __init__(self, original):
+        self.original = original
+        self.local = threading.local()
+
+    def write(self, text):
+        target = getattr(self.local, 'log', None)
+        (target or self.original).write(text)
+
+    def flush(self):
+        target = getattr(self.local, 'log', None)
+        (target or self.original).flush()
+
+
+class SharedDriveClient:
+    """프로젝트 간에 공유하는 Google Drive 클라이언트 (인증/폴더 조회 1회)"""
+
+    def __init__(self):
+        self.uploader = GoogleDriveUploader()
+        # googleapiclient/httplib2 연결은 스레드 안전하지 않으므로 호출을 직렬화
+        self.lock = threading.Lock()
+        self.folder_id = None
+
+    def connect(self):
+        if not self.uploader.authenticate():
+            return False
+        self.folder_id = self.uploader.create_folder(APK_FOLDER_NAME)
+        return self.folder_id is not None
+
+    def publish(self, apk_path, file_name):
+        with self.lock:
+            file_id = self.uploader.upload_file(apk_path, self.folder_id, file_name)
+            if not file_id:
+                return None
+            return self.uploader.make_file_public(file_id)
+
+
+class ProjectRun:
+    """프로젝트 한 개의 배포 실행 상태와 단계별 추적 기록"""
+
+    def __init__(self, spec, log_dir):
+        self.name = spec['name']
+        self.path = os.path.abspath(spec.get('path', '.'))
+        self.version_type = spec.get('version_type', 'patch')
+        self.drive_prefix = spec.get('drive_prefix', 'SecureMemo')
+        self.upload = spec.get('upload', True)
+        self.release = spec.get('release', True)
+        self.git = spec.get('git', True)
+        self.log_path = os.path.join(log_dir, f'{self.name}.log')
+        self.trace_path = os.path.join(log_dir, f'{self.name}.trace.json')
+        self.log_file = None
+        self.trace = []
+        self.version = None
+        self.link = None
+        self.mutated_files = set()
+        self.success = False
+        self.error = None
+
+    @property
+    def total_seconds(self):
+        return sum(stage['seconds'] for stage in self.trace)
+
+    def stage(self, name, func):
+        """단계 실행 후 소요 시간 기록, 실패 시 예외 대신 False 반환"""
+        started = time.monotonic()
+        started_at = datetime.now().isoformat(timespec='seconds')
+        print(f"\n▶️ [{self.name}] {name} 단계 시작")
+        try:
+            ok = bool(func())
+        except Exception as e:
+            print(f"❌ [{self.name}] {name} 단계 오류: {e}")
+            ok = False
+        seconds = time.monotonic() - started
+        self.trace.append({'stage': name, 'started_at': started_at,
+                           'seconds': round(seconds, 3), 'success': ok})
+        print(f"{'✅' if ok else '❌'} [{self.name}] {name} 단계 {'완료' if ok else '실패'} ({seconds:.1f}초)")
+        if not ok:
+            self.error = f'{name} 단계 실패'
+        return ok
+
+    def run_script(self, *args):
+        """프로젝트 체크아웃의 auto_deploy.py 실행 (출력은 프로젝트 로그로)"""
+        command = [sys.executable, 'auto_deploy.py', *args]
+        print(f"🔧 실행 ({self.path}): {' '.join(command)}")
+        self.log_file.flush()
+        result = subprocess.run(command, cwd=self.path, stdout=self.log_file,
+                                stderr=subprocess.STDOUT)
+        return result.returncode == 0
+
+    def read_version(self):
+        with open(os.path.join(self.path, 'pubspec.yaml'), 'r', encoding='utf-8') as f:
+            match = re.search(r'version:\s*([\d.]+)', f.read())
+        self.version = match.group(1) if match else None
+        return self.version is not None
+
+    def read_mutated_files(self):
+        """빌드 단계(별도 프로세스)가 수정한 파일 목록을 프로젝트의 진행 기록에서 읽음"""
+        for journal in load_journals(os.path.join(self.path, JOURNAL_DIR)):
+            if journal.version == self.version:
+                self.mutated_files.update(journal.data['mutated_files'])
+                break
+
+
+def run_project(run, drive, router):
+    """프로젝트 하나의 파이프라인: 버전/빌드 → 업로드 → Git/릴리즈"""
+    with open(run.log_path, 'w', encoding='utf-8') as log:
+        router.local.log = log
+        run.log_file = log
+        try:
+            if not os.path.exists(os.path.join(run.path, 'auto_deploy.py')):
+                print(f"❌ auto_deploy.py를 찾을 수 없습니다: {run.path}")
+                run.error = 'auto_deploy.py 없음'
+                return run
+
+            build_args = ['--current'] if run.version_type == 'current' else [run.version_type]
+            if not run.stage('build', lambda: run.run_script(
+                    *build_args, '--no-upload', '--no-git', '--no-release')):
+                return run
+            if not run.stage('version', run.read_version):
+                return run
+            run.read_mutated_files()
+
+            if run.upload and drive:
+                apk_path = os.path.join(run.path, APK_RELATIVE_PATH)
+                file_name = f"{run.drive_prefix}_v{run.version}.apk"
+
+                def upload():
+                    run.link = drive.publish(apk_path, file_name)
+                    if run.link and update_readme_download_link(
+                            run.link, run.version, readme_path=os.path.join(run.path, 'README.md')):
+                        run.mutated_files.add('README.md')
+                    return run.link
+
+                if not run.stage('upload', upload):
+                    return run
+
+            if run.git or run.release:
+                publish_args = ['--current', '--skip-build', '--no-upload']
+                if not run.git:
+                    publish_args.append('--no-git')
+                if not run.release:
+                    publish_args.append('--no-release')
+                if run.link:
+                    publish_args += ['--drive-link', run.link]
+                # 게시 단계는 새 프로세스이므로 앞 단계에서 수정한 파일을 직접 넘겨 릴리즈 커밋에 포함
+                if run.git and run.mutated_files:
+                    publish_args += ['--commit-files', *sorted(run.mutated_files)]
+                if not run.stage('publish', lambda: run.run_script(*publish_args)):
+                    return run
+
+            run.success = True
+            return run
+        finally:
+            with open(run.trace_path, 'w', encoding='utf-8') as f:
+                json.dump({'project': run.name, 'version': run.version, 'success': run.success,
+                           'link': run.link, 'stages': run.trace}, f, ensure_ascii=False, indent=2)
+            router.local.log = None
+
+
+def print_report(runs, wall_seconds):
+    """프로젝트별/단계별 집계 시간 출력"""
+    print("\n" + "=" * 50)
+    print("📊 Fleet 배포 결과")
+    for run in runs:
+        status = '✅' if run.success else f'❌ ({run.error})'
+        version = f"v{run.version}" if run.version else '-'
+        print(f"  {status} {run.name} {version}: {run.total_seconds:.1f}초 → {run.log_path}")
+
+    stage_totals = {}
+    for run in runs:
+        for stage in run.trace:
+            stage_totals[stage['stage']] = stage_totals.get(stage['stage'], 0) + stage['seconds']
+    print("⏱️ 단계별 누적 시간:")
+    for name, seconds in stage_totals.items():
+        print(f"  - {name}: {seconds:.1f}초")
+
+    serial_seconds = sum(run.total_seconds for run in runs)
+    print(f"⏱️ 전체 소요 시간: {wall_seconds:.1f}초 (순차 실행 시 {serial_seconds:.1f}초)")
+    print("=" * 50)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='여러 앱/플레이버 일괄 배포')
+    parser.add_argument('manifest', help='프로젝트 매니페스트(JSON) 경로')
+    parser.add_argument('--workers', type=int, help='동시에 실행할 프로젝트 수 (기본: 매니페스트 값 또는 2)')
+    parser.add_argument('--no-upload', action='store_true', help='Google Drive 업로드 건너뛰기')
+    parser.add_argument('--no-git', action='store_true', help='Git 커밋/푸시 건너뛰기')
+    parser.add_argument('--no-release', action='store_true', help='GitHub 릴리즈 생성 건너뛰기')
+
+    args = parser.parse_args()
+
+    with open(args.manifest, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    projects = manifest.get('projects', [])
+    if not projects:
+        print("❌ 매니페스트에 프로젝트가 없습니다.")
+        return False
+
+    workers = args.workers or manifest.get('workers', 2)
+    log_dir = os.path.join(FLEET_LOG_ROOT, datetime.now().strftime('%Y%m%d-%H%M%S'))
+    os.makedirs(log_dir, exist_ok=True)
+
+    runs = [ProjectRun(spec, log_dir) for spec in projects]
+    for run in runs:
+        run.upload = run.upload and not args.no_upload
+        run.git = run.git and not args.no_git
+        run.release = run.release and not args.no_release
+
+    print("🚀 Fleet 배포 시작")
+    print(f"📦 프로젝트 {len(runs)}개, 작업자 {workers}개")
+    print(f"📝 로그 디렉터리: {log_dir}")
+
+    drive = None
+    if any(run.upload for run in runs):
+        drive = SharedDriveClient()
+        if not drive.connect():
+            print("❌ Google Drive 연결 실패")
+            return False
+
+    router = _ThreadRoutedStream(sys.stdout)
+    sys.stdout = router
+    started = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda run: run_project(run, drive, router), runs))
+    finally:
+        sys.stdout = router.original
+
+    print_report(runs, time.monotonic() - started)
+    return all(run.success for run in runs)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
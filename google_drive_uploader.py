@@ -9,17 +9,27 @@ import os
 import sys
 import json
 import re
+import time
+import random
+import mimetypes
 import argparse
 from datetime import datetime
 import subprocess
 from pathlib import Path
 
+import release_profiler
+from artifact_io import MappedFile, sha256_file
+from release_git import GitError, snapshot_file
+from release_lock import atomic_write_text, release_lock
+from upload_metrics import UploadMetrics, export_metrics
+from api_scheduler import CRITICAL, get_scheduler, is_drive_rate_limited
+
 try:
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
-    from googleapiclient.http import MediaFileUpload
+    from googleapiclient.http import MediaUpload, MediaUploadProgress
     from googleapiclient.errors import HttpError
 except ImportError:
     print("❌ Google API 라이브러리가 설치되지 않았습니다.")
@@ -30,6 +40,101 @@ except ImportError:
 # Google Drive API 스코프 설정
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+# 파일 ID와 공유 링크가 배포마다 바뀌면 안 되는 고정 이름 파일 (내용만 교체)
+STABLE_FILE_NAMES = {'SecureMemo_latest.apk', 'version.json'}
+LATEST_APK_NAME = 'SecureMemo_latest.apk'
+
+# lib/update_service.dart에 하드코딩된 version.json 파일 ID (제자리 교체로 유지되어야 함)
+VERSION_JSON_FILE_ID = os.environ.get('VERSION_JSON_FILE_ID', '1uOBHu09UmUm5TeWeo3bEyYAr7tr9--nx')
+
+# 청크 전송 재시도 설정 (5xx, 429, 연결 끊김)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+RETRYABLE_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+MAX_CHUNK_RETRIES = 6
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 64.0
+
+
+def is_retryable_error(error):
+    """재시도로 복구 가능한 오류인지 판단"""
+    if isinstance(error, HttpError):
+        status = error.resp.status
+        if status in RETRYABLE_STATUS:
+            return True
+        # Drive는 사용자별 속도 제한을 403으로 응답하기도 함
+        return status == 403 and any(r in str(error.content) for r in RETRYABLE_REASONS)
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def backoff_delay(attempt):
+    """지수 백오프 + 지터 (attempt: 1부터 시작)"""
+    delay = min(BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)), BACKOFF_MAX_SECONDS)
+    return delay + random.uniform(0, BACKOFF_BASE_SECONDS)
+
+
+def query_upload_status(request, total_size):
+    """
+    재개 가능 업로드 세션에 서버가 커밋한 오프셋을 조회 (빈 PUT + Content-Range: bytes */크기)
+
+    308이면 Range 헤더로 request.resumable_progress를 맞춰 다음 next_chunk()가 그 지점부터 보내고,
+    200/201이면 마지막 청크가 이미 반영된 것이므로 완료 응답을 반환합니다.
+    반환값은 next_chunk()와 같은 (status, response) 형태입니다.
+    """
+    if not request.resumable_uri:
+        # 세션 생성 전에 실패 → next_chunk()가 세션부터 다시 시작
+        return MediaUploadProgress(0, total_size), None
+    resp, content = request.http.request(
+        request.resumable_uri, 'PUT',
+        headers={'Content-Range': f'bytes */{total_size}', 'Content-Length': '0'})
+    if resp.status in (200, 201):
+        return None, request.postproc(resp, content)
+    if resp.status != 308:
+        raise HttpError(resp, content, uri=request.resumable_uri)
+    # Range: bytes=0-N → N+1바이트까지 수신됨 (헤더가 없으면 아직 받은 바이트 없음)
+    request.resumable_progress = int(resp['range'].split('-')[1]) + 1 if 'range' in resp else 0
+    return MediaUploadProgress(request.resumable_progress, total_size), None
+
+
+# 재개 가능 업로드 청크 크기 (256KB의 배수여야 함)
+UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
+
+class MappedMediaUpload(MediaUpload):
+    """
+    창 단위 mmap으로 청크를 읽는 재개 가능 업로드 (수 GB 아티팩트도 메모리 상한 유지)
+
+    googleapiclient는 청크를 bytes로 요구하므로 청크 하나만 복사하고,
+    파일 전체는 한 번에 하나의 창만 매핑합니다.
+    """
+
+    def __init__(self, file_path, mimetype=None, chunksize=UPLOAD_CHUNK_SIZE):
+        super().__init__()
+        self._mapped = MappedFile(file_path, window_size=max(chunksize, UPLOAD_CHUNK_SIZE))
+        self._mimetype = mimetype or mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        self._chunksize = chunksize
+
+    def chunksize(self):
+        return self._chunksize
+
+    def mimetype(self):
+        return self._mimetype
+
+    def size(self):
+        return self._mapped.size
+
+    def resumable(self):
+        return True
+
+    def getbytes(self, begin, length):
+        return self._mapped.read_range(begin, length)
+
+    def has_stream(self):
+        return False
+
+    def close(self):
+        self._mapped.close()
+
+
 class GoogleDriveUploader:
     def __init__(self, credentials_path='credentials.json', token_path='token.json'):
         """
@@ -43,9 +148,22 @@ class GoogleDriveUploader:
         self.token_path = token_path
         self.service = None
         self.folder_id = None
+        self.last_upload_metrics = None
+        # 프로세스 내 모든 Drive 호출이 공유하는 할당량 스케줄러
+        self.scheduler = get_scheduler('drive')
         
     def authenticate(self):
         """Google Drive API 인증 처리"""
+        creds = self.load_credentials()
+        if not creds:
+            return False
+        
+        self.service = build('drive', 'v3', credentials=creds)
+        print("✅ Google Drive API 인증 완료")
+        return True
+    
+    def load_credentials(self):
+        """저장된 토큰을 로드하거나 새로 인증하여 Credentials 반환 (실패 시 None)"""
         creds = None
         
         # 기존 토큰 파일이 있으면 로드
@@ -61,7 +179,7 @@ class GoogleDriveUploader:
                 if not os.path.exists(self.credentials_path):
                     print(f"❌ 인증 파일을 찾을 수 없습니다: {self.credentials_path}")
                     print("📋 Google Cloud Console에서 credentials.json을 다운로드하세요.")
-                    return False
+                    return None
                 
                 print("🔐 Google Drive 인증 진행 중...")
                 flow = InstalledAppFlow.from_client_secrets_file(
@@ -72,9 +190,7 @@ class GoogleDriveUploader:
             with open(self.token_path, 'w') as token:
                 token.write(creds.to_json())
         
-        self.service = build('drive', 'v3', credentials=creds)
-        print("✅ Google Drive API 인증 완료")
-        return True
+        return creds
     
     def create_folder(self, folder_name, parent_id=None):
         """Google Drive에 폴더 생성 (이미 존재하면 기존 폴더 사용)"""
@@ -84,7 +200,7 @@ class GoogleDriveUploader:
             if parent_id:
                 query += f" and parents in '{parent_id}'"
             
-            results = self.service.files().list(q=query).execute()
+            results = self.scheduler.execute(self.service.files().list(q=query), CRITICAL)
             items = results.get('files', [])
             
             if items:
@@ -100,7 +216,8 @@ class GoogleDriveUploader:
             if parent_id:
                 folder_metadata['parents'] = [parent_id]
             
-            folder = self.service.files().create(body=folder_metadata, fields='id').execute()
+            folder = self.scheduler.execute(
+                self.service.files().create(body=folder_metadata, fields='id'), CRITICAL)
             folder_id = folder.get('id')
             print(f"📁 새 폴더 생성: {folder_name} (ID: {folder_id})")
             return folder_id
@@ -109,7 +226,8 @@ class GoogleDriveUploader:
             print(f"❌ 폴더 생성 실패: {error}")
             return None
     
-    def upload_file(self, file_path, folder_id=None, file_name=None):
+    def upload_file(self, file_path, folder_id=None, file_name=None, update_in_place=None,
+                    existing_file_id=None):
         """
         파일을 Google Drive에 업로드
         
@@ -117,6 +235,9 @@ class GoogleDriveUploader:
             file_path (str): 업로드할 파일 경로
             folder_id (str): 업로드할 폴더 ID (선택사항)
             file_name (str): 업로드할 파일명 (선택사항)
+            update_in_place (bool): 같은 이름의 파일이 있으면 삭제 후 재생성하지 않고
+                내용만 교체하여 파일 ID와 공유 링크 유지 (기본: STABLE_FILE_NAMES만)
+            existing_file_id (str): 이름으로 찾지 않고 이 파일 ID의 내용을 교체 (고정 ID 파일)
         
         Returns:
             str: 업로드된 파일 ID
@@ -128,65 +249,144 @@ class GoogleDriveUploader:
             
             # 파일 정보 설정
             file_name = file_name or os.path.basename(file_path)
+            if update_in_place is None:
+                update_in_place = file_name in STABLE_FILE_NAMES
             file_size = os.path.getsize(file_path)
             print(f"📤 업로드 시작: {file_name} ({file_size / 1024 / 1024:.1f}MB)")
             
-            # 기존 파일 검색
-            query = f"name='{file_name}'"
-            if folder_id:
-                query += f" and parents in '{folder_id}'"
+            if existing_file_id:
+                existing_files = [{'id': existing_file_id, 'name': file_name}]
+                update_in_place = True
+            else:
+                # 기존 파일 검색
+                query = f"name='{file_name}' and trashed=false"
+                if folder_id:
+                    query += f" and parents in '{folder_id}'"
+                
+                results = self.scheduler.execute(
+                    self.service.files().list(q=query, fields='files(id, name)'), CRITICAL)
+                existing_files = results.get('files', [])
             
-            results = self.service.files().list(q=query, fields='files(id, name)').execute()
-            existing_files = results.get('files', [])
+            # 미디어 업로드 설정 (청크 크기는 호출 시점의 UPLOAD_CHUNK_SIZE)
+            media = MappedMediaUpload(file_path, chunksize=UPLOAD_CHUNK_SIZE)
             
-            if existing_files:
-                # 기존 파일이 있으면 삭제
+            if existing_files and update_in_place:
+                # 기존 파일 내용만 교체 (파일 ID, 공유 권한, 링크 유지)
                 existing_file = existing_files[0]
-                print(f"🔄 기존 파일 발견: {existing_file['name']} (ID: {existing_file['id']})")
-                self.service.files().delete(fileId=existing_file['id']).execute()
-                print(f"✅ 기존 파일 삭제 완료")
-            
-            # 파일 메타데이터 설정
-            file_metadata = {'name': file_name}
-            if folder_id:
-                file_metadata['parents'] = [folder_id]
+                print(f"🔄 기존 파일 내용 교체: {existing_file['name']} (ID: {existing_file['id']})")
+                
+                def new_request():
+                    return self.service.files().update(
+                        fileId=existing_file['id'],
+                        media_body=media,
+                        fields='id'
+                    )
+            else:
+                if existing_files:
+                    # 기존 파일이 있으면 삭제
+                    existing_file = existing_files[0]
+                    print(f"🔄 기존 파일 발견: {existing_file['name']} (ID: {existing_file['id']})")
+                    self.scheduler.execute(self.service.files().delete(fileId=existing_file['id']), CRITICAL)
+                    print(f"✅ 기존 파일 삭제 완료")
+                
+                # 파일 메타데이터 설정
+                file_metadata = {'name': file_name}
+                if folder_id:
+                    file_metadata['parents'] = [folder_id]
+                
+                # 파일 업로드 실행
+                def new_request():
+                    return self.service.files().create(
+                        body=file_metadata,
+                        media_body=media,
+                        fields='id'
+                    )
             
-            # 미디어 업로드 설정
-            media = MediaFileUpload(file_path, resumable=True)
+            request = new_request()
             
-            # 파일 업로드 실행
-            request = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            )
+            metrics = UploadMetrics(file_name, file_size)
+            self.last_upload_metrics = metrics
+            metrics.start()
+            uploaded = 0
             
             response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    print(f"📈 업로드 진행률: {int(status.progress() * 100)}%")
+            attempt = 0
+            resume = False
+            try:
+                while response is None:
+                    try:
+                        self.scheduler.acquire(CRITICAL)
+                        if resume:
+                            # 실패한 청크 중 일부가 서버에 커밋됐을 수 있으므로 오프셋을 먼저 조회하고
+                            # 같은 세션을 이어받는 새 요청으로 교체 (공개 속성 resumable_uri/progress만 사용).
+                            # 라이브러리 내부 오류 플래그(_in_error_state)를 건드리지 않고,
+                            # 새 요청은 오류 상태가 아니므로 next_chunk()가 오프셋을 중복 조회하지 않음
+                            status, response = query_upload_status(request, file_size)
+                            if response is None:
+                                resumed = new_request()
+                                resumed.resumable_uri = request.resumable_uri
+                                resumed.resumable_progress = request.resumable_progress
+                                request = resumed
+                            resume = False
+                        else:
+                            status, response = request.next_chunk()
+                            # 청크가 정상 전송되면 재시도 예산 초기화
+                            attempt = 0
+                    except (HttpError, ConnectionError, TimeoutError) as error:
+                        if not is_retryable_error(error) or attempt >= MAX_CHUNK_RETRIES:
+                            raise
+                        attempt += 1
+                        if is_drive_rate_limited(error):
+                            self.scheduler.throttled()
+                        delay = backoff_delay(attempt)
+                        metrics.retry()
+                        print(f"⚠️ 청크 전송 실패: {error}")
+                        print(f"🔁 {delay:.1f}초 후 재시도 "
+                              f"(청크 재시도 예산 {MAX_CHUNK_RETRIES - attempt}/{MAX_CHUNK_RETRIES} 남음)")
+                        time.sleep(delay)
+                        resume = True
+                        continue
+                    
+                    progress = status.resumable_progress if status else file_size
+                    metrics.chunk_sent(max(progress - uploaded, 0))
+                    uploaded = progress
+                    if status:
+                        print(f"📈 업로드 진행률: {int(status.progress() * 100)}%")
+            finally:
+                media.close()
+                metrics.finish(response is not None)
+                metrics.print_summary()
+                export_metrics()
             
             file_id = response.get('id')
             print(f"✅ 업로드 완료: {file_name} (ID: {file_id})")
             return file_id
             
-        except HttpError as error:
+        except (HttpError, ConnectionError, TimeoutError, MemoryError) as error:
+            # MemoryError: MappedFile의 RSS 상한 초과 (artifact_io)
             print(f"❌ 업로드 실패: {error}")
             return None
     
     def make_file_public(self, file_id):
         """파일을 공개로 설정하고 공유 링크 생성"""
         try:
+            file_info = self.scheduler.execute(self.service.files().get(
+                fileId=file_id,
+                fields='webViewLink, permissions(type, role)'
+            ), CRITICAL)
+            share_link = file_info.get('webViewLink')
+            
+            # 내용만 교체한 파일은 이미 공개 상태이므로 권한 부여 생략
+            already_public = any(p.get('type') == 'anyone' for p in file_info.get('permissions', []))
+            if already_public:
+                print(f"🔗 기존 공유 링크 유지: {share_link}")
+                return share_link
+            
             # 파일을 공개로 설정
-            self.service.permissions().create(
+            self.scheduler.execute(self.service.permissions().create(
                 fileId=file_id,
                 body={'role': 'reader', 'type': 'anyone'}
-            ).execute()
-            
-            # 공유 링크 생성
-            file_info = self.service.files().get(fileId=file_id, fields='webViewLink').execute()
-            share_link = file_info.get('webViewLink')
+            ), CRITICAL)
             
             print(f"🔗 공유 링크 생성: {share_link}")
             return share_link
@@ -195,14 +395,27 @@ class GoogleDriveUploader:
             print(f"❌ 공유 링크 생성 실패: {error}")
             return None
     
-    def upload_apk_and_get_link(self, apk_path, version=None):
+    def upload_apk_and_get_link(self, apk_path, version=None, publish_latest=False):
         """APK 파일 업로드 및 공유 링크 반환"""
-        if not self.authenticate():
+        uploaded = self.upload_apk(apk_path, version, publish_latest)
+        return uploaded['link'] if uploaded else None
+    
+    def upload_apk(self, apk_path, version=None, publish_latest=False):
+        """
+        APK 파일 업로드 후 {'file_id', 'file_name', 'link'} 반환 (실패 시 None)
+        
+        publish_latest가 True이면 SecureMemo_latest.apk도 같은 내용으로 교체합니다.
+        (파일 ID가 유지되므로 고정 다운로드 링크로 사용 가능)
+        """
+        # 이미 인증된 경우(배포 데몬 등) 기존 서비스 재사용
+        if not self.service and not self.authenticate():
             return None
         
-        # APK 폴더 생성 또는 기존 폴더 사용
-        folder_name = "SecureMemo_APK"
-        folder_id = self.create_folder(folder_name)
+        # APK 폴더 생성 또는 기존 폴더 사용 (한 번 조회한 폴더 ID는 재사용)
+        if not self.folder_id:
+            folder_name = "SecureMemo_APK"
+            self.folder_id = self.create_folder(folder_name)
+        folder_id = self.folder_id
         
         if not folder_id:
             print("❌ 폴더 생성 실패")
@@ -212,7 +425,7 @@ class GoogleDriveUploader:
         if version:
             file_name = f"SecureMemo_v{version}.apk"
         else:
-            file_name = "SecureMemo_latest.apk"
+            file_name = LATEST_APK_NAME
         
         # APK 업로드
         file_id = self.upload_file(apk_path, folder_id, file_name)
@@ -227,50 +440,157 @@ class GoogleDriveUploader:
             print(f"🎉 APK 업로드 완료!")
             print(f"📱 APK 파일: {file_name}")
             print(f"🔗 다운로드 링크: {share_link}")
-            return share_link
+            
+            latest_link = share_link if not version else None
+            if publish_latest and version:
+                latest_id = self.upload_file(apk_path, folder_id, LATEST_APK_NAME)
+                if latest_id:
+                    latest_link = self.make_file_public(latest_id)
+                    print(f"🔗 고정 다운로드 링크 ({LATEST_APK_NAME}): {latest_link}")
+                else:
+                    print(f"⚠️ {LATEST_APK_NAME} 갱신 실패 (버전별 링크는 정상 배포됨)")
+            return {'file_id': file_id, 'file_name': file_name, 'link': share_link,
+                    'latest_link': latest_link}
         
         return None
+    
+    def upload_version_json(self, json_path='version.json', folder_id=None):
+        """
+        version.json을 제자리 교체 방식으로 업로드하고 파일 ID 반환
+
+        앱은 VERSION_JSON_FILE_ID만 확인하므로 그 파일의 내용을 직접 교체합니다.
+        (폴더에서 이름으로 찾으면 다른 version.json을 갱신할 수 있음)
+        고정 ID를 갱신할 수 없을 때만 폴더의 version.json을 이름으로 찾아 교체합니다.
+        """
+        file_id = None
+        if VERSION_JSON_FILE_ID:
+            file_id = self.upload_file(json_path, folder_id, 'version.json',
+                                       existing_file_id=VERSION_JSON_FILE_ID)
+            if not file_id:
+                print(f"⚠️ 고정 version.json(ID: {VERSION_JSON_FILE_ID})을 갱신하지 못해 폴더에서 이름으로 찾습니다.")
+        if not file_id:
+            file_id = self.upload_file(json_path, folder_id, 'version.json', update_in_place=True)
+            if file_id and VERSION_JSON_FILE_ID and file_id != VERSION_JSON_FILE_ID:
+                print(f"⚠️ version.json 파일 ID({file_id})가 update_service.dart의 ID와 다릅니다.")
+        if file_id:
+            self.make_file_public(file_id)
+        return file_id
+
+def file_sha256(file_path):
+    """파일 SHA-256 체크섬 계산 (mmap 창 단위, 메모리 상한 유지)"""
+    return sha256_file(file_path)
 
-def update_readme_download_link(share_link, version=None):
-    """README.md 파일의 다운로드 링크 업데이트"""
-    readme_path = 'README.md'
+def publish_apk(apk_path, version=None, uploader=None, update_readme=True, publish_latest=False):
+    """
+    APK 업로드 후 구조화된 결과 반환 (auto_deploy 등에서 프로세스 내 호출용)
+    
+    Args:
+        apk_path (str): 업로드할 APK 경로
+        version (str): 버전 번호 (없으면 SecureMemo_latest.apk로 업로드)
+        uploader (GoogleDriveUploader): 재사용할 업로더 (없으면 새로 생성 후 인증)
+        update_readme (bool): README.md 다운로드 링크 갱신 여부
+        publish_latest (bool): SecureMemo_latest.apk도 함께 교체할지 여부
+    
+    Returns:
+        dict: file_id, file_name, link, size, sha256, timings(초), upload_metrics,
+            updated_files(수정한 로컬 파일 목록), snapshots(그 파일들의 blob SHA) (실패 시 None)
+    """
+    started = time.monotonic()
+    timings = {}
+    
+    if not os.path.exists(apk_path):
+        print(f"❌ APK 파일을 찾을 수 없습니다: {apk_path}")
+        return None
+    
+    release_profiler.begin_stage('checksum')
+    step = time.monotonic()
+    size = os.path.getsize(apk_path)
+    checksum = file_sha256(apk_path)
+    timings['checksum'] = round(time.monotonic() - step, 3)
+    
+    uploader = uploader or GoogleDriveUploader()
+    release_profiler.begin_stage('upload')
+    step = time.monotonic()
+    uploaded = uploader.upload_apk(apk_path, version, publish_latest)
+    timings['upload'] = round(time.monotonic() - step, 3)
+    if not uploaded:
+        return None
+    
+    updated_files = []
+    snapshots = {}
+    if update_readme:
+        release_profiler.begin_stage('readme')
+        step = time.monotonic()
+        if update_readme_download_link(uploaded['link'], version, snapshots=snapshots):
+            updated_files.append('README.md')
+        else:
+            print("⚠️ README.md 업데이트 실패 (수동으로 링크를 업데이트하세요)")
+        timings['readme'] = round(time.monotonic() - step, 3)
+    
+    timings['total'] = round(time.monotonic() - started, 3)
+    metrics = uploader.last_upload_metrics
+    
+    return {
+        'file_id': uploaded['file_id'],
+        'file_name': uploaded['file_name'],
+        'link': uploaded['link'],
+        'size': size,
+        'sha256': checksum,
+        'timings': timings,
+        'upload_metrics': metrics.to_dict() if metrics else None,
+        'updated_files': updated_files,
+        'snapshots': snapshots,
+    }
+
+def update_readme_download_link(share_link, version=None, readme_path='README.md', snapshots=None):
+    """
+    README.md 파일의 다운로드 링크 업데이트
+
+    snapshots(dict)를 넘기면 잠금 안에서 쓴 내용의 blob SHA를 기록합니다 (릴리즈 커밋용).
+    """
     
     if not os.path.exists(readme_path):
         print(f"❌ README.md 파일을 찾을 수 없습니다: {readme_path}")
         return False
     
     try:
-        # README.md 파일 읽기
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 다운로드 링크 패턴 검색 및 업데이트
-        # 패턴: [다운로드](https://drive.google.com/file/d/...)
-        pattern = r'\[다운로드\]\(https://drive\.google\.com/file/d/[^)]+\)'
-        new_link = f'[다운로드]({share_link})'
-        
-        if re.search(pattern, content):
-            # 기존 링크 업데이트
-            updated_content = re.sub(pattern, new_link, content)
-            print("🔄 기존 다운로드 링크 업데이트")
-        else:
-            print("⚠️ 기존 다운로드 링크 패턴을 찾을 수 없습니다.")
-            return False
-        
-        # 버전 정보 업데이트 (선택사항)
-        if version:
-            # 버전 패턴 검색 및 업데이트
-            version_pattern = r'v\d+\.\d+\.\d+'
-            if re.search(version_pattern, updated_content):
-                updated_content = re.sub(version_pattern, f'v{version}', updated_content)
-                print(f"🔄 버전 정보 업데이트: v{version}")
-        
-        # 파일 쓰기
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
-        
-        print("✅ README.md 업데이트 완료")
-        return True
+        # 동시에 실행 중인 다른 배포와 README.md를 번갈아 덮어쓰지 않도록 잠금
+        with release_lock('docs'):
+            # README.md 파일 읽기
+            with open(readme_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            
+            # 다운로드 링크 패턴 검색 및 업데이트
+            # 패턴: [다운로드](https://drive.google.com/file/d/...)
+            pattern = r'\[다운로드\]\(https://drive\.google\.com/file/d/[^)]+\)'
+            new_link = f'[다운로드]({share_link})'
+            
+            if re.search(pattern, content):
+                # 기존 링크 업데이트
+                updated_content = re.sub(pattern, new_link, content)
+                print("🔄 기존 다운로드 링크 업데이트")
+            else:
+                print("⚠️ 기존 다운로드 링크 패턴을 찾을 수 없습니다.")
+                return False
+            
+            # 버전 정보 업데이트 (선택사항)
+            if version:
+                # 버전 패턴 검색 및 업데이트
+                version_pattern = r'v\d+\.\d+\.\d+'
+                if re.search(version_pattern, updated_content):
+                    updated_content = re.sub(version_pattern, f'v{version}', updated_content)
+                    print(f"🔄 버전 정보 업데이트: v{version}")
+            
+            # 파일 쓰기
+            atomic_write_text(readme_path, updated_content)
+            if snapshots is not None:
+                try:
+                    snapshots[readme_path] = snapshot_file(readme_path)
+                except GitError:
+                    snapshots[readme_path] = None
+            
+            print("✅ README.md 업데이트 완료")
+            return True
         
     except Exception as e:
         print(f"❌ README.md 업데이트 실패: {e}")
@@ -305,8 +625,24 @@ def main():
     parser.add_argument('--version', help='버전 번호 (선택사항)')
     parser.add_argument('--no-readme', action='store_true', 
                        help='README.md 업데이트 건너뛰기')
+    parser.add_argument('--latest', action='store_true',
+                       help='SecureMemo_latest.apk도 같은 파일 ID로 내용 교체')
+    parser.add_argument('--backend', choices=['sync', 'async'], default='sync',
+                       help='업로드 백엔드 (async: aiohttp 기반 동시 처리, 기본: sync)')
+    parser.add_argument('--profile', action='store_true',
+                       help='cProfile/tracemalloc 프로파일 기록 (.deploy/profile)')
     
     args = parser.parse_args()
+    if args.profile:
+        release_profiler.start('google_drive_uploader')
+        try:
+            return upload_main(args)
+        finally:
+            release_profiler.stop()
+    return upload_main(args)
+
+def upload_main(args):
+    """업로드 실행 (main에서 인자 파싱 후 호출)"""
     
     # APK 파일 존재 확인
     if not os.path.exists(args.apk_path):
@@ -322,22 +658,27 @@ def main():
     if version:
         print(f"🏷️  버전: v{version}")
     
-    # Google Drive 업로더 초기화
-    uploader = GoogleDriveUploader()
-    
     # APK 업로드 및 링크 생성
-    share_link = uploader.upload_apk_and_get_link(args.apk_path, version)
+    if args.backend == 'async':
+        from async_drive_uploader import upload_apk_and_get_link
+        checksum = file_sha256(args.apk_path)
+        share_link = upload_apk_and_get_link(args.apk_path, version, publish_latest=args.latest)
+        if share_link:
+            print(f"🔒 SHA-256: {checksum}")
+        if share_link and not args.no_readme:
+            if not update_readme_download_link(share_link, version):
+                print("⚠️ README.md 업데이트 실패 (수동으로 링크를 업데이트하세요)")
+    else:
+        result = publish_apk(args.apk_path, version, update_readme=not args.no_readme,
+                             publish_latest=args.latest)
+        share_link = result['link'] if result else None
+        if result:
+            print(f"🔒 SHA-256: {result['sha256']}")
     
     if not share_link:
         print("❌ APK 업로드 실패")
         return False
     
-    # README.md 업데이트
-    if not args.no_readme:
-        success = update_readme_download_link(share_link, version)
-        if not success:
-            print("⚠️ README.md 업데이트 실패 (수동으로 링크를 업데이트하세요)")
-    
     print("\n🎉 모든 작업이 완료되었습니다!")
     print(f"🔗 다운로드 링크: {share_link}")
     
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파이프라인 관리 Gradle 빌드 캐시
+새 CI 머신에서도 Android 쪽 컴파일 결과를 재사용하도록 Gradle HTTP 빌드 캐시 서버를 제공합니다.
+
+- 빌드 중에는 127.0.0.1의 임시 포트로 캐시 서버를 띄우고
+  GRADLE_BUILD_CACHE_URL로 알려 줍니다 (android/settings.gradle.kts의 buildCache 블록).
+- 캐시 항목은 GRADLE_CACHE_DIR(기본 .deploy/gradle-cache)에 저장되므로
+  공유 디스크를 지정하면 여러 빌드 머신이 같은 캐시를 씁니다.
+- GRADLE_CACHE_UPSTREAM에 다른 머신의 캐시 서버(python gradle_cache.py serve)를 지정하면
+  로컬에 없는 항목은 가져오고 새 항목은 함께 올립니다.
+- 모든 조회가 이 서버를 거치므로 빌드마다 적중률을 집계해 출력하고
+  .deploy/metrics/gradle_cache.jsonl, securememo_gradle_cache.prom에 기록합니다.
+
+사용법:
+  python gradle_cache.py status                         # 캐시 크기와 최근 빌드 적중률
+  python gradle_cache.py serve --host 0.0.0.0 --port 5071  # 다른 빌드 머신용 공유 캐시 서버
+  python gradle_cache.py prune                          # 용량 상한에 맞춰 오래된 항목 삭제
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from release_lock import atomic_write_text
+
+CACHE_DIR = os.environ.get('GRADLE_CACHE_DIR', os.path.join('.deploy', 'gradle-cache'))
+CACHE_UPSTREAM = os.environ.get('GRADLE_CACHE_UPSTREAM')
+CACHE_MAX_SIZE = int(os.environ.get('GRADLE_CACHE_MAX_MB', '5120')) * 1024 * 1024
+METRICS_DIR = os.path.join('.deploy', 'metrics')
+HISTORY_FILE_NAME = 'gradle_cache.jsonl'
+PROM_FILE_NAME = 'securememo_gradle_cache.prom'
+UPSTREAM_TIMEOUT = 10
+# Gradle 캐시 키는 16진수 해시
+_KEY_PATTERN = re.compile(r'[0-9a-f]{8,128}')
+
+
+class CacheStats:
+    """캐시 서버 한 번 실행 동안의 조회/저장 통계"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.upstream_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.bytes_served = 0
+        self.bytes_stored = 0
+
+    def add(self, **counts):
+        with self.lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def lookups(self):
+        return self.hits + self.upstream_hits + self.misses
+
+    @property
+    def hit_rate(self):
+        return (self.hits + self.upstream_hits) / self.lookups if self.lookups else 0.0
+
+    def to_dict(self):
+        return {
+            'hits': self.hits,
+            'upstream_hits': self.upstream_hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'hit_rate': round(self.hit_rate, 4),
+            'bytes_served': self.bytes_served,
+            'bytes_stored': self.bytes_stored,
+        }
+
+
+def entry_path(key, cache_dir=CACHE_DIR):
+    # 한 디렉터리에 항목이 너무 많아지지 않도록 앞 두 글자로 분산
+    return os.path.join(cache_dir, key[:2], key)
+
+
+def _upstream_request(method, key, body=None):
+    request = urllib.request.Request(f"{CACHE_UPSTREAM.rstrip('/')}/{key}", data=body, method=method,
+                                     headers={'Content-Type': 'application/vnd.gradle.build-cache-artifact.v2'})
+    return urllib.request.urlopen(request, timeout=UPSTREAM_TIMEOUT)
+
+
+def _store(path, body):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{threading.get_ident()}.part'
+    with open(tmp_path, 'wb') as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+
+
+class CacheHandler(BaseHTTPRequestHandler):
+    """Gradle HTTP 빌드 캐시 프로토콜 (GET/PUT /cache/<키>)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _key(self):
+        parts = self.path.split('?')[0].strip('/').split('/')
+        if len(parts) == 2 and parts[0] == 'cache' and _KEY_PATTERN.fullmatch(parts[1]):
+            return parts[1]
+        self.send_error(404)
+        return None
+
+    def do_GET(self):
+        key = self._key()
+        if not key:
+            return
+        path = entry_path(key, self.server.cache_dir)
+        body = None
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                body = f.read()
+            # 최근 사용 항목이 정리 대상에서 밀려나도록 시각 갱신
+            os.utime(path)
+            self.server.stats.add(hits=1, bytes_served=len(body))
+        elif self.server.upstream:
+            try:
+                with _upstream_request('GET', key) as response:
+                    body = response.read()
+                _store(path, body)
+                self.server.stats.add(upstream_hits=1, bytes_served=len(body))
+            except (urllib.error.URLError, OSError):
+                body = None
+        if body is None:
+            self.server.stats.add(misses=1)
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/vnd.gradle.build-cache-artifact.v2')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        key = self._key()
+        if not key:
+            return
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        _store(entry_path(key, self.server.cache_dir), body)
+        self.server.stats.add(stores=1, bytes_stored=len(body))
+        if self.server.upstream:
+            try:
+                _upstream_request('PUT', key, body).close()
+            except (urllib.error.URLError, OSError):
+                pass
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        # 빌드 출력에 요청 로그가 섞이지 않도록 생략
+        pass
+
+
+def create_server(host='127.0.0.1', port=0, cache_dir=CACHE_DIR, upstream=CACHE_UPSTREAM):
+    os.makedirs(cache_dir, exist_ok=True)
+    server = ThreadingHTTPServer((host, port), CacheHandler)
+    server.daemon_threads = True
+    server.cache_dir = cache_dir
+    server.upstream = upstream
+    server.stats = CacheStats()
+    server.base_url = f'http://{host}:{server.server_address[1]}'
+    return server
+
+
+def cache_size(cache_dir=CACHE_DIR):
+    """(항목 수, 전체 바이트)"""
+    count = size = 0
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            count += 1
+            size += os.path.getsize(os.path.join(root, name))
+    return count, size
+
+
+def prune(cache_dir=CACHE_DIR, max_size=CACHE_MAX_SIZE):
+    """최근에 쓰지 않은 항목부터 지워 용량 상한에 맞춤, 삭제한 항목 수 반환"""
+    entries = []
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def record_build(stats, label=None):
+    """빌드 한 번의 적중률을 출력하고 지표 파일에 기록"""
+    summary = dict(stats.to_dict(), label=label, recorded_at=datetime.now().isoformat(timespec='seconds'))
+    print(f"🧊 Gradle 빌드 캐시: 적중 {stats.hits + stats.upstream_hits}/{stats.lookups} "
+          f"({stats.hit_rate * 100:.0f}%), 새로 저장 {stats.stores}개 "
+          f"({stats.bytes_stored / 1024 / 1024:.1f}MB)")
+    try:
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        with open(os.path.join(METRICS_DIR, HISTORY_FILE_NAME), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(summary, ensure_ascii=False) + '\n')
+        lines = ['# HELP securememo_gradle_cache_lookups Gradle build cache lookups in the last build',
+                 '# TYPE securememo_gradle_cache_lookups gauge']
+        for result, value in (('hit', stats.hits), ('upstream_hit', stats.upstream_hits), ('miss', stats.misses)):
+            lines.append(f'securememo_gradle_cache_lookups{{result="{result}"}} {value}')
+        lines += ['# HELP securememo_gradle_cache_hit_ratio Gradle build cache hit ratio in the last build',
+                  '# TYPE securememo_gradle_cache_hit_ratio gauge',
+                  f'securememo_gradle_cache_hit_ratio {stats.hit_rate:.4f}']
+        atomic_write_text(os.path.join(METRICS_DIR, PROM_FILE_NAME), '\n'.join(lines) + '\n')
+    except OSError as e:
+        print(f"⚠️ Gradle 캐시 지표 저장 실패: {e}")
+    return summary
+
+
+@contextmanager
+def build_cache(label=None):
+    """
+    빌드 동안 로컬 캐시 서버를 띄우고 GRADLE_BUILD_CACHE_URL로 Gradle에 알림
+
+    사용자가 GRADLE_BUILD_CACHE_URL을 직접 지정했다면 그 캐시를 그대로 사용합니다 (적중률 집계 없음).
+    """
+    if os.environ.get('GRADLE_BUILD_CACHE_URL'):
+        print(f"🧊 Gradle 빌드 캐시: {os.environ['GRADLE_BUILD_CACHE_URL']} (직접 지정)")
+        yield None
+        return
+
+    try:
+        server = create_server()
+    except OSError as e:
+        print(f"⚠️ Gradle 캐시 서버 시작 실패, 캐시 없이 빌드합니다: {e}")
+        yield None
+        return
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ['GRADLE_BUILD_CACHE_URL'] = f'{server.base_url}/cache/'
+    try:
+        yield server.stats
+    finally:
+        del os.environ['GRADLE_BUILD_CACHE_URL']
+        server.shutdown()
+        server.server_close()
+        record_build(server.stats, label)
+        removed = prune(server.cache_dir)
+        if removed:
+            print(f"🧹 Gradle 캐시 정리: 오래된 항목 {removed}개 삭제")
+
+
+def print_status():
+    count, size = cache_size()
+    print(f"📁 Gradle 캐시: {CACHE_DIR} ({count}개, {size / 1024 / 1024:.1f}MB / "
+          f"상한 {CACHE_MAX_SIZE / 1024 / 1024:.0f}MB)")
+    if CACHE_UPSTREAM:
+        print(f"🔗 업스트림: {CACHE_UPSTREAM}")
+    history_path = os.path.join(METRICS_DIR, HISTORY_FILE_NAME)
+    if not os.path.exists(history_path):
+        return
+    with open(history_path, 'r', encoding='utf-8') as f:
+        recent = [json.loads(line) for line in f if line.strip()][-5:]
+    print("📊 최근 빌드 적중률:")
+    for entry in recent:
+        lookups = entry['hits'] + entry['upstream_hits'] + entry['misses']
+        print(f"  {entry['recorded_at']}  {entry.get('label') or '-':<12} "
+              f"{entry['hit_rate'] * 100:5.1f}% ({lookups}회 조회, 저장 {entry['stores']}개)")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='파이프라인 관리 Gradle 빌드 캐시')
+    parser.add_argument('command', nargs='?', default='status', choices=['status', 'serve', 'prune'])
+    parser.add_argument('--host', default='127.0.0.1', help='serve: 바인드 주소 (공유하려면 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=5071, help='serve: 포트')
+    args = parser.parse_args()
+
+    if args.command == 'status':
+        print_status()
+        return True
+    if args.command == 'prune':
+        removed = prune()
+        print(f"🧹 오래된 항목 {removed}개 삭제")
+        return True
+
+    server = create_server(args.host, args.port)
+    print(f"🧊 Gradle 빌드 캐시 서버 실행: http://{args.host}:{args.port}/cache/ ({CACHE_DIR})")
+    print(f"💡 다른 빌드 머신: GRADLE_CACHE_UPSTREAM=http://<이 머신>:{args.port}/cache/ python auto_deploy.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n🛑 캐시 서버 종료 (적중률 {server.stats.hit_rate * 100:.0f}%, 조회 {server.stats.lookups}회)")
+    finally:
+        server.server_close()
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
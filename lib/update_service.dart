@@ -1,32 +1,158 @@
 import 'dart:convert';
+import 'dart:io';
+import 'dart:math';
+import 'package:crypto/crypto.dart';
 import 'package:flutter/material.dart';
+import 'package:flutter/services.dart';
 import 'package:http/http.dart' as http;
 import 'package:package_info_plus/package_info_plus.dart';
+import 'package:path_provider/path_provider.dart';
+import 'package:shared_preferences/shared_preferences.dart';
 import 'package:url_launcher/url_launcher.dart'; // 🔴 꼭 추가
 
 class UpdateService {
+  // 개발 루프(dev_server.py)의 디버그 빌드는 --dart-define=UPDATE_MANIFEST_URL로 로컬 서버를 확인
+  static const _manifestUrl = String.fromEnvironment('UPDATE_MANIFEST_URL',
+      defaultValue: 'https://drive.google.com/uc?export=download&id=1uOBHu09UmUm5TeWeo3bEyYAr7tr9--nx');
+  static const _installChannel = MethodChannel('com.jiwoosoft.secure_memo/update');
+
+  static const _lastCheckKey = 'update_last_check_ms';
+  static const _minCheckIntervalKey = 'update_min_check_interval_hours';
+  static const _rolloutBucketKey = 'update_rollout_bucket';
+  static const _manifestBodyKey = 'update_manifest_body';
+  static const _manifestEtagKey = 'update_manifest_etag';
+  static const _manifestLastModifiedKey = 'update_manifest_last_modified';
+  static const _failureCountKey = 'update_failure_count';
+  static const _nextRetryKey = 'update_next_retry_ms';
+
+  // version.json에 min_check_interval_hours가 없을 때의 캐시 유효 시간
+  static const _defaultCheckIntervalHours = 1;
+  static const _requestTimeout = Duration(seconds: 10);
+  // 실패하면 5분 → 10분 → 20분 … 최대 24시간까지 다음 확인을 미룸
+  static const _baseRetryDelay = Duration(minutes: 5);
+  static const _maxRetryDelay = Duration(hours: 24);
+
+  // 테스트에서 MockClient로 교체
+  @visibleForTesting
+  static http.Client Function() clientFactory = http.Client.new;
+
   static Future<void> checkForUpdate(BuildContext context) async {
     try {
+      final data = await loadManifestIfDue();
+      if (data == null) return;
+
       final packageInfo = await PackageInfo.fromPlatform();
       final currentVersion = packageInfo.version;
       final currentBuild = int.parse(packageInfo.buildNumber);
-
-      final response = await http.get(Uri.parse('https://drive.google.com/uc?export=download&id=1uOBHu09UmUm5TeWeo3bEyYAr7tr9--nx'));
-      if (response.statusCode != 200) throw Exception('버전 정보를 가져오지 못했습니다.');
-
-      final data = json.decode(response.body);
       final latestVersion = data['version'];
       final latestBuild = data['build'];
-      final apkUrl = data['apk_url'];
 
-      if (_isNewerVersion(currentVersion, latestVersion, currentBuild, latestBuild)) {
-        _showUpdateDialog(context, latestVersion, apkUrl);
+      // 단계적 배포: 이 설치본의 버킷(0~99)이 현재 배포 비율 안에 있을 때만 안내
+      final prefs = await SharedPreferences.getInstance();
+      final bucket = prefs.getInt(_rolloutBucketKey) ?? Random().nextInt(100);
+      await prefs.setInt(_rolloutBucketKey, bucket);
+      if (bucket >= _rolloutPercentage(data)) return;
+
+      if (_isNewerVersion(currentVersion, latestVersion, currentBuild, latestBuild) && context.mounted) {
+        _showUpdateDialog(context, data);
       }
     } catch (e) {
       print('업데이트 확인 중 오류 발생: $e');
     }
   }
 
+  /// 확인할 때가 되었으면 version.json을 가져옴 (대기 중이거나 실패하면 null, 실패 시 재시도 간격 증가)
+  @visibleForTesting
+  static Future<Map<String, dynamic>?> loadManifestIfDue() async {
+    final prefs = await SharedPreferences.getInstance();
+
+    // 실패 후 대기 중이거나 캐시 유효 시간(min_check_interval_hours) 이내면 다시 확인하지 않음
+    final now = DateTime.now().millisecondsSinceEpoch;
+    if (now < (prefs.getInt(_nextRetryKey) ?? 0)) return null;
+    final lastCheck = prefs.getInt(_lastCheckKey) ?? 0;
+    final minInterval = prefs.getInt(_minCheckIntervalKey) ?? _defaultCheckIntervalHours;
+    if (now - lastCheck < Duration(hours: minInterval).inMilliseconds) return null;
+
+    try {
+      final data = await _fetchManifest(prefs);
+      await prefs.setInt(_lastCheckKey, now);
+      await prefs.setInt(_minCheckIntervalKey,
+          (data['min_check_interval_hours'] ?? _defaultCheckIntervalHours) as int);
+      await prefs.remove(_failureCountKey);
+      await prefs.remove(_nextRetryKey);
+      return data;
+    } catch (e) {
+      print('버전 정보 확인 실패: $e');
+      await _scheduleRetry(prefs);
+      return null;
+    }
+  }
+
+  /// 캐시한 ETag/Last-Modified로 조건부 요청, 변경이 없으면(304) 캐시한 version.json 사용
+  static Future<Map<String, dynamic>> _fetchManifest(SharedPreferences prefs) async {
+    final cachedBody = prefs.getString(_manifestBodyKey);
+    final headers = <String, String>{};
+    if (cachedBody != null) {
+      final etag = prefs.getString(_manifestEtagKey);
+      final lastModified = prefs.getString(_manifestLastModifiedKey);
+      if (etag != null) headers['If-None-Match'] = etag;
+      if (lastModified != null) headers['If-Modified-Since'] = lastModified;
+    }
+
+    final client = clientFactory();
+    final http.Response response;
+    try {
+      response = await client.get(Uri.parse(_manifestUrl), headers: headers).timeout(_requestTimeout);
+    } finally {
+      client.close();
+    }
+    if (response.statusCode == 304 && cachedBody != null) {
+      return json.decode(cachedBody) as Map<String, dynamic>;
+    }
+    if (response.statusCode != 200) throw Exception('버전 정보를 가져오지 못했습니다. (HTTP ${response.statusCode})');
+
+    // charset이 없으면 http 패키지가 latin1로 디코딩하므로 직접 UTF-8로 디코딩
+    final body = utf8.decode(response.bodyBytes);
+    final data = json.decode(body) as Map<String, dynamic>;
+    await prefs.setString(_manifestBodyKey, body);
+    await _storeHeader(prefs, _manifestEtagKey, response.headers['etag']);
+    await _storeHeader(prefs, _manifestLastModifiedKey, response.headers['last-modified']);
+    return data;
+  }
+
+  static Future<void> _storeHeader(SharedPreferences prefs, String key, String? value) async {
+    if (value == null) {
+      await prefs.remove(key);
+    } else {
+      await prefs.setString(key, value);
+    }
+  }
+
+  /// 연속 실패 횟수에 따라 지수적으로 늘어나는 대기 시간 설정
+  static Future<void> _scheduleRetry(SharedPreferences prefs) async {
+    final failures = (prefs.getInt(_failureCountKey) ?? 0) + 1;
+    final delayMs = min(_baseRetryDelay.inMilliseconds * pow(2, min(failures - 1, 16)).toInt(),
+        _maxRetryDelay.inMilliseconds);
+    await prefs.setInt(_failureCountKey, failures);
+    await prefs.setInt(_nextRetryKey, DateTime.now().millisecondsSinceEpoch + delayMs);
+  }
+
+  /// max(rollout_percentage, 경과 시간에 해당하는 ramp_schedule 비율), 필드가 없으면 100
+  static int _rolloutPercentage(Map<String, dynamic> data) {
+    if (data['rollout_percentage'] == null) return 100;
+    var percentage = data['rollout_percentage'] as int;
+    final startedAt = DateTime.tryParse(data['rollout_started_at'] ?? '');
+    if (startedAt != null) {
+      final elapsedHours = DateTime.now().toUtc().difference(startedAt).inMinutes / 60;
+      for (final step in (data['ramp_schedule'] as List? ?? [])) {
+        if (elapsedHours >= step['after_hours']) {
+          percentage = max(percentage, step['percentage'] as int);
+        }
+      }
+    }
+    return percentage.clamp(0, 100);
+  }
+
   static bool _isNewerVersion(String current, String latest, int currentBuild, int latestBuild) {
     if (current == latest) return latestBuild > currentBuild;
     final currentParts = current.split('.').map(int.parse).toList();
@@ -38,7 +164,8 @@ class UpdateService {
     return latestBuild > currentBuild;
   }
 
-  static void _showUpdateDialog(BuildContext context, String version, String apkUrl) {
+  static void _showUpdateDialog(BuildContext context, Map<String, dynamic> data) {
+    final String version = data['version'];
     showDialog(
       context: context,
       barrierDismissible: false,
@@ -53,7 +180,7 @@ class UpdateService {
           ElevatedButton(
             onPressed: () {
               Navigator.of(ctx).pop();
-              _launchUrl(apkUrl);
+              _startUpdate(context, data);
             },
             child: const Text('업데이트'),
           ),
@@ -62,6 +189,59 @@ class UpdateService {
     );
   }
 
+  /// version.json에 apk_sha256이 있으면 앱에서 내려받아 검증 후 설치, 없으면 브라우저로 링크 열기
+  static Future<void> _startUpdate(BuildContext context, Map<String, dynamic> data) async {
+    final String? expectedSha256 = data['apk_sha256'];
+    final String? downloadUrl = data['apk_download_url'];
+    if (expectedSha256 == null || downloadUrl == null) {
+      _launchUrl(data['apk_url']);
+      return;
+    }
+
+    final messenger = ScaffoldMessenger.maybeOf(context);
+    messenger?.showSnackBar(const SnackBar(content: Text('업데이트 파일을 내려받는 중입니다...')));
+    try {
+      final apk = await downloadVerifiedApk(downloadUrl, expectedSha256, data['apk_size'] as int?);
+      await _installChannel.invokeMethod('installApk', {'path': apk.path});
+    } catch (e) {
+      print('업데이트 설치 실패: $e');
+      messenger?.showSnackBar(const SnackBar(content: Text('업데이트 파일 검증에 실패했습니다. 잠시 후 다시 시도해주세요.')));
+    }
+  }
+
+  /// APK를 스트리밍으로 내려받으면서 SHA-256 계산 (파일 전체를 메모리에 올리지 않음)
+  @visibleForTesting
+  static Future<File> downloadVerifiedApk(String url, String expectedSha256, int? expectedSize,
+      {Directory? directory}) async {
+    directory ??= await getTemporaryDirectory();
+    final file = File('${directory.path}/update.apk');
+    final digest = _DigestSink();
+    final hasher = sha256.startChunkedConversion(digest);
+    final client = clientFactory();
+    final output = file.openWrite();
+    var received = 0;
+    try {
+      final response = await client.send(http.Request('GET', Uri.parse(url)));
+      if (response.statusCode != 200) throw Exception('APK 다운로드 실패 (HTTP ${response.statusCode})');
+      await for (final chunk in response.stream) {
+        hasher.add(chunk);
+        output.add(chunk);
+        received += chunk.length;
+      }
+      hasher.close();
+    } finally {
+      await output.close();
+      client.close();
+    }
+
+    final actual = digest.value.toString();
+    if (actual != expectedSha256.toLowerCase() || (expectedSize != null && received != expectedSize)) {
+      await file.delete();
+      throw Exception('APK 무결성 검증 실패 (sha256 $actual, $received bytes)');
+    }
+    return file;
+  }
+
   static void _launchUrl(String url) async {
     final uri = Uri.parse(url);
     if (await canLaunchUrl(uri)) {
@@ -71,3 +251,14 @@ class UpdateService {
     }
   }
 }
+
+/// startChunkedConversion 결과(Digest)를 받는 Sink
+class _DigestSink implements Sink<Digest> {
+  late Digest value;
+
+  @override
+  void add(Digest data) => value = data;
+
+  @override
+  void close() {}
+}
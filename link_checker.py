@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다운로드 링크 점검
+README.md, releases/README.md, CHANGELOG.md (선택적으로 GitHub 릴리즈 노트)에서
+다운로드 링크를 모두 뽑아 동시에 확인하고, 끊어진 링크와 오래된 링크를 보고합니다.
+
+- 호스트별로 연결을 재사용(keep-alive)하고, 호스트별 토큰 버킷으로 호출 속도를 제한
+- HEAD로 확인하고, HEAD를 거부하는 서버는 Range: bytes=0-0 GET으로 다시 확인
+- 오래된 링크: 최신 표시(📱 APK 다운로드, "(최신)")가 붙은 링크가 현재 배포본 링크와 다른 경우
+- --rewrite: 끊어진 링크와 오래된 링크를 현재 배포본 링크로 교체
+
+현재 배포본 링크는 --current-link, version.json의 apk_url, 아티팩트 저장소의 마지막 배포 이력 순으로 찾습니다.
+
+사용법:
+  python link_checker.py                      # 문서 링크 점검
+  python link_checker.py --github             # GitHub 릴리즈 노트도 점검 (GITHUB_TOKEN 필요)
+  python link_checker.py --rewrite            # 끊어진/오래된 링크를 현재 배포본 링크로 교체
+  python link_checker.py --rate 2 --workers 8 # 호스트별 초당 요청 수, 동시 요청 수
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import threading
+import http.client
+from collections import defaultdict
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+from api_scheduler import ApiScheduler
+from release_lock import atomic_write_text, release_lock
+
+DOC_PATHS = ['README.md', 'releases/README.md', 'CHANGELOG.md']
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 4
+DEFAULT_WORKERS = 16
+REQUEST_TIMEOUT = 15
+MAX_REDIRECTS = 5
+MAX_THROTTLE_RETRIES = 3
+
+LINK_PATTERN = re.compile(r'\[([^\]]*)\]\((https?://[^)\s]+)\)')
+# 최신 배포본을 가리켜야 하는 링크 (README 상단 다운로드 버튼, 다운로드 히스토리의 "(최신)" 항목)
+CURRENT_MARKERS = ('APK 다운로드', '(최신)')
+DOWNLOAD_HOSTS = ('drive.google.com', 'drive.usercontent.google.com', 'docs.google.com')
+
+OK = 'ok'
+DEAD = 'dead'
+DENIED = 'denied'
+ERROR = 'error'
+
+
+class Link:
+    """문서 안의 링크 하나 (같은 URL이 여러 곳에 있으면 위치마다 하나씩)"""
+
+    def __init__(self, url, source, line, current):
+        self.url = url
+        self.source = source
+        self.line = line
+        self.current = current
+
+    @property
+    def location(self):
+        return f"{self.source}:{self.line}" if self.line else self.source
+
+
+def is_download_link(url):
+    parts = urlsplit(url)
+    return (parts.hostname in DOWNLOAD_HOSTS or parts.path.endswith('.apk')
+            or '/releases/download/' in parts.path)
+
+
+def extract_links(text, source):
+    """마크다운 텍스트에서 다운로드 링크 추출"""
+    links = []
+    for number, line in enumerate(text.splitlines(), 1):
+        for match in LINK_PATTERN.finditer(line):
+            url = match.group(2)
+            if is_download_link(url):
+                current = any(marker in line for marker in CURRENT_MARKERS)
+                links.append(Link(url, source, number, current))
+    return links
+
+
+def collect_doc_links(paths=DOC_PATHS):
+    links = []
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"⚠️ 문서가 없습니다: {path}")
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            links.extend(extract_links(f.read(), path))
+    return links
+
+
+def fetch_releases(token):
+    """GitHub 릴리즈 목록 (본문 포함)"""
+    import requests
+    from api_scheduler import NORMAL, get_scheduler
+    from update_github_release import GITHUB_OWNER, GITHUB_REPO
+
+    url = f"https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}/releases?per_page=100"
+    headers = {
+        'Authorization': f'token {token}',
+        'Accept': 'application/vnd.github.v3+json',
+    }
+    try:
+        response = get_scheduler('github').request(lambda: requests.get(url, headers=headers), NORMAL)
+    except Exception as e:
+        print(f"❌ 릴리즈 목록 조회 오류: {e}")
+        return None
+    if response.status_code != 200:
+        print(f"❌ 릴리즈 목록 조회 실패: {response.status_code}")
+        return None
+    return response.json()
+
+
+def collect_release_links(releases):
+    links = []
+    for release in releases:
+        links.extend(extract_links(release.get('body') or '', f"release:{release['tag_name']}"))
+    return links
+
+
+def find_current_link(explicit=None):
+    """
+    현재 배포본 링크 (--current-link, 없으면 version.json과 아티팩트 저장소 배포 이력 중 최근 기록)
+
+    auto_deploy는 version.json을 다시 쓰지 않으므로 일반 배포 뒤에는 배포 이력이 더 최근이고,
+    update_version.py는 배포 이력 없이 version.json만 갱신하므로 두 기록의 시각을 비교합니다.
+    """
+    if explicit:
+        return explicit
+    candidates = []
+    if os.path.exists('version.json'):
+        try:
+            with open('version.json', 'r', encoding='utf-8') as f:
+                link = json.load(f).get('apk_url')
+            if link:
+                candidates.append((os.path.getmtime('version.json'), link))
+        except (OSError, ValueError):
+            pass
+    from artifact_store import INDEX_PATH, load_index
+    if os.path.exists(INDEX_PATH):
+        history = load_index()['history']
+        if history:
+            published_at = datetime.fromisoformat(history[-1]['published_at']).timestamp()
+            candidates.append((published_at, history[-1]['link']))
+    return max(candidates)[1] if candidates else None
+
+
+class ConnectionPool:
+    """호스트별 keep-alive 연결 풀 (스레드 안전)"""
+
+    def __init__(self, timeout=REQUEST_TIMEOUT):
+        self.timeout = timeout
+        self.idle = defaultdict(list)
+        self.lock = threading.Lock()
+
+    def get(self, scheme, netloc):
+        with self.lock:
+            if self.idle[(scheme, netloc)]:
+                return self.idle[(scheme, netloc)].pop()
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def put(self, scheme, netloc, connection):
+        with self.lock:
+            self.idle[(scheme, netloc)].append(connection)
+
+    def close(self):
+        with self.lock:
+            for connections in self.idle.values():
+                for connection in connections:
+                    connection.close()
+            self.idle.clear()
+
+
+class LinkChecker:
+    """링크 상태 확인 (HEAD → Range GET, 리다이렉트 추적, 호스트별 속도 제한)"""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, workers=DEFAULT_WORKERS, timeout=REQUEST_TIMEOUT):
+        self.rate = rate
+        self.burst = burst
+        self.workers = workers
+        self.pool = ConnectionPool(timeout)
+        self.limiters = {}
+        self.limiters_lock = threading.Lock()
+
+    def _limiter(self, host):
+        with self.limiters_lock:
+            if host not in self.limiters:
+                self.limiters[host] = ApiScheduler(f'link:{host}', self.rate, self.burst)
+            return self.limiters[host]
+
+    def _request(self, method, url):
+        """요청 한 번 → (상태 코드, 응답 헤더)"""
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += f'?{parts.query}'
+        headers = {'User-Agent': 'securememo-link-checker'}
+        if method == 'GET':
+            headers['Range'] = 'bytes=0-0'
+
+        limiter = self._limiter(parts.hostname)
+        limiter.acquire()
+        # 재사용한 연결이 서버 쪽에서 이미 닫혔을 수 있으므로 한 번은 새 연결로 재시도
+        for attempt in range(2):
+            connection = self.pool.get(parts.scheme, parts.netloc)
+            try:
+                connection.request(method, path, headers=headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                connection.close()
+                raise
+            break
+
+        # Range를 무시하고 전체 파일을 보내는 서버는 본문을 읽지 않고 연결을 닫음
+        length = response.getheader('Content-Length')
+        if method == 'HEAD' or (length is not None and int(length) <= 64 * 1024):
+            response.read()
+            if response.will_close:
+                connection.close()
+            else:
+                self.pool.put(parts.scheme, parts.netloc, connection)
+        else:
+            connection.close()
+
+        if response.status == 429:
+            retry_after = response.getheader('Retry-After')
+            limiter.throttled(float(retry_after) if retry_after and retry_after.isdigit() else None)
+        else:
+            limiter.succeeded()
+        return response.status, response.headers
+
+    def check(self, url):
+        """
+        링크 하나 확인
+
+        Returns:
+            dict: {'status': ok/dead/denied/error, 'code', 'final_url', 'detail'}
+        """
+        current = url
+        redirects = 0
+        throttled = 0
+        try:
+            while True:
+                code, headers = self._request('HEAD', current)
+                if code in (403, 405, 501):
+                    # HEAD를 지원하지 않는 서버가 많으므로 첫 바이트만 요청해서 다시 확인
+                    code, headers = self._request('GET', current)
+                if code == 429 and throttled < MAX_THROTTLE_RETRIES:
+                    # 호스트 버킷이 속도를 줄이고 Retry-After만큼 멈춘 뒤 다시 확인
+                    throttled += 1
+                    continue
+                if code in (301, 302, 303, 307, 308) and headers.get('Location'):
+                    redirects += 1
+                    if redirects > MAX_REDIRECTS:
+                        return {'status': ERROR, 'code': code, 'final_url': current, 'detail': '리다이렉트가 너무 많음'}
+                    current = urljoin(current, headers['Location'])
+                    continue
+                break
+        except (OSError, http.client.HTTPException) as e:
+            return {'status': ERROR, 'code': None, 'final_url': current, 'detail': str(e) or type(e).__name__}
+
+        if 200 <= code < 300:
+            status = OK
+        elif code in (404, 410):
+            status = DEAD
+        elif code in (401, 403):
+            status = DENIED
+        else:
+            status = ERROR
+        return {'status': status, 'code': code, 'final_url': current, 'detail': f'HTTP {code}'}
+
+    def check_all(self, urls):
+        """중복을 제거한 URL을 동시에 확인 → {url: 결과}"""
+        urls = sorted(set(urls))
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                return dict(zip(urls, executor.map(self.check, urls)))
+        finally:
+            self.pool.close()
+
+
+def find_problems(links, results, current_link=None):
+    """
+    점검 결과에서 문제 링크 추출
+
+    Returns:
+        list: [(Link, 문제 종류, 설명)] (문제 종류: dead, denied, error, stale)
+    """
+    problems = []
+    for link in links:
+        result = results[link.url]
+        if result['status'] != OK:
+            problems.append((link, result['status'], result['detail']))
+        elif current_link and link.current and link.url != current_link:
+            problems.append((link, 'stale', '현재 배포본 링크와 다름'))
+    return problems
+
+
+def rewrite_text(text, problems, current_link):
+    """끊어진 링크(dead, denied)와 오래된 링크를 현재 배포본 링크로 교체 → (새 텍스트, 교체 수)"""
+    targets = {(link.line, link.url) for link, kind, _ in problems if kind in (DEAD, DENIED, 'stale')}
+    lines = text.split('\n')
+    replaced = 0
+    for line, url in targets:
+        if url in lines[line - 1]:
+            lines[line - 1] = lines[line - 1].replace(f']({url})', f']({current_link})')
+            replaced += 1
+    return '\n'.join(lines), replaced
+
+
+def rewrite_docs(problems, current_link):
+    by_source = defaultdict(list)
+    for problem in problems:
+        if not problem[0].source.startswith('release:'):
+            by_source[problem[0].source].append(problem)
+
+    total = 0
+    with release_lock('docs'):
+        for path, items in by_source.items():
+            with open(path, 'r', encoding='utf-8') as f:
+                text, replaced = rewrite_text(f.read(), items, current_link)
+            if replaced:
+                atomic_write_text(path, text)
+                print(f"✏️ {path}: 링크 {replaced}개 교체")
+                total += replaced
+    return total
+
+
+def rewrite_releases(releases, problems, current_link, token):
+    from update_github_release import update_release_body
+
+    by_tag = defaultdict(list)
+    for problem in problems:
+        if problem[0].source.startswith('release:'):
+            by_tag[problem[0].source[len('release:'):]].append(problem)
+
+    total = 0
+    for release in releases:
+        items = by_tag.get(release['tag_name'])
+        if not items:
+            continue
+        body, replaced = rewrite_text(release['body'], items, current_link)
+        if replaced and update_release_body(release['id'], body, token):
+            print(f"✏️ 릴리즈 {release['tag_name']}: 링크 {replaced}개 교체")
+            total += replaced
+    return total
+
+
+def print_report(links, results, problems):
+    counts = defaultdict(int)
+    for result in results.values():
+        counts[result['status']] += 1
+    print(f"🔗 링크 {len(links)}개 (고유 URL {len(results)}개): "
+          f"정상 {counts[OK]}, 끊어짐 {counts[DEAD]}, 권한 없음 {counts[DENIED]}, 확인 실패 {counts[ERROR]}")
+
+    icons = {DEAD: '❌', DENIED: '🔒', ERROR: '⚠️', 'stale': '🕰️'}
+    for link, kind, detail in problems:
+        print(f"  {icons[kind]} {link.location}  {link.url}  ({detail})")
+    if not problems:
+        print("✅ 문제 있는 링크 없음")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='다운로드 링크 점검')
+    parser.add_argument('paths', nargs='*', default=DOC_PATHS, help='점검할 문서 (기본: README, CHANGELOG)')
+    parser.add_argument('--github', action='store_true', help='GitHub 릴리즈 노트도 점검')
+    parser.add_argument('--rewrite', action='store_true', help='끊어진/오래된 링크를 현재 배포본 링크로 교체')
+    parser.add_argument('--current-link', help='현재 배포본 링크 (기본: version.json 또는 배포 이력)')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='호스트별 초당 요청 수')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='동시 요청 수')
+    args = parser.parse_args()
+
+    links = collect_doc_links(args.paths)
+    releases, token = [], None
+    if args.github:
+        from update_github_release import get_github_token
+        token = get_github_token()
+        releases = fetch_releases(token)
+        if releases is None:
+            return False
+        links.extend(collect_release_links(releases))
+    if not links:
+        print("📭 점검할 다운로드 링크가 없습니다.")
+        return True
+
+    current_link = find_current_link(args.current_link)
+    if not current_link:
+        print("⚠️ 현재 배포본 링크를 찾을 수 없어 오래된 링크는 확인하지 않습니다. (--current-link로 지정)")
+
+    results = LinkChecker(rate=args.rate, workers=args.workers).check_all(link.url for link in links)
+    problems = find_problems(links, results, current_link)
+    print_report(links, results, problems)
+
+    if args.rewrite and problems:
+        if not current_link:
+            print("❌ 교체할 현재 배포본 링크가 없습니다.")
+            return False
+        replaced = rewrite_docs(problems, current_link)
+        if releases:
+            replaced += rewrite_releases(releases, problems, current_link, token)
+        print(f"✅ 링크 {replaced}개를 현재 배포본 링크로 교체했습니다.")
+        return True
+
+    # 일시적인 확인 실패(네트워크, 5xx)는 실패로 보지 않음
+    return not any(kind in (DEAD, DENIED, 'stale') for _, kind, _ in problems)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+릴리즈 사전 점검 (flutter analyze + flutter test)
+릴리즈 빌드와 동시에 정적 분석과 테스트를 실행하고,
+점검이 하나라도 실패하면 즉시 빌드를 중단하여 업로드까지 진행되지 않도록 합니다.
+분석은 가능하면 이전 릴리즈 태그 이후 변경된 Dart 파일로 한정합니다.
+
+사용법:
+  python preflight.py            # 점검만 실행 (이전 태그 이후 변경 파일 분석 + 테스트)
+  python preflight.py --all      # 프로젝트 전체 분석
+"""
+
+import os
+import sys
+import time
+import shlex
+import signal
+import argparse
+import subprocess
+
+import changelog_gen
+
+PREFLIGHT_DIR = os.path.join('.deploy', 'preflight')
+POLL_SECONDS = 0.5
+LOG_TAIL_LINES = 30
+
+
+def _join_command(args):
+    return subprocess.list2cmdline(args) if os.name == 'nt' else shlex.join(args)
+
+
+def changed_dart_files(base=None):
+    """
+    이전 릴리즈 태그 이후 변경된(작업 트리 포함) Dart 파일 목록
+
+    Returns:
+        list: 변경 파일 목록, 기준 태그가 없으면 None (전체 분석)
+    """
+    base = base or changelog_gen.find_previous_tag()
+    if not base:
+        return None
+    paths = set()
+    for rev_args in ([f'{base}..HEAD'], ['HEAD']):
+        result = subprocess.run(['git', 'diff', '--name-only', '--diff-filter=d', *rev_args, '--', '*.dart'],
+                                capture_output=True, text=True, encoding='utf-8')
+        if result.returncode != 0:
+            return None
+        paths.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return sorted(path for path in paths if os.path.exists(path))
+
+
+def start_process(name, command, log_path=None):
+    """명령을 별도 프로세스 그룹으로 시작 (중단할 때 자식 프로세스까지 함께 종료)"""
+    print(f"🔧 [{name}] 실행: {command}")
+    output = open(log_path, 'w', encoding='utf-8') if log_path else None
+    kwargs = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == 'nt' else {'start_new_session': True}
+    process = subprocess.Popen(command, shell=True, stdout=output, stderr=subprocess.STDOUT if output else None,
+                               **kwargs)
+    process.name = name
+    process.log_path = log_path
+    process.log_file = output
+    return process
+
+
+def stop_process(process):
+    """프로세스와 자식 프로세스 종료"""
+    if process.poll() is not None:
+        return
+    if os.name == 'nt':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], capture_output=True)
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _close_log(process):
+    if process.log_file:
+        process.log_file.close()
+        process.log_file = None
+
+
+def _print_log_tail(process):
+    if not process.log_path or not os.path.exists(process.log_path):
+        return
+    with open(process.log_path, 'r', encoding='utf-8', errors='replace') as f:
+        lines = f.readlines()[-LOG_TAIL_LINES:]
+    print(f"----- {process.name} 로그 ({process.log_path}) -----")
+    print(''.join(lines).rstrip())
+    print('-' * 40)
+
+
+def start_checks(analyze_all=False):
+    """분석/테스트 프로세스 시작 (pub get 이후 호출)"""
+    os.makedirs(PREFLIGHT_DIR, exist_ok=True)
+    checks = []
+
+    files = None if analyze_all else changed_dart_files()
+    if files is None:
+        checks.append(start_process('analyze', 'flutter analyze --no-pub',
+                                    os.path.join(PREFLIGHT_DIR, 'analyze.log')))
+    elif files:
+        print(f"🔍 이전 릴리즈 이후 변경된 Dart 파일 {len(files)}개 분석")
+        checks.append(start_process('analyze', _join_command(['flutter', 'analyze', '--no-pub', *files]),
+                                    os.path.join(PREFLIGHT_DIR, 'analyze.log')))
+    else:
+        print("⏭️ 이전 릴리즈 이후 변경된 Dart 파일이 없어 분석 건너뛰기")
+
+    if os.path.isdir('test'):
+        checks.append(start_process('test', 'flutter test --no-pub',
+                                    os.path.join(PREFLIGHT_DIR, 'test.log')))
+    else:
+        print("⏭️ test/ 디렉터리가 없어 테스트 건너뛰기")
+    return checks
+
+
+def run_with_checks(build_command=None, analyze_all=False):
+    """
+    사전 점검과 빌드를 동시에 실행
+
+    점검이 실패하면 빌드를 즉시 중단하고 False 반환,
+    빌드와 모든 점검이 성공해야 True 반환
+    """
+    started = time.monotonic()
+    checks = start_checks(analyze_all)
+    build = start_process('build', build_command) if build_command else None
+    pending = list(checks)
+    success = True
+
+    try:
+        while pending or (build and build.poll() is None):
+            for check in list(pending):
+                code = check.poll()
+                if code is None:
+                    continue
+                pending.remove(check)
+                _close_log(check)
+                if code == 0:
+                    print(f"✅ [{check.name}] 통과 ({time.monotonic() - started:.0f}초)")
+                else:
+                    print(f"❌ [{check.name}] 실패 (종료 코드 {code})")
+                    _print_log_tail(check)
+                    success = False
+            if not success:
+                break
+            if build and build.poll() is not None and build.returncode != 0:
+                print(f"❌ [build] 실패 (종료 코드 {build.returncode})")
+                success = False
+                break
+            time.sleep(POLL_SECONDS)
+    finally:
+        # 실패했거나 중단된 경우 남은 프로세스 정리
+        for process in pending + ([build] if build else []):
+            if process.poll() is None:
+                print(f"🛑 [{process.name}] 중단")
+                stop_process(process)
+            _close_log(process)
+
+    if success:
+        print(f"✅ 사전 점검 통과 ({time.monotonic() - started:.0f}초)")
+    else:
+        print("❌ 사전 점검 실패: 빌드와 업로드를 중단합니다.")
+    return success
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='릴리즈 사전 점검 (analyze + test)')
+    parser.add_argument('--all', action='store_true', help='변경 파일이 아닌 프로젝트 전체 분석')
+    args = parser.parse_args()
+    return run_with_checks(analyze_all=args.all)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 pub 패키지 미러/캐시
+빌드마다 pub.dev에 의존성을 해석하지 않도록 pubspec.lock에 고정된 hosted 패키지를
+.deploy/pub/mirror에 미리 받아 두고, 로컬 hosted 저장소(PUB_HOSTED_URL)로 pub에 제공합니다.
+패키지 압축 해제본은 파이프라인 전용 PUB_CACHE(.deploy/pub/cache)에 둡니다.
+
+pubspec.yaml/pubspec.lock이 이전 해석 때와 같고 캐시된 패키지가 모두 남아 있으면
+pub get 자체를 건너뛰므로 오프라인에서도 바로 빌드할 수 있습니다.
+
+사용법:
+  python pub_cache.py status      # 해석 필요 여부와 미러 상태 확인
+  python pub_cache.py populate    # pubspec.lock 기준으로 미러 채우기
+  python pub_cache.py get         # 필요할 때만 미러를 통해 pub get
+  python pub_cache.py serve       # 미러 서버만 실행 (수동 pub get 용)
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import subprocess
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from release_lock import atomic_write_text
+
+PUB_DIR = os.path.join('.deploy', 'pub')
+MIRROR_DIR = os.path.join(PUB_DIR, 'mirror')
+PUB_CACHE_DIR = os.path.join(PUB_DIR, 'cache')
+STATE_PATH = os.path.join(PUB_DIR, 'state.json')
+LOCK_PATH = 'pubspec.lock'
+PACKAGE_CONFIG_PATH = os.path.join('.dart_tool', 'package_config.json')
+
+UPSTREAM_URL = os.environ.get('PUB_UPSTREAM_URL', 'https://pub.dev')
+# PUB_CACHE의 hosted 디렉터리 이름에 포트가 포함되므로 고정 포트 사용
+MIRROR_PORT = int(os.environ.get('PUB_MIRROR_PORT', '8766'))
+PUB_API_TYPE = 'application/vnd.pub.v2+json'
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_TIMEOUT = 30
+
+
+def read_lock_packages(path=LOCK_PATH):
+    """
+    pubspec.lock의 packages 항목 파싱 (pub이 생성하는 고정 형식만 처리)
+
+    Returns:
+        list: [{'name', 'version', 'source', 'sha256', 'url', ...}]
+    """
+    packages = []
+    current = None
+    in_packages = False
+    with open(path, 'r', encoding='utf-8') as f:
+        for raw in f:
+            line = raw.rstrip('\n')
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            indent = len(line) - len(line.lstrip(' '))
+            key, _, value = line.strip().partition(':')
+            value = value.strip().strip('"')
+            if indent == 0:
+                in_packages = key == 'packages'
+                current = None
+            elif not in_packages:
+                continue
+            elif indent == 2:
+                current = {'name': key}
+                packages.append(current)
+            elif current is not None and value:
+                # description 하위 항목(sha256, url)도 같은 dict에 펼쳐서 저장
+                current.setdefault(key, value)
+    return packages
+
+
+def hosted_packages(path=LOCK_PATH):
+    """hosted 소스 패키지만 반환 (sdk/git/path 패키지는 미러 대상이 아님)"""
+    return [package for package in read_lock_packages(path)
+            if package.get('source') == 'hosted' and package.get('version')]
+
+
+def archive_path(name, version):
+    return os.path.join(MIRROR_DIR, name, f'{version}.tar.gz')
+
+
+def metadata_path(name, version):
+    return os.path.join(MIRROR_DIR, name, f'{version}.json')
+
+
+def is_mirrored(name, version):
+    return os.path.exists(archive_path(name, version)) and os.path.exists(metadata_path(name, version))
+
+
+def _open_url(url, accept=PUB_API_TYPE):
+    request = urllib.request.Request(url, headers={'Accept': accept, 'User-Agent': 'securememo-pub-mirror'})
+    return urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT)
+
+
+def mirror_package(package, upstream=UPSTREAM_URL):
+    """패키지 한 버전의 메타데이터와 압축 파일을 미러에 저장 (sha256 검증)"""
+    name, version = package['name'], package['version']
+    base_url = package.get('url') or upstream
+    with _open_url(f"{base_url.rstrip('/')}/api/packages/{name}/versions/{version}") as response:
+        metadata = json.load(response)
+
+    expected = package.get('sha256') or metadata.get('archive_sha256')
+    target = archive_path(name, version)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp_path = f'{target}.part'
+    digest = hashlib.sha256()
+    try:
+        with _open_url(metadata['archive_url'], accept='*/*') as response, open(tmp_path, 'wb') as f:
+            while True:
+                block = response.read(1024 * 1024)
+                if not block:
+                    break
+                digest.update(block)
+                f.write(block)
+        if expected and digest.hexdigest() != expected:
+            raise ValueError(f"sha256 불일치 ({digest.hexdigest()} != {expected})")
+        os.replace(tmp_path, target)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    record = {'version': version, 'pubspec': metadata.get('pubspec', {}), 'archive_sha256': digest.hexdigest()}
+    atomic_write_text(metadata_path(name, version), json.dumps(record, ensure_ascii=False, indent=2))
+
+
+def populate(lock_path=LOCK_PATH, upstream=UPSTREAM_URL):
+    """
+    pubspec.lock에 고정된 hosted 패키지 중 미러에 없는 것만 내려받기
+
+    Returns:
+        list: 내려받지 못한 패키지 이름 목록 (오프라인이면 미러에 있는 것만으로 진행)
+    """
+    missing = [package for package in hosted_packages(lock_path)
+               if not is_mirrored(package['name'], package['version'])]
+    if not missing:
+        print("✅ pub 미러 최신 상태 (내려받을 패키지 없음)")
+        return []
+
+    print(f"📥 pub 미러 채우기: {len(missing)}개 패키지")
+    started = time.monotonic()
+    failed = []
+
+    def fetch(package):
+        try:
+            mirror_package(package, upstream)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ {package['name']} {package['version']} 내려받기 실패: {e}")
+            failed.append(f"{package['name']}@{package['version']}")
+            return e
+        return None
+
+    # 첫 패키지로 연결을 확인하고, 오프라인이면 나머지는 시도하지 않음
+    error = fetch(missing[0])
+    if isinstance(error, urllib.error.URLError) and not isinstance(error, urllib.error.HTTPError):
+        print(f"⚠️ {upstream}에 연결할 수 없어 미러에 있는 패키지만 사용합니다.")
+        return [f"{package['name']}@{package['version']}" for package in missing]
+
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        list(executor.map(fetch, missing[1:]))
+
+    print(f"✅ pub 미러 갱신: {len(missing) - len(failed)}개 완료, {len(failed)}개 실패 "
+          f"({time.monotonic() - started:.1f}초)")
+    return failed
+
+
+def _version_key(version):
+    """정렬용 버전 키 (사전 배포 버전은 정식 버전보다 낮게)"""
+    core, _, prerelease = version.partition('+')[0].partition('-')
+    numbers = [int(part) if part.isdigit() else 0 for part in core.split('.')]
+    return numbers, prerelease == '', prerelease
+
+
+class MirrorHandler(BaseHTTPRequestHandler):
+    """pub hosted 저장소 API 중 pub get에 필요한 부분만 제공"""
+
+    def do_GET(self):
+        parts = urllib.parse.urlparse(self.path).path.strip('/').split('/')
+        if len(parts) == 3 and parts[:2] == ['api', 'packages']:
+            self._send_listing(parts[2])
+        elif len(parts) == 4 and parts[0] == 'packages' and parts[2] == 'versions' \
+                and parts[3].endswith('.tar.gz'):
+            self._send_archive(parts[1], parts[3][:-len('.tar.gz')])
+        else:
+            self.send_error(404)
+
+    def _send_listing(self, name):
+        directory = os.path.join(MIRROR_DIR, name)
+        if not os.path.isdir(directory):
+            self.send_error(404, f'{name} is not mirrored')
+            return
+        versions = []
+        for file_name in os.listdir(directory):
+            if not file_name.endswith('.json'):
+                continue
+            version = file_name[:-len('.json')]
+            if not os.path.exists(archive_path(name, version)):
+                continue
+            with open(os.path.join(directory, file_name), 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            record['archive_url'] = f"{self.server.base_url}/packages/{name}/versions/{version}.tar.gz"
+            versions.append(record)
+        if not versions:
+            self.send_error(404, f'{name} is not mirrored')
+            return
+        versions.sort(key=lambda record: _version_key(record['version']))
+        body = json.dumps({'name': name, 'latest': versions[-1], 'versions': versions}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', PUB_API_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_archive(self, name, version):
+        path = archive_path(name, version)
+        if not os.path.exists(path):
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(os.path.getsize(path)))
+        self.end_headers()
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(1024 * 1024)
+                if not block:
+                    break
+                self.wfile.write(block)
+
+    def log_message(self, format, *args):
+        # pub get 출력에 요청 로그가 섞이지 않도록 생략
+        pass
+
+
+def start_mirror(port=MIRROR_PORT):
+    """백그라운드 스레드에서 미러 서버 시작 (server.shutdown()으로 종료)"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), MirrorHandler)
+    server.daemon_threads = True
+    server.base_url = f'http://127.0.0.1:{port}'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def fingerprint(lock_path=LOCK_PATH):
+    """pubspec.yaml + pubspec.lock 내용 해시"""
+    digest = hashlib.sha256()
+    for path in ('pubspec.yaml', lock_path):
+        digest.update(path.encode('utf-8') + b'\0')
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _load_state():
+    try:
+        with open(STATE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _missing_package_roots():
+    """package_config.json이 가리키는 패키지 디렉터리 중 사라진 것 (캐시가 지워졌는지 확인)"""
+    try:
+        with open(PACKAGE_CONFIG_PATH, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return None
+    missing = []
+    for package in config.get('packages', []):
+        uri = urllib.parse.urlparse(package.get('rootUri', ''))
+        if uri.scheme == 'file' and not os.path.isdir(urllib.request.url2pathname(uri.path)):
+            missing.append(package.get('name'))
+    return missing
+
+
+def resolution_needed(lock_path=LOCK_PATH):
+    """
+    pub get이 필요한지 확인
+
+    Returns:
+        str: 필요한 이유, 건너뛰어도 되면 None
+    """
+    if not os.path.exists(lock_path):
+        return 'pubspec.lock 없음'
+    if _load_state().get('fingerprint') != fingerprint(lock_path):
+        return 'pubspec.yaml/pubspec.lock 변경'
+    missing = _missing_package_roots()
+    if missing is None:
+        return f'{PACKAGE_CONFIG_PATH} 없음'
+    if missing:
+        return f"캐시에서 패키지 {len(missing)}개 누락 ({', '.join(missing[:3])})"
+    return None
+
+
+def pub_env(mirror_url=None):
+    """파이프라인 전용 PUB_CACHE(와 미러 주소)를 설정한 환경 변수"""
+    env = dict(os.environ, PUB_CACHE=os.path.abspath(PUB_CACHE_DIR))
+    if mirror_url:
+        env['PUB_HOSTED_URL'] = mirror_url
+    return env
+
+
+def _restore_lock_urls(original, lock_path=LOCK_PATH):
+    """pub이 hosted url만 미러 주소로 바꿔 썼다면 원래 pubspec.lock으로 되돌림"""
+    with open(lock_path, 'r', encoding='utf-8') as f:
+        current = f.read()
+    if current == original:
+        return
+
+    def without_urls(text):
+        return [line for line in text.splitlines() if not line.strip().startswith('url:')]
+
+    if without_urls(current) == without_urls(original):
+        atomic_write_text(lock_path, original)
+
+
+def _run_pub_get(env):
+    print("🔧 실행: flutter pub get")
+    try:
+        return subprocess.run('flutter pub get', shell=True, env=env).returncode == 0
+    except OSError as e:
+        print(f"❌ flutter pub get 실행 실패: {e}")
+        return False
+
+
+def ensure_dependencies(lock_path=LOCK_PATH, force=False, upstream=UPSTREAM_URL):
+    """
+    필요할 때만 로컬 미러를 통해 flutter pub get 실행
+
+    미러로 해석하지 못하면(새 의존성 추가 등) pub.dev로 직접 해석합니다.
+    성공하면 True, 이후 flutter build는 --no-pub으로 실행해야 합니다.
+    """
+    reason = 'force' if force else resolution_needed(lock_path)
+    if not reason:
+        print("⏭️ pubspec.lock과 pub 캐시가 그대로여서 의존성 해석 건너뛰기")
+        return True
+    print(f"📦 의존성 해석 필요: {reason}")
+
+    os.makedirs(PUB_CACHE_DIR, exist_ok=True)
+    original_lock = None
+    if os.path.exists(lock_path):
+        with open(lock_path, 'r', encoding='utf-8') as f:
+            original_lock = f.read()
+        populate(lock_path, upstream)
+
+    success = False
+    server = None
+    if original_lock is not None:
+        try:
+            server = start_mirror()
+        except OSError as e:
+            print(f"⚠️ pub 미러 서버 시작 실패: {e}")
+    if server:
+        try:
+            success = _run_pub_get(pub_env(server.base_url))
+        finally:
+            server.shutdown()
+            server.server_close()
+            _restore_lock_urls(original_lock, lock_path)
+
+    if not success:
+        print("⚠️ 로컬 미러로 해석 실패, pub.dev로 직접 해석합니다.")
+        if not _run_pub_get(pub_env()):
+            return False
+        # 새로 고정된 패키지는 다음 빌드부터 미러에서 제공
+        try:
+            populate(lock_path, upstream)
+        except OSError as e:
+            print(f"⚠️ pub 미러 갱신 실패: {e}")
+
+    os.makedirs(PUB_DIR, exist_ok=True)
+    atomic_write_text(STATE_PATH, json.dumps({
+        'fingerprint': fingerprint(lock_path),
+        'resolved_at': datetime.now().isoformat(timespec='seconds'),
+    }, indent=2))
+    return True
+
+
+def print_status(lock_path=LOCK_PATH):
+    packages = hosted_packages(lock_path)
+    mirrored = sum(1 for package in packages if is_mirrored(package['name'], package['version']))
+    size = 0
+    for root, _, files in os.walk(MIRROR_DIR):
+        size += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    print(f"📦 hosted 패키지: {len(packages)}개, 미러 보유: {mirrored}개 ({size / 1024 / 1024:.1f}MB)")
+    print(f"📁 미러: {MIRROR_DIR}, PUB_CACHE: {PUB_CACHE_DIR}")
+    reason = resolution_needed(lock_path)
+    print(f"🔍 의존성 해석: {'필요 (' + reason + ')' if reason else '불필요 (캐시 사용)'}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='로컬 pub 패키지 미러/캐시')
+    parser.add_argument('command', nargs='?', default='status', choices=['status', 'populate', 'get', 'serve'])
+    parser.add_argument('--force', action='store_true', help='get: 변경이 없어도 다시 해석')
+    parser.add_argument('--port', type=int, default=MIRROR_PORT, help='serve: 미러 서버 포트')
+    args = parser.parse_args()
+
+    if args.command != 'serve' and not os.path.exists(LOCK_PATH):
+        print(f"❌ {LOCK_PATH}을 찾을 수 없습니다.")
+        return False
+
+    if args.command == 'status':
+        print_status()
+        return True
+    if args.command == 'populate':
+        return not populate()
+    if args.command == 'get':
+        return ensure_dependencies(force=args.force)
+
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), MirrorHandler)
+    server.base_url = f'http://127.0.0.1:{args.port}'
+    print(f"🌐 pub 미러 서버 실행: {server.base_url}")
+    print(f"💡 PUB_HOSTED_URL={server.base_url} PUB_CACHE={os.path.abspath(PUB_CACHE_DIR)} flutter pub get")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 미러 서버 종료")
+    finally:
+        server.server_close()
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+APK 배포 저장소(퍼블리셔) 모음
+Google Drive 외에 로컬 디렉터리, S3 호환 스토리지(AWS S3, MinIO 등)로 APK를 배포하고
+여러 저장소에 동시에 올릴 수 있습니다.
+
+배포 대상 표기:
+  drive                          Google Drive (SecureMemo_APK 폴더, README.md 링크 갱신)
+  local:/srv/www/apk             로컬(또는 마운트된) 디렉터리
+  s3://bucket/prefix             S3 호환 스토리지 (병렬 멀티파트 업로드)
+
+S3 설정 (환경변수):
+  S3_ENDPOINT_URL       MinIO 등 S3 호환 서버 주소 (예: http://127.0.0.1:9000)
+  S3_PUBLIC_BASE_URL    다운로드 링크 기준 주소 (기본: {endpoint}/{bucket})
+  LOCAL_PUBLIC_BASE_URL 로컬 디렉터리 배포 시 다운로드 링크 기준 주소
+  AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY / AWS_DEFAULT_REGION
+"""
+
+import os
+import abc
+import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# 멀티파트 업로드 설정 (S3는 마지막 파트를 제외하고 최소 5MB)
+S3_PART_SIZE = 16 * 1024 * 1024
+S3_MAX_WORKERS = 8
+
+
+def apk_file_name(version):
+    return f"SecureMemo_v{version}.apk" if version else "SecureMemo_latest.apk"
+
+
+class Publisher(abc.ABC):
+    """배포 저장소 공통 인터페이스"""
+
+    name = 'publisher'
+
+    @abc.abstractmethod
+    def publish(self, path, version=None):
+        """
+        APK를 배포하고 결과 반환
+
+        Returns:
+            dict: backend, file_name, url, size (실패 시 예외 발생)
+        """
+
+
+class DrivePublisher(Publisher):
+    """Google Drive 배포 (google_drive_uploader.publish_apk 사용)"""
+
+    name = 'drive'
+
+    def __init__(self, uploader=None):
+        self.uploader = uploader
+
+    def publish(self, path, version=None):
+        from google_drive_uploader import GoogleDriveUploader, publish_apk
+
+        self.uploader = self.uploader or GoogleDriveUploader()
+        # 버전별 APK와 함께 SecureMemo_latest.apk도 제자리 교체 (파일 ID가 유지되는 고정 다운로드 링크)
+        result = publish_apk(path, version, uploader=self.uploader, publish_latest=True)
+        if not result:
+            raise RuntimeError("Google Drive 업로드 실패")
+        return dict(result, backend=self.name, url=result['link'])
+
+
+class LocalDirPublisher(Publisher):
+    """로컬 디렉터리 배포 (정적 웹 서버 문서 루트 등)"""
+
+    name = 'local'
+
+    def __init__(self, directory, public_base_url=None):
+        self.directory = directory
+        self.public_base_url = public_base_url or os.environ.get('LOCAL_PUBLIC_BASE_URL')
+
+    def publish(self, path, version=None):
+        file_name = apk_file_name(version)
+        os.makedirs(self.directory, exist_ok=True)
+        target = os.path.join(self.directory, file_name)
+        # 복사 도중의 파일이 제공되지 않도록 임시 파일에 쓴 뒤 교체
+        shutil.copyfile(path, f'{target}.tmp')
+        os.replace(f'{target}.tmp', target)
+
+        if self.public_base_url:
+            url = f"{self.public_base_url.rstrip('/')}/{file_name}"
+        else:
+            url = 'file://' + os.path.abspath(target).replace(os.sep, '/')
+        return {'backend': self.name, 'file_name': file_name, 'url': url,
+                'size': os.path.getsize(target)}
+
+
+class S3Publisher(Publisher):
+    """S3 호환 스토리지 배포 (파트를 병렬로 올리는 멀티파트 업로드)"""
+
+    name = 's3'
+
+    def __init__(self, bucket, prefix='', endpoint_url=None, public_base_url=None,
+                 part_size=S3_PART_SIZE, max_workers=S3_MAX_WORKERS, client=None):
+        self.bucket = bucket
+        self.prefix = prefix.strip('/')
+        self.endpoint_url = endpoint_url or os.environ.get('S3_ENDPOINT_URL')
+        self.public_base_url = public_base_url or os.environ.get('S3_PUBLIC_BASE_URL')
+        self.part_size = part_size
+        self.max_workers = max_workers
+        # client: 이미 만든 S3 클라이언트 (테스트용 대역 등), 없으면 boto3로 생성
+        self.client = client or self._create_client()
+
+    def _create_client(self):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError:
+            raise RuntimeError("boto3가 설치되지 않았습니다. 'pip install boto3'로 설치하세요.")
+        # boto3 클라이언트는 스레드 간 공유 가능 (커넥션 풀 크기를 작업자 수에 맞춤)
+        return boto3.client('s3', endpoint_url=self.endpoint_url,
+                            config=Config(max_pool_connections=self.max_workers))
+
+    def _key(self, file_name):
+        return f'{self.prefix}/{file_name}' if self.prefix else file_name
+
+    def _url(self, key):
+        if self.public_base_url:
+            return f"{self.public_base_url.rstrip('/')}/{key}"
+        if self.endpoint_url:
+            return f"{self.endpoint_url.rstrip('/')}/{self.bucket}/{key}"
+        return f"https://{self.bucket}.s3.amazonaws.com/{key}"
+
+    def _upload_part(self, path, key, upload_id, part_number, offset, length):
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            body = f.read(length)
+        response = self.client.upload_part(Bucket=self.bucket, Key=key, UploadId=upload_id,
+                                           PartNumber=part_number, Body=body)
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+    def publish(self, path, version=None):
+        file_name = apk_file_name(version)
+        key = self._key(file_name)
+        size = os.path.getsize(path)
+        content_type = 'application/vnd.android.package-archive'
+        started = time.monotonic()
+
+        if size <= self.part_size:
+            with open(path, 'rb') as f:
+                self.client.put_object(Bucket=self.bucket, Key=key, Body=f, ContentType=content_type)
+        else:
+            upload = self.client.create_multipart_upload(Bucket=self.bucket, Key=key,
+                                                         ContentType=content_type)
+            upload_id = upload['UploadId']
+            ranges = [(number, offset, min(self.part_size, size - offset))
+                      for number, offset in enumerate(range(0, size, self.part_size), start=1)]
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    parts = list(executor.map(
+                        lambda r: self._upload_part(path, key, upload_id, *r), ranges))
+                self.client.complete_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id,
+                                                      MultipartUpload={'Parts': parts})
+            except Exception:
+                # 실패한 멀티파트 업로드는 중단하여 조각이 저장소에 남지 않도록 함
+                self.client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+                raise
+
+        seconds = time.monotonic() - started
+        print(f"🪣 S3 업로드 완료: s3://{self.bucket}/{key} "
+              f"({size / 1024 / 1024:.1f}MB, {size / max(seconds, 1e-9) / 1024 / 1024:.1f}MB/s)")
+        return {'backend': self.name, 'file_name': file_name, 'url': self._url(key), 'size': size}
+
+
+def create_publisher(target, uploader=None):
+    """배포 대상 표기(drive, local:경로, s3://버킷/접두어)로 퍼블리셔 생성"""
+    if target == 'drive':
+        return DrivePublisher(uploader)
+    if target.startswith('local:'):
+        return LocalDirPublisher(target[len('local:'):])
+    if target.startswith('s3://'):
+        bucket, _, prefix = target[len('s3://'):].partition('/')
+        return S3Publisher(bucket, prefix)
+    raise ValueError(f"알 수 없는 배포 대상: {target}")
+
+
+def publish_all(targets, path, version=None, uploader=None):
+    """
+    여러 저장소에 동시에 배포
+
+    Returns:
+        dict: {배포 대상: 결과 dict 또는 None(실패)}
+    """
+    def publish_one(target):
+        try:
+            result = create_publisher(target, uploader).publish(path, version)
+            print(f"✅ [{target}] 배포 완료: {result['url']}")
+            return result
+        except Exception as e:
+            print(f"❌ [{target}] 배포 실패: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(len(targets), 1)) as executor:
+        return dict(zip(targets, executor.map(publish_one, targets)))
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+릴리즈 커밋용 Git 플러밍 도구
+파이프라인이 실제로 수정한 파일만 임시 인덱스에 올려 커밋하고,
+태그를 만든 뒤 브랜치와 태그를 한 번의 원자적 push로 올립니다.
+`git add .`처럼 작업 트리 전체를 스캔하지 않으므로 빌드 산출물이 많은 체크아웃에서도 빠르고,
+의도하지 않은 파일이 릴리즈 커밋에 섞이지 않습니다.
+"""
+
+import os
+import subprocess
+import tempfile
+
+from release_lock import release_lock
+
+
+class GitError(Exception):
+    """Git 명령 실패"""
+
+
+def _git(*args, env=None, input_text=None):
+    """셸을 거치지 않고 git 실행 후 표준 출력 반환"""
+    result = subprocess.run(['git', *args], capture_output=True, text=True, encoding='utf-8',
+                            env=env, input=input_text)
+    if result.returncode != 0:
+        raise GitError(f"git {' '.join(args)}: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def snapshot_file(path):
+    """
+    파일의 현재 내용을 Git 객체로 저장하고 blob SHA 반환 (파일이 없으면 None)
+
+    파일을 쓴 잠금 안에서 호출해 두면, 그 뒤 동시 배포가 같은 파일을 고쳐도
+    릴리즈 커밋에는 이 배포가 쓴 내용이 들어갑니다.
+    """
+    if not os.path.exists(path):
+        return None
+    return _git('hash-object', '-w', '--', path)
+
+
+def _stage(paths, snapshots, env=None):
+    """인덱스에 파일 반영 (스냅숏이 있으면 그 blob, 없으면 작업 트리의 현재 내용)"""
+    live = [path for path in paths if not snapshots.get(path)]
+    if live:
+        _git('update-index', '--add', '--remove', '--', *live, env=env)
+    for path in paths:
+        if snapshots.get(path):
+            _git('update-index', '--add', '--cacheinfo', f'100644,{snapshots[path]},{path}', env=env)
+
+
+def create_commit(paths, message, snapshots=None):
+    """
+    지정한 파일만 담은 커밋 객체 생성 (브랜치와 HEAD는 아직 옮기지 않음)
+
+    사용자가 따로 스테이징해 둔 변경은 임시 인덱스를 사용하므로 커밋에 포함되지 않습니다.
+    snapshots({경로: blob SHA})에 있는 파일은 작업 트리를 다시 읽지 않고 스냅숏 내용으로 커밋합니다.
+
+    Returns:
+        tuple: (새 커밋 SHA, 부모 커밋 SHA)
+    """
+    paths = sorted(set(paths))
+    if not paths:
+        raise GitError("커밋할 파일이 없습니다.")
+
+    parent = _git('rev-parse', 'HEAD')
+    fd, index_path = tempfile.mkstemp(prefix='release-index-')
+    os.close(fd)
+    try:
+        env = dict(os.environ, GIT_INDEX_FILE=index_path)
+        # HEAD 트리에서 시작해 수정된 파일만 갱신 (삭제된 파일은 --remove로 제거)
+        _git('read-tree', parent, env=env)
+        _stage(paths, snapshots or {}, env=env)
+        tree = _git('write-tree', env=env)
+    finally:
+        os.remove(index_path)
+
+    if tree == _git('rev-parse', f'{parent}^{{tree}}'):
+        raise GitError("커밋할 변경사항이 없습니다.")
+
+    commit = _git('commit-tree', tree, '-p', parent, '-F', '-', input_text=message)
+    return commit, parent
+
+
+def advance_head(commit, parent, paths, message, snapshots=None):
+    """현재 브랜치를 create_commit으로 만든 커밋으로 이동"""
+    # 다른 프로세스가 그 사이 HEAD를 옮겼다면 실패하도록 기존 값 확인
+    _git('update-ref', '-m', f'commit: {message.splitlines()[0]}', 'HEAD', commit, parent)
+    # 실제 인덱스도 커밋한 내용과 맞춰 git status가 깨끗하게 보이도록 함
+    _stage(sorted(set(paths)), snapshots or {})
+
+
+def commit_files(paths, message, snapshots=None):
+    """
+    지정한 파일만 담은 커밋을 만들고 현재 브랜치를 그 커밋으로 이동
+
+    Returns:
+        str: 새 커밋 SHA
+    """
+    commit, parent = create_commit(paths, message, snapshots)
+    advance_head(commit, parent, paths, message, snapshots)
+    return commit
+
+
+def create_tag(tag_name, message, commit='HEAD'):
+    """주석(annotated) 태그 생성"""
+    _git('tag', '-a', tag_name, '-m', message, commit)
+    return tag_name
+
+
+def tag_commit(tag_name):
+    """태그가 가리키는 커밋 SHA, 태그가 없으면 None"""
+    try:
+        return _git('rev-parse', '--verify', '--quiet', f'refs/tags/{tag_name}^{{commit}}')
+    except GitError:
+        return None
+
+
+def push_atomic(branch='main', tags=(), remote='origin'):
+    """브랜치와 태그를 한 번의 원자적 push로 전송 (하나라도 거부되면 모두 반영되지 않음)"""
+    refspecs = [f'HEAD:refs/heads/{branch}'] + [f'refs/tags/{tag}' for tag in tags]
+    _git('push', '--atomic', remote, *refspecs)
+
+
+def commit_tag_and_push(paths, message, tag_name, tag_message, branch='main', remote='origin',
+                        push=True, snapshots=None):
+    """
+    릴리즈 커밋 + 태그 생성 후 원자적 push, 새 커밋 SHA 반환 (동시 배포 간 'git' 잠금)
+
+    커밋 객체에 태그를 먼저 만들고 성공한 뒤에만 HEAD를 옮기므로,
+    태그가 이미 있거나 태그 생성에 실패해도 push되지 않은 릴리즈 커밋이 HEAD에 남지 않습니다.
+    tag_name이 None이면 태그 없이 커밋과 브랜치 push만 합니다.
+    snapshots는 create_commit과 같습니다 (파일을 쓴 시점의 내용으로 커밋).
+    """
+    with release_lock('git'):
+        if tag_name and tag_commit(tag_name):
+            raise GitError(f"태그 {tag_name}이(가) 이미 있습니다 ({tag_commit(tag_name)[:10]}).")
+        commit, parent = create_commit(paths, message, snapshots)
+        if tag_name:
+            create_tag(tag_name, tag_message, commit)
+            print(f"🏷️ 태그 생성: {tag_name}")
+        try:
+            advance_head(commit, parent, paths, message, snapshots)
+        except GitError:
+            if tag_name:
+                _git('tag', '-d', tag_name)
+            raise
+        print(f"📝 릴리즈 커밋 생성: {commit[:10]} ({len(set(paths))}개 파일)")
+        if push:
+            tags = [tag_name] if tag_name else []
+            push_atomic(branch, tags, remote)
+            print(f"📤 {remote}/{branch}{''.join(f' + {tag}' for tag in tags)} 원자적 push 완료")
+    return commit
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+릴리즈 성능 기록 (SQLite)
+배포할 때마다 빌드 시간, APK 크기, 업로드 처리량, API 호출 수, 전체 배포 시간을
+.deploy/history.sqlite3에 버전 태그(pubspec.yaml 기준 v<버전>)와 함께 저장하고,
+직전 릴리즈들의 중앙값(기준선)과 비교해 임계값 이상 나빠진 지표를 회귀로 표시합니다.
+
+사용법:
+  python release_history.py                       # 최근 20개 릴리즈 추이와 회귀 표시
+  python release_history.py --limit 50 --window 10 --threshold 0.5
+  python release_history.py --fail-on-regression  # 최신 릴리즈에 회귀가 있으면 종료 코드 1 (CI용)
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+from datetime import datetime
+from statistics import median
+
+from api_scheduler import call_counts
+
+HISTORY_DB = os.path.join('.deploy', 'history.sqlite3')
+DEFAULT_WINDOW = 5
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_LIMIT = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS releases (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tag TEXT NOT NULL,
+    version TEXT NOT NULL,
+    build INTEGER,
+    recorded_at TEXT NOT NULL,
+    success INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    release_id INTEGER NOT NULL REFERENCES releases(id),
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (release_id, name)
+);
+"""
+
+
+def _format_seconds(value):
+    return f"{value / 60:.1f}분" if value >= 120 else f"{value:.0f}초"
+
+
+def _format_size(value):
+    return f"{value / 1024 / 1024:.1f}MB"
+
+
+def _format_rate(value):
+    return f"{value / 1024 / 1024:.2f}MB/s"
+
+
+def _format_count(value):
+    return f"{value:.0f}회"
+
+
+# 보고서에 표시하는 지표: 이름 → (표시 이름, 포맷터, 값이 클수록 나쁜지)
+METRICS = {
+    'build_seconds': ('빌드', _format_seconds, True),
+    'apk_size': ('APK', _format_size, True),
+    'upload_bytes_per_second': ('업로드', _format_rate, False),
+    'api_calls': ('API', _format_count, True),
+    'total_seconds': ('전체', _format_seconds, True),
+}
+
+
+def connect(path=HISTORY_DB):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 동시에 끝난 배포가 같은 DB에 기록할 수 있으므로 잠금을 잠시 기다림
+    connection = sqlite3.connect(path, timeout=30)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def record_release(version, build, metrics, success=True, path=HISTORY_DB):
+    """릴리즈 한 건의 지표 저장, 저장된 release id 반환"""
+    with connect(path) as connection:
+        cursor = connection.execute(
+            'INSERT INTO releases (tag, version, build, recorded_at, success) VALUES (?, ?, ?, ?, ?)',
+            (f'v{version}', version, build, datetime.now().isoformat(timespec='seconds'), int(success)))
+        release_id = cursor.lastrowid
+        connection.executemany('INSERT INTO metrics (release_id, name, value) VALUES (?, ?, ?)',
+                               [(release_id, name, float(value)) for name, value in metrics.items()
+                                if value is not None])
+    connection.close()
+    return release_id
+
+
+def load_releases(limit=None, path=HISTORY_DB, include_failed=False):
+    """
+    오래된 순으로 릴리즈 목록 반환
+
+    Returns:
+        list: [{'id', 'tag', 'version', 'build', 'recorded_at', 'success', 'metrics': {이름: 값}}]
+    """
+    if not os.path.exists(path):
+        return []
+    connection = connect(path)
+    connection.row_factory = sqlite3.Row
+    where = '' if include_failed else 'WHERE success = 1'
+    rows = connection.execute(f'SELECT * FROM releases {where} ORDER BY id DESC'
+                              + (' LIMIT ?' if limit else ''), (limit,) if limit else ()).fetchall()
+    releases = []
+    for row in reversed(rows):
+        release = dict(row)
+        release['metrics'] = {name: value for name, value in connection.execute(
+            'SELECT name, value FROM metrics WHERE release_id = ?', (row['id'],))}
+        releases.append(release)
+    connection.close()
+    return releases
+
+
+def find_regressions(releases, window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD):
+    """
+    각 릴리즈를 직전 window개 릴리즈의 중앙값과 비교해 회귀 탐지
+
+    Returns:
+        dict: {release id: [(지표 이름, 값, 기준선, 변화율)]}
+    """
+    regressions = {}
+    for index, release in enumerate(releases):
+        previous = releases[max(0, index - window):index]
+        for name, (_, _, higher_is_worse) in METRICS.items():
+            value = release['metrics'].get(name)
+            history = [r['metrics'][name] for r in previous if r['metrics'].get(name)]
+            if value is None or not history:
+                continue
+            baseline = median(history)
+            change = (value - baseline) / baseline
+            if (change if higher_is_worse else -change) > threshold:
+                regressions.setdefault(release['id'], []).append((name, value, baseline, change))
+    return regressions
+
+
+def describe_regression(name, value, baseline, change):
+    label, formatter, _ = METRICS[name]
+    return f"{label} {formatter(baseline)} → {formatter(value)} ({change * 100:+.0f}%)"
+
+
+def print_report(limit=DEFAULT_LIMIT, window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD, path=HISTORY_DB):
+    """추이 표와 회귀 목록 출력, 최신 릴리즈의 회귀 목록 반환"""
+    # 가장 오래된 표시 대상도 기준선을 가질 수 있도록 window만큼 더 읽음
+    releases = load_releases(limit + window, path)
+    if not releases:
+        print(f"📭 기록된 릴리즈가 없습니다: {path}")
+        return []
+    regressions = find_regressions(releases, window, threshold)
+    shown = releases[-limit:]
+
+    print(f"📈 릴리즈 성능 추이 (기준선: 직전 {window}개 중앙값, 회귀 임계값 {threshold * 100:.0f}%)")
+    header = f"{'태그':<12} {'기록 시각':<20}" + ''.join(f" {label:>11}" for label, _, _ in METRICS.values())
+    print(header)
+    print('-' * (len(header) + 4))
+    for release in shown:
+        flagged = {name for name, *_ in regressions.get(release['id'], [])}
+        cells = []
+        for name, (_, formatter, _) in METRICS.items():
+            value = release['metrics'].get(name)
+            cell = formatter(value) if value is not None else '-'
+            cells.append(f" {cell + (' ⚠️' if name in flagged else ''):>11}")
+        print(f"{release['tag']:<12} {release['recorded_at']:<20}" + ''.join(cells))
+
+    flagged_releases = [release for release in shown if release['id'] in regressions]
+    if flagged_releases:
+        print(f"\n🚨 회귀 {len(flagged_releases)}건")
+        for release in flagged_releases:
+            details = ', '.join(describe_regression(*item) for item in regressions[release['id']])
+            print(f"  {release['tag']} (빌드 {release['build']}): {details}")
+    else:
+        print("\n✅ 회귀 없음")
+    return regressions.get(shown[-1]['id'], [])
+
+
+class ReleaseRecorder:
+    """
+    배포 한 번의 지표 수집
+
+    API 호출 수는 시작 시점과의 차이로 계산하므로
+    배포 데몬처럼 한 프로세스에서 여러 번 배포해도 릴리즈별로 집계됩니다.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.api_calls_at_start = call_counts()
+        self.metrics = {}
+        # 버전이 정해지기 전에 실패하면 기록하지 않음
+        self.version = None
+        self.build = None
+
+    def set(self, **metrics):
+        self.metrics.update(metrics)
+
+    def finish(self, version, build, success, path=HISTORY_DB, window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD):
+        """지표를 저장하고 이번 릴리즈의 회귀를 출력"""
+        metrics = dict(self.metrics, total_seconds=time.monotonic() - self.started)
+        total_calls = 0
+        for name, calls in call_counts().items():
+            delta = calls - self.api_calls_at_start.get(name, 0)
+            metrics[f'{name}_api_calls'] = delta
+            total_calls += delta
+        metrics['api_calls'] = total_calls
+
+        try:
+            release_id = record_release(version, build, metrics, success, path)
+        except sqlite3.Error as e:
+            print(f"⚠️ 릴리즈 성능 기록 실패: {e}")
+            return None
+        if not success:
+            return release_id
+
+        regressions = find_regressions(load_releases(window + 1, path), window, threshold).get(release_id, [])
+        for item in regressions:
+            print(f"🚨 성능 회귀: {describe_regression(*item)}")
+        print(f"📈 릴리즈 성능 기록 저장: {path} (python release_history.py로 추이 확인)")
+        return release_id
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='릴리즈 성능 추이 및 회귀 보고서')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help='표시할 최근 릴리즈 수')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help='기준선으로 쓸 직전 릴리즈 수')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='회귀로 볼 변화율 (0.25 = 25%%)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='최신 릴리즈에 회귀가 있으면 실패')
+    args = parser.parse_args()
+
+    latest = print_report(args.limit, args.window, args.threshold)
+    return not (args.fail_on_regression and latest)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
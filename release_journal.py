@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+릴리즈 진행 기록(저널)
+배포 파이프라인이 단계를 마칠 때마다 결과(APK 해시, 배포 링크, 커밋 SHA 등)를
+.deploy/journal/v<버전>+<빌드>.json에 기록합니다.
+같은 빌드를 다시 배포(--current)하면 이전 실행의 기록을 덮어쓰지 않고 v<버전>+<빌드>.run<N>.json에 기록합니다.
+중간에 실패한 배포는 `python auto_deploy.py --resume`으로 첫 번째 미완료 단계부터 이어서 진행하며,
+버전 증가, 빌드, 업로드처럼 이미 끝난 작업은 반복하지 않습니다.
+
+단계: version → build → publish → git → release
+
+사용법:
+  python release_journal.py          # 최근 릴리즈 진행 기록 목록
+  python release_journal.py 2.2.31   # 특정 릴리즈의 단계별 결과
+"""
+
+import os
+import sys
+import json
+import argparse
+import itertools
+from datetime import datetime
+
+from release_lock import atomic_write_text
+
+JOURNAL_DIR = os.path.join('.deploy', 'journal')
+STAGES = ('version', 'build', 'publish', 'git', 'release')
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class ReleaseJournal:
+    """릴리즈 한 건의 단계별 진행 기록"""
+
+    def __init__(self, data, path):
+        self.data = data
+        self.path = path
+
+    @classmethod
+    def create(cls, version, build, version_type, options, journal_dir=JOURNAL_DIR):
+        data = {
+            'version': version,
+            'build': build,
+            'version_type': version_type,
+            'options': options,
+            'status': 'in_progress',
+            'started_at': _now(),
+            'updated_at': _now(),
+            'mutated_files': [],
+            'stages': {},
+        }
+        os.makedirs(journal_dir, exist_ok=True)
+        base = os.path.join(journal_dir, f'v{version}+{build}')
+        # 같은 빌드의 이전(미완료일 수도 있는) 실행 기록을 덮어쓰지 않도록 실행 번호를 붙여 파일을 선점
+        for run in itertools.count(1):
+            path = f'{base}.json' if run == 1 else f'{base}.run{run}.json'
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                continue
+        data['run'] = run
+        journal = cls(data, path)
+        journal.save()
+        return journal
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), path)
+
+    @property
+    def version(self):
+        return self.data['version']
+
+    @property
+    def build(self):
+        return self.data['build']
+
+    @property
+    def run(self):
+        return self.data.get('run', 1)
+
+    @property
+    def options(self):
+        return self.data['options']
+
+    @property
+    def completed(self):
+        return self.data['status'] == 'completed'
+
+    def save(self):
+        self.data['updated_at'] = _now()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        atomic_write_text(self.path, json.dumps(self.data, ensure_ascii=False, indent=2))
+
+    def is_done(self, stage):
+        return stage in self.data['stages']
+
+    def outputs(self, stage):
+        return self.data['stages'].get(stage, {}).get('outputs', {})
+
+    def complete(self, stage, **outputs):
+        """단계 완료와 결과 기록 (기록한 뒤에 다음 단계로 진행)"""
+        self.data['stages'][stage] = {'completed_at': _now(), 'outputs': outputs}
+        self.save()
+
+    def invalidate(self, stage):
+        """결과를 더 이상 쓸 수 없는 단계(예: 보관된 APK 삭제)를 다시 실행하도록 표시"""
+        if self.data['stages'].pop(stage, None) is not None:
+            self.save()
+
+    def record_mutations(self, paths):
+        """
+        릴리즈 커밋에 포함할 파일 목록 (재개할 때 Git 단계에서 사용)
+
+        paths가 {경로: blob SHA}이면 파일을 쓴 시점의 내용 스냅숏도 함께 기록합니다.
+        """
+        self.data['mutated_files'] = sorted(set(self.data['mutated_files']) | set(paths))
+        if isinstance(paths, dict):
+            self.data.setdefault('snapshots', {}).update(
+                {path: blob for path, blob in paths.items() if blob})
+        self.save()
+
+    def fail(self, stage):
+        self.data['failed_stage'] = stage
+        self.save()
+
+    def finish(self):
+        self.data['status'] = 'completed'
+        self.data.pop('failed_stage', None)
+        self.save()
+
+    def next_stage(self):
+        return next((stage for stage in STAGES if not self.is_done(stage)), None)
+
+    def describe(self):
+        run = f" #{self.run}" if self.run > 1 else ''
+        return (f"v{self.version}+{self.build}{run} ({self.data['status']}, "
+                f"다음 단계: {self.next_stage() or '-'}, 갱신 {self.data['updated_at']})")
+
+
+def load_journals(journal_dir=JOURNAL_DIR):
+    """저장된 진행 기록 (최근 갱신 순)"""
+    if not os.path.isdir(journal_dir):
+        return []
+    journals = []
+    for name in os.listdir(journal_dir):
+        path = os.path.join(journal_dir, name)
+        if not name.endswith('.json') or os.path.getsize(path) == 0:
+            # 빈 파일은 create가 선점만 하고 아직 쓰지 않은 기록
+            continue
+        try:
+            journals.append(ReleaseJournal.load(path))
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 진행 기록을 읽을 수 없습니다: {name} ({e})")
+    journals.sort(key=lambda journal: (journal.data['updated_at'], journal.run), reverse=True)
+    return journals
+
+
+def find_resumable(version=None, journal_dir=JOURNAL_DIR):
+    """가장 최근의 미완료 릴리즈 (version을 지정하면 해당 버전만)"""
+    for journal in load_journals(journal_dir):
+        if journal.completed:
+            continue
+        if version and version not in (journal.version, f'{journal.version}+{journal.build}'):
+            continue
+        return journal
+    return None
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='릴리즈 진행 기록 확인')
+    parser.add_argument('version', nargs='?', help='버전 (예: 2.2.31 또는 2.2.31+119)')
+    args = parser.parse_args()
+
+    journals = load_journals()
+    if args.version:
+        journals = [j for j in journals if args.version in (j.version, f'{j.version}+{j.build}')]
+        if not journals:
+            print(f"❌ 진행 기록을 찾을 수 없습니다: {args.version}")
+            return False
+        journal = journals[0]
+        print(f"📒 {journal.describe()}")
+        for stage in STAGES:
+            if journal.is_done(stage):
+                entry = journal.data['stages'][stage]
+                outputs = ', '.join(f'{key}={value}' for key, value in entry['outputs'].items())
+                print(f"  ✅ {stage:<8} {entry['completed_at']}  {outputs}")
+            elif journal.data.get('failed_stage') == stage:
+                print(f"  ❌ {stage:<8} 실패")
+            else:
+                print(f"  ⏳ {stage:<8} 미완료")
+        return True
+
+    if not journals:
+        print("📭 릴리즈 진행 기록이 없습니다.")
+        return True
+    for journal in journals[:10]:
+        print(f"{'✅' if journal.completed else '⏸️'} {journal.describe()}")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
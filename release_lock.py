@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+릴리즈 잠금 및 원자적 파일 쓰기
+동시에 시작된 배포(예: 핫픽스 + 정기 릴리즈)가 pubspec.yaml, CHANGELOG.md, README.md,
+Git 태그 같은 공유 상태를 동시에 수정하지 않도록 리소스별 파일 잠금을 제공합니다.
+잠금은 체크아웃의 .deploy/locks/<리소스>.lock에 있으므로
+다른 프로젝트(체크아웃)의 배포나 잠금 밖의 단계(업로드 등)는 계속 동시에 실행됩니다.
+
+리소스:
+  version  pubspec.yaml 버전/빌드 번호 할당
+  docs     CHANGELOG.md, README.md 갱신
+  build    Flutter 빌드 산출물 (같은 체크아웃의 build/ 디렉터리)
+  artifacts  로컬 APK 아티팩트 저장소 인덱스 (.deploy/artifacts/index.json)
+  git      릴리즈 커밋, 태그, push
+
+사용 예:
+  from release_lock import release_lock
+  with release_lock('version'):
+      ...
+"""
+
+import os
+import sys
+import time
+import socket
+import tempfile
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+LOCK_DIR = os.path.join('.deploy', 'locks')
+LOCK_POLL_SECONDS = 0.5
+
+
+class LockTimeout(Exception):
+    """잠금 대기 시간 초과"""
+
+
+def _try_lock(f):
+    try:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ReleaseLock:
+    """리소스별 배타적 파일 잠금 (프로세스 종료 시 OS가 자동 해제)"""
+
+    def __init__(self, resource, timeout=None, lock_dir=LOCK_DIR):
+        self.resource = resource
+        self.timeout = timeout
+        self.path = os.path.join(lock_dir, f'{resource}.lock')
+        self._file = None
+
+    def _holder(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return f.read().strip() or '알 수 없음'
+        except OSError:
+            return '알 수 없음'
+
+    def acquire(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        f = open(self.path, 'a+', encoding='utf-8')
+        started = time.monotonic()
+        waiting = False
+        while not _try_lock(f):
+            if not waiting:
+                print(f"⏳ 릴리즈 잠금 대기 중: {self.resource} (보유: {self._holder()})")
+                waiting = True
+            if self.timeout is not None and time.monotonic() - started >= self.timeout:
+                f.close()
+                raise LockTimeout(f"릴리즈 잠금 대기 시간 초과: {self.resource}")
+            time.sleep(LOCK_POLL_SECONDS)
+
+        # 잠금을 기다리는 다른 배포가 보유자를 알 수 있도록 기록
+        try:
+            f.seek(0)
+            f.truncate()
+            f.write(f"pid {os.getpid()} @ {socket.gethostname()} "
+                    f"({datetime.now().isoformat(timespec='seconds')})\n")
+            f.flush()
+        except OSError:
+            pass
+        if waiting:
+            print(f"🔓 릴리즈 잠금 획득: {self.resource} ({time.monotonic() - started:.1f}초 대기)")
+        self._file = f
+        return self
+
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            _unlock(self._file)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def release_lock(resource, timeout=None):
+    """리소스 잠금 컨텍스트 매니저"""
+    return ReleaseLock(resource, timeout)
+
+
+def atomic_write_text(path, content, encoding='utf-8'):
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않도록 함"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}.', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            # mkstemp는 0600으로 만들므로 기존 파일 권한 유지
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def main():
+    """현재 잠금 보유 상태 출력"""
+    if not os.path.isdir(LOCK_DIR):
+        print("🔓 잠금 없음")
+        return True
+    for name in sorted(os.listdir(LOCK_DIR)):
+        if not name.endswith('.lock'):
+            continue
+        lock = ReleaseLock(name[:-len('.lock')])
+        with open(lock.path, 'a+', encoding='utf-8') as f:
+            free = _try_lock(f)
+            if free:
+                _unlock(f)
+        print(f"{'🔓' if free else '🔒'} {lock.resource}: {'사용 가능' if free else lock._holder()}")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
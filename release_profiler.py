@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+릴리즈 스크립트 프로파일러 (--profile)
+auto_deploy.py, google_drive_uploader.py, update_version.py를 --profile로 실행하면
+Python 쪽 CPU/메모리 사용을 단계별로 기록합니다.
+
+출력 (.deploy/profile/<스크립트>-<시각>/):
+  profile.pstats    cProfile 통계 (python -m pstats, snakeviz 등으로 분석)
+  stacks.collapsed  샘플링한 콜 스택 (flamegraph.pl, speedscope 입력 형식, 단계별로 구분)
+  memory.txt        단계별 tracemalloc 최대 사용량과 할당 상위 N개 위치
+
+코드에서 단계 표시:
+  import release_profiler
+  release_profiler.begin_stage('build')   # 프로파일링 중이 아닐 때는 아무 일도 하지 않음
+"""
+
+import os
+import sys
+import time
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+PROFILE_ROOT = os.path.join('.deploy', 'profile')
+SAMPLE_INTERVAL_SECONDS = 0.005
+TOP_ALLOCATIONS = 15
+# 보고서는 할당 위치(파일:줄)만 사용하므로 프레임 하나만 기록해 오버헤드를 줄임
+TRACEMALLOC_FRAMES = 1
+
+# 프로파일러 자체와 임포트 시스템의 할당은 보고서에서 제외
+_EXCLUDED_FILES = (__file__, tracemalloc.__file__, '<frozen importlib._bootstrap>',
+                   '<frozen importlib._bootstrap_external>')
+
+_active = None
+
+
+class ReleaseProfiler:
+    """cProfile + 스택 샘플링 + 단계별 tracemalloc"""
+
+    def __init__(self, name, output_dir=None, top=TOP_ALLOCATIONS):
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        self.output_dir = output_dir or os.path.join(PROFILE_ROOT, f'{name}-{timestamp}')
+        self.top = top
+        self.profile = cProfile.Profile()
+        self.stacks = Counter()
+        self.stage_name = 'startup'
+        self.stage_started = None
+        self.stage_snapshot = None
+        self.stage_reports = []
+        self.stopping = threading.Event()
+        self.sampler = None
+
+    def start(self):
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._open_stage(self.stage_name)
+        self.sampler = threading.Thread(target=self._sample, daemon=True)
+        self.sampler.start()
+        self.profile.enable()
+
+    def _sample(self):
+        """모든 스레드의 콜 스택을 주기적으로 수집 (collapsed 형식: 단계;스레드;루트;...;리프)"""
+        sampler_id = threading.get_ident()
+        while not self.stopping.wait(SAMPLE_INTERVAL_SECONDS):
+            thread_names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_id:
+                    continue
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                root = [f'stage:{self.stage_name}', f"thread:{thread_names.get(thread_id, thread_id)}"]
+                self.stacks[';'.join(root + names[::-1])] += 1
+
+    def _open_stage(self, name):
+        self.stage_name = name
+        self.stage_started = time.perf_counter()
+        tracemalloc.reset_peak()
+        self.stage_snapshot = tracemalloc.take_snapshot()
+
+    def _close_stage(self):
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        growth = [stat for stat in snapshot.compare_to(self.stage_snapshot, 'lineno')
+                  if stat.size_diff > 0 and stat.traceback[0].filename not in _EXCLUDED_FILES]
+        self.stage_reports.append({
+            'stage': self.stage_name,
+            'seconds': time.perf_counter() - self.stage_started,
+            'current': current,
+            'peak': peak,
+            'top': growth[:self.top],
+        })
+
+    def begin_stage(self, name):
+        """이전 단계를 마감하고 새 단계 시작 (스냅샷 처리 시간은 CPU 프로파일에서 제외)"""
+        self.profile.disable()
+        self._close_stage()
+        self._open_stage(name)
+        self.profile.enable()
+
+    def stop(self):
+        """프로파일링 종료 후 보고서 저장, 출력 디렉터리 반환"""
+        self.profile.disable()
+        self.stopping.set()
+        self.sampler.join()
+        self._close_stage()
+        tracemalloc.stop()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.profile.dump_stats(os.path.join(self.output_dir, 'profile.pstats'))
+        with open(os.path.join(self.output_dir, 'stacks.collapsed'), 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f'{stack} {count}\n')
+        with open(os.path.join(self.output_dir, 'memory.txt'), 'w', encoding='utf-8') as f:
+            f.write(self._format_memory_report())
+
+        self._print_summary()
+        return self.output_dir
+
+    def _format_memory_report(self):
+        lines = []
+        for report in self.stage_reports:
+            lines.append(f"== {report['stage']} ({report['seconds']:.2f}s) "
+                         f"peak {report['peak'] / 1024 / 1024:.1f}MB, "
+                         f"current {report['current'] / 1024 / 1024:.1f}MB")
+            for stat in report['top']:
+                frame = stat.traceback[0]
+                lines.append(f"  {stat.size_diff / 1024:10.1f}KB {stat.count_diff:8d} blocks  "
+                             f"{frame.filename}:{frame.lineno}")
+            lines.append('')
+        return '\n'.join(lines)
+
+    def _print_summary(self):
+        print("=" * 50)
+        print("🔬 프로파일 요약 (누적 시간 상위 10개)")
+        stats = pstats.Stats(self.profile)
+        stats.sort_stats('cumulative').print_stats(10)
+        for report in self.stage_reports:
+            print(f"  📍 {report['stage']:<12} {report['seconds']:8.2f}초  "
+                  f"최대 메모리 {report['peak'] / 1024 / 1024:.1f}MB")
+        print(f"📁 프로파일 저장: {self.output_dir}")
+        print(f"💡 python -m pstats {os.path.join(self.output_dir, 'profile.pstats')}")
+        print(f"💡 flamegraph.pl {os.path.join(self.output_dir, 'stacks.collapsed')} > flame.svg")
+
+
+def start(name):
+    """프로파일링 시작 (스크립트 main에서 --profile일 때 호출)"""
+    global _active
+    _active = ReleaseProfiler(name)
+    _active.start()
+    return _active
+
+
+def stop():
+    """프로파일링 종료 및 보고서 저장"""
+    global _active
+    if _active is None:
+        return None
+    profiler, _active = _active, None
+    return profiler.stop()
+
+
+def begin_stage(name):
+    """단계 표시 (프로파일링 중이 아니면 무시)"""
+    if _active is not None:
+        _active.begin_stage(name)
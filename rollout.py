@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계적 배포(Staged Rollout) 도구
+version.json에 배포 비율, 최소 확인 간격, 단계별 확대 일정을 기록해
+새 버전이 나오자마자 모든 설치본이 같은 Drive 파일을 동시에 내려받지 않도록 분산합니다.
+
+version.json 필드:
+  rollout_percentage        현재 배포 비율 (0~100, 수동 조정값)
+  rollout_started_at        배포 시작 시각 (UTC, ISO 8601)
+  ramp_schedule             [{"after_hours": 0, "percentage": 10}, ...] 경과 시간별 배포 비율
+  min_check_interval_hours  앱이 version.json을 다시 확인하기까지의 최소 간격
+
+앱은 설치본마다 0~99 버킷을 한 번 정해 두고,
+max(rollout_percentage, 경과 시간에 해당하는 ramp_schedule 비율)보다 작은 버킷만 업데이트를 안내합니다.
+
+사용법:
+  python rollout.py show                      # 현재 배포 상태
+  python rollout.py bump 50                   # 빌드 없이 배포 비율 변경 후 version.json 재업로드
+  python rollout.py bump 100 --clear-schedule # 전체 배포
+  python rollout.py simulate --installs 20000 # 예상 다운로드 부하 곡선
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime, timezone
+
+VERSION_JSON_PATH = 'version.json'
+
+DEFAULT_ROLLOUT_PERCENTAGE = 10
+DEFAULT_MIN_CHECK_INTERVAL_HOURS = 12
+DEFAULT_RAMP_SCHEDULE = [
+    {'after_hours': 0, 'percentage': 10},
+    {'after_hours': 24, 'percentage': 50},
+    {'after_hours': 72, 'percentage': 100},
+]
+
+
+def rollout_fields(percentage=None, min_check_interval_hours=None, ramp_schedule=None):
+    """새 릴리즈의 version.json에 넣을 단계적 배포 필드"""
+    return {
+        'rollout_percentage': DEFAULT_ROLLOUT_PERCENTAGE if percentage is None else percentage,
+        'rollout_started_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'ramp_schedule': DEFAULT_RAMP_SCHEDULE if ramp_schedule is None else ramp_schedule,
+        'min_check_interval_hours': (DEFAULT_MIN_CHECK_INTERVAL_HOURS
+                                     if min_check_interval_hours is None else min_check_interval_hours),
+    }
+
+
+def full_rollout_fields():
+    """모든 설치본에 즉시 안내하는 배포 필드 (롤백/재배포용, 확대 일정 없음)"""
+    return rollout_fields(percentage=100, ramp_schedule=[])
+
+
+def effective_percentage(data, elapsed_hours):
+    """배포 시작 후 elapsed_hours 시점의 배포 비율 (필드가 없으면 전체 배포로 간주)"""
+    if 'rollout_percentage' not in data:
+        return 100
+    percentage = data['rollout_percentage']
+    for step in data.get('ramp_schedule') or []:
+        if elapsed_hours >= step['after_hours']:
+            percentage = max(percentage, step['percentage'])
+    return min(max(percentage, 0), 100)
+
+
+def elapsed_hours_since_start(data):
+    started = data.get('rollout_started_at')
+    if not started:
+        return 0.0
+    delta = datetime.now(timezone.utc) - datetime.fromisoformat(started)
+    return max(delta.total_seconds() / 3600, 0.0)
+
+
+def load_version_json(path=VERSION_JSON_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ {path}를 읽을 수 없습니다: {e}")
+        return None
+
+
+def bump(percentage, path=VERSION_JSON_PATH, clear_schedule=False, upload=True):
+    """빌드 없이 배포 비율만 바꿔 version.json을 제자리 교체 업로드"""
+    if not 0 <= percentage <= 100:
+        print("❌ 배포 비율은 0~100 사이여야 합니다.")
+        return False
+    data = load_version_json(path)
+    if data is None:
+        return False
+
+    before = effective_percentage(data, elapsed_hours_since_start(data))
+    data['rollout_percentage'] = percentage
+    data.setdefault('rollout_started_at', datetime.now(timezone.utc).isoformat(timespec='seconds'))
+    data.setdefault('min_check_interval_hours', DEFAULT_MIN_CHECK_INTERVAL_HOURS)
+    if clear_schedule:
+        data['ramp_schedule'] = []
+    after = effective_percentage(data, elapsed_hours_since_start(data))
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"🎚️ v{data.get('version')} 배포 비율: {before}% → {after}%")
+
+    if not upload:
+        return True
+
+    from google_drive_uploader import GoogleDriveUploader
+
+    uploader = GoogleDriveUploader()
+    if not uploader.authenticate():
+        return False
+    folder_id = uploader.create_folder("SecureMemo_APK")
+    if not uploader.upload_version_json(path, folder_id):
+        print("❌ version.json 업로드 실패")
+        return False
+    print("✅ version.json 업데이트 완료 (파일 ID 유지)")
+    return True
+
+
+def simulate(data, installs, hours):
+    """
+    시간대별 예상 다운로드 수 계산
+
+    설치본은 0~99 버킷에 고르게 분포하고, min_check_interval_hours 주기 안에서
+    무작위 시점에 version.json을 확인한다고 가정합니다.
+
+    Returns:
+        list: 시간대별 다운로드 수 (길이 hours)
+    """
+    interval = max(int(data.get('min_check_interval_hours') or DEFAULT_MIN_CHECK_INTERVAL_HOURS), 1)
+    per_bucket = installs / 100
+    downloads = [0.0] * hours
+
+    for bucket in range(100):
+        # 이 버킷이 배포 대상에 들어가는 첫 시각
+        opened = next((hour for hour in range(hours) if effective_percentage(data, hour) > bucket), None)
+        if opened is None:
+            continue
+        # 이후 한 확인 주기 동안 고르게 다운로드
+        for hour in range(opened, min(opened + interval, hours)):
+            downloads[hour] += per_bucket / interval
+    return downloads
+
+
+def print_load_curve(data, installs, hours):
+    staged = simulate(data, installs, hours)
+    unstaged = simulate({'min_check_interval_hours': data.get('min_check_interval_hours')}, installs, hours)
+    peak = max(max(staged), 1)
+
+    print(f"📈 예상 다운로드 부하 (설치본 {installs:,}개, 확인 간격 "
+          f"{data.get('min_check_interval_hours', DEFAULT_MIN_CHECK_INTERVAL_HOURS)}시간)")
+    for hour, count in enumerate(staged):
+        if count or hour == 0:
+            bar = '█' * round(count / peak * 40)
+            print(f"  {hour:4d}h {effective_percentage(data, hour):3d}% {count:9.0f}/h {bar}")
+    print(f"📊 최대 시간당 다운로드: {max(staged):,.0f} (단계적 배포 없이: {max(unstaged):,.0f})")
+    print(f"📦 {hours}시간 내 누적 다운로드: {sum(staged):,.0f} / {installs:,}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='단계적 배포 관리')
+    parser.add_argument('--file', default=VERSION_JSON_PATH, help='version.json 경로')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('show', help='현재 배포 상태')
+    bump_parser = subparsers.add_parser('bump', help='배포 비율 변경')
+    bump_parser.add_argument('percentage', type=int)
+    bump_parser.add_argument('--clear-schedule', action='store_true', help='단계별 확대 일정 제거')
+    bump_parser.add_argument('--no-upload', action='store_true', help='로컬 version.json만 수정')
+    simulate_parser = subparsers.add_parser('simulate', help='예상 다운로드 부하 곡선')
+    simulate_parser.add_argument('--installs', type=int, default=10000, help='설치본 수')
+    simulate_parser.add_argument('--hours', type=int, default=96, help='시뮬레이션 기간(시간)')
+    simulate_parser.add_argument('--interval', type=int, help='최소 확인 간격(시간) 재정의')
+
+    args = parser.parse_args()
+
+    if args.command == 'bump':
+        return bump(args.percentage, args.file, args.clear_schedule, not args.no_upload)
+
+    if args.command == 'simulate':
+        # version.json이 없으면 기본 배포 설정으로 시뮬레이션
+        data = (load_version_json(args.file) if os.path.exists(args.file) else None) or rollout_fields()
+        if args.interval:
+            data['min_check_interval_hours'] = args.interval
+        print_load_curve(data, args.installs, args.hours)
+        return True
+
+    data = load_version_json(args.file)
+    if data is None:
+        return False
+    elapsed = elapsed_hours_since_start(data)
+    print(f"📱 v{data.get('version')}+{data.get('build')}")
+    print(f"🎚️ 현재 배포 비율: {effective_percentage(data, elapsed)}% "
+          f"(수동 {data.get('rollout_percentage', 100)}%, 시작 후 {elapsed:.1f}시간)")
+    for step in data.get('ramp_schedule') or []:
+        mark = '✅' if elapsed >= step['after_hours'] else '⏳'
+        print(f"  {mark} {step['after_hours']}시간 후 {step['percentage']}%")
+    print(f"⏱️ 최소 확인 간격: {data.get('min_check_interval_hours', 0)}시간")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
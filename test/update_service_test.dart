@@ -0,0 +1,130 @@
+import 'dart:convert';
+import 'dart:io';
+
+import 'package:crypto/crypto.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:http/http.dart' as http;
+import 'package:http/testing.dart';
+import 'package:memo_app/update_service.dart';
+import 'package:shared_preferences/shared_preferences.dart';
+
+void main() {
+  final manifest = {'version': '2.2.31', 'build': 119, 'apk_url': 'https://example.com/app.apk'};
+
+  late List<http.Request> requests;
+
+  void respondWith(http.Response Function(http.Request request) handler) {
+    requests = [];
+    UpdateService.clientFactory = () => MockClient((request) async {
+          requests.add(request);
+          return handler(request);
+        });
+  }
+
+  tearDown(() => UpdateService.clientFactory = http.Client.new);
+
+  group('version.json 캐시', () {
+    test('304 응답이면 캐시한 version.json을 재사용', () async {
+      SharedPreferences.setMockInitialValues({
+        'update_manifest_body': json.encode(manifest),
+        'update_manifest_etag': '"abc"',
+        'update_manifest_last_modified': 'Mon, 07 Jul 2025 00:00:00 GMT',
+      });
+      respondWith((_) => http.Response('', 304));
+
+      final data = await UpdateService.loadManifestIfDue();
+
+      expect(data, manifest);
+      expect(requests.single.headers['If-None-Match'], '"abc"');
+      expect(requests.single.headers['If-Modified-Since'], 'Mon, 07 Jul 2025 00:00:00 GMT');
+    });
+
+    test('200 응답이면 본문과 ETag를 저장', () async {
+      SharedPreferences.setMockInitialValues({});
+      respondWith((_) => http.Response.bytes(utf8.encode(json.encode(manifest)), 200, headers: {'etag': '"v2"'}));
+
+      expect(await UpdateService.loadManifestIfDue(), manifest);
+
+      final prefs = await SharedPreferences.getInstance();
+      expect(prefs.getString('update_manifest_etag'), '"v2"');
+      expect(json.decode(prefs.getString('update_manifest_body')!), manifest);
+      // 확인 간격 이내에는 다시 요청하지 않음
+      expect(await UpdateService.loadManifestIfDue(), isNull);
+      expect(requests, hasLength(1));
+    });
+  });
+
+  group('실패 시 재시도 간격', () {
+    test('실패할 때마다 다음 확인을 두 배씩 미룸', () async {
+      SharedPreferences.setMockInitialValues({});
+      respondWith((_) => http.Response('error', 500));
+      final prefs = await SharedPreferences.getInstance();
+
+      final before = DateTime.now().millisecondsSinceEpoch;
+      expect(await UpdateService.loadManifestIfDue(), isNull);
+      expect(prefs.getInt('update_failure_count'), 1);
+      final firstDelay = prefs.getInt('update_next_retry_ms')! - before;
+      expect(firstDelay, closeTo(const Duration(minutes: 5).inMilliseconds, 5000));
+
+      // 대기 중에는 요청하지 않음
+      expect(await UpdateService.loadManifestIfDue(), isNull);
+      expect(requests, hasLength(1));
+
+      // 대기 시간이 지난 뒤 다시 실패하면 간격이 두 배
+      await prefs.setInt('update_next_retry_ms', 0);
+      final retried = DateTime.now().millisecondsSinceEpoch;
+      expect(await UpdateService.loadManifestIfDue(), isNull);
+      expect(prefs.getInt('update_failure_count'), 2);
+      expect(prefs.getInt('update_next_retry_ms')! - retried,
+          closeTo(const Duration(minutes: 10).inMilliseconds, 5000));
+    });
+
+    test('성공하면 실패 기록 초기화', () async {
+      SharedPreferences.setMockInitialValues({'update_failure_count': 3, 'update_next_retry_ms': 0});
+      respondWith((_) => http.Response(json.encode(manifest), 200));
+
+      expect(await UpdateService.loadManifestIfDue(), manifest);
+      final prefs = await SharedPreferences.getInstance();
+      expect(prefs.getInt('update_failure_count'), isNull);
+      expect(prefs.getInt('update_next_retry_ms'), isNull);
+    });
+  });
+
+  group('APK 무결성 검증', () {
+    final apkBytes = List<int>.generate(300000, (i) => i % 251);
+    late Directory directory;
+
+    setUp(() {
+      directory = Directory.systemTemp.createTempSync('update_service_test');
+      respondWith((_) => http.Response.bytes(apkBytes, 200));
+    });
+
+    tearDown(() => directory.deleteSync(recursive: true));
+
+    test('SHA-256이 일치하면 내려받은 파일 반환', () async {
+      final file = await UpdateService.downloadVerifiedApk(
+          'https://example.com/app.apk', sha256.convert(apkBytes).toString(), apkBytes.length,
+          directory: directory);
+
+      expect(file.readAsBytesSync(), apkBytes);
+    });
+
+    test('SHA-256이 다르면 거부하고 파일 삭제', () async {
+      final wrong = sha256.convert(utf8.encode('다른 파일')).toString();
+
+      await expectLater(
+          UpdateService.downloadVerifiedApk('https://example.com/app.apk', wrong, apkBytes.length,
+              directory: directory),
+          throwsException);
+      expect(File('${directory.path}/update.apk').existsSync(), isFalse);
+    });
+
+    test('크기가 다르면 거부', () async {
+      await expectLater(
+          UpdateService.downloadVerifiedApk(
+              'https://example.com/app.apk', sha256.convert(apkBytes).toString(), apkBytes.length + 1,
+              directory: directory),
+          throwsException);
+    });
+  });
+}
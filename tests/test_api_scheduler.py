@@ -0,0 +1,33 @@
+import threading
+
+from api_scheduler import COSMETIC, CRITICAL, NORMAL, ApiScheduler
+
+
+def _acquire_in_thread(scheduler, priority, cost, timeout=5):
+    thread = threading.Thread(target=scheduler.acquire, args=(priority, cost), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def test_large_cost_acquire_completes():
+    # Drive 버킷(버스트 20)에서 100개 일괄 삭제처럼 비용이 버킷 크기에 가까운 호출
+    for priority in (CRITICAL, NORMAL, COSMETIC):
+        scheduler = ApiScheduler('test', 1000.0, 20)
+        assert _acquire_in_thread(scheduler, priority, 18)
+        assert _acquire_in_thread(scheduler, priority, 100)
+
+
+def test_large_cost_acquire_waits_for_refill():
+    scheduler = ApiScheduler('test', 100.0, 20)
+    scheduler.acquire(CRITICAL, 20)
+    assert _acquire_in_thread(scheduler, NORMAL, 19)
+    assert scheduler.stats['calls'] == 39
+
+
+def test_lower_priority_keeps_reserve():
+    scheduler = ApiScheduler('test', 0.001, 20)
+    scheduler.acquire(CRITICAL, 10)
+    # 남은 10개 중 NORMAL은 (20 - 8) * 0.25 = 3개를 남겨야 하므로 비용 8은 기다림
+    assert not _acquire_in_thread(scheduler, NORMAL, 8, timeout=0.3)
+    assert _acquire_in_thread(scheduler, CRITICAL, 1)
@@ -0,0 +1,165 @@
+import hashlib
+import mmap
+import os
+import re
+
+import pytest
+
+from artifact_io import MappedFile, current_rss, sha256_file
+
+# 창 경계에 걸치지 않도록 창 크기의 배수가 아닌 크기
+FILE_SIZE = 5 * 1024 * 1024 + 12345
+WINDOW_SIZE = 16 * mmap.ALLOCATIONGRANULARITY
+
+
+@pytest.fixture(scope='module')
+def artifact(tmp_path_factory):
+    path = tmp_path_factory.mktemp('artifact') / 'app-release.aab'
+    path.write_bytes(os.urandom(FILE_SIZE))
+    return str(path)
+
+
+def _rss_limit():
+    rss = current_rss()
+    if rss is None:
+        pytest.skip('RSS를 확인할 수 없는 플랫폼')
+    # 창 몇 개 분량의 여유만 허용 (파일 전체가 올라오면 넘어가도록)
+    return rss + 4 * 1024 * 1024
+
+
+def test_windowed_sha256_matches_hashlib(artifact):
+    digest = hashlib.sha256()
+    with open(artifact, 'rb') as f:
+        for block in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(block)
+    assert sha256_file(artifact, window_size=WINDOW_SIZE, rss_limit=_rss_limit()) == digest.hexdigest()
+
+
+def test_read_range_matches_plain_reads(artifact):
+    with open(artifact, 'rb') as f:
+        data = f.read()
+    ranges = [
+        (0, 1000),
+        (WINDOW_SIZE - 10, 20),             # 창 경계에 걸친 구간
+        (3 * WINDOW_SIZE + 7, 2 * WINDOW_SIZE),  # 창보다 긴 구간
+        (FILE_SIZE - 100, 1000),            # 파일 끝을 넘는 구간
+        (FILE_SIZE, 10),
+    ]
+    with MappedFile(artifact, window_size=WINDOW_SIZE, rss_limit=_rss_limit() + FILE_SIZE) as mapped:
+        for begin, length in ranges:
+            assert mapped.read_range(begin, length) == data[begin:begin + length]
+        # 업로드처럼 청크 단위로 순서대로 읽어 전체 복원
+        chunk = 256 * 1024
+        assert b''.join(mapped.read_range(offset, chunk) for offset in range(0, FILE_SIZE, chunk)) == data
+
+
+def test_rss_limit_enforced(artifact):
+    with pytest.raises(MemoryError):
+        sha256_file(artifact, window_size=WINDOW_SIZE, rss_limit=1)
+
+
+def test_mapped_media_upload_chunks(artifact):
+    pytest.importorskip('googleapiclient')
+    from google_drive_uploader import MappedMediaUpload
+
+    with open(artifact, 'rb') as f:
+        data = f.read()
+    upload = MappedMediaUpload(artifact, chunksize=1024 * 1024)
+    try:
+        assert upload.size() == FILE_SIZE
+        assert upload.resumable()
+        chunks = [upload.getbytes(offset, upload.chunksize()) for offset in range(0, upload.size(), upload.chunksize())]
+        assert hashlib.sha256(b''.join(chunks)).hexdigest() == hashlib.sha256(data).hexdigest()
+    finally:
+        upload.close()
+
+
+SPARSE_SIZE = 3 * 1024 * 1024 * 1024 + 12345
+MARKERS = {0: b'APK-HEAD', SPARSE_SIZE // 2: b'APK-MIDDLE', SPARSE_SIZE - 8: b'APK-TAIL'}
+
+
+@pytest.fixture
+def sparse_artifact(tmp_path):
+    """표시 바이트 몇 개만 실제로 쓴 수 GB짜리 희소 파일"""
+    path = tmp_path / 'app-release.aab'
+    with open(path, 'wb') as f:
+        f.truncate(SPARSE_SIZE)
+        for offset, marker in MARKERS.items():
+            f.seek(offset)
+            f.write(marker)
+    return str(path)
+
+
+class ResumableStandIn:
+    """Drive 재개 가능 업로드 대역 (받은 청크는 검사만 하고 보관하지 않음)"""
+
+    def __init__(self):
+        self.received = 0
+        self.chunks = 0
+        self.markers = {}
+        self.peak_rss = 0
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        import httplib2
+
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        if method == 'GET':
+            # 같은 이름의 기존 파일 검색
+            return httplib2.Response({'status': '200'}), b'{"files": []}'
+        if method != 'PUT':
+            return httplib2.Response({'status': '200', 'location': 'https://upload.example.com/session'}), b''
+
+        # 청크 bytes가 메모리에 있는 시점의 RSS
+        self.peak_rss = max(self.peak_rss, current_rss() or 0)
+        begin, end, total = map(int, re.match(r'bytes (\d+)-(\d+)/(\d+)', headers['content-range']).groups())
+        assert begin == self.received and len(body) == end - begin + 1
+        for offset, marker in MARKERS.items():
+            if begin <= offset and offset + len(marker) <= end + 1:
+                self.markers[offset] = body[offset - begin:offset - begin + len(marker)]
+        self.received = end + 1
+        self.chunks += 1
+        if self.received == total:
+            return httplib2.Response({'status': '200'}), b'{"id": "large-artifact"}'
+        return httplib2.Response({'status': '308', 'range': f'bytes=0-{end}'}), b''
+
+
+def _drive_uploader(http):
+    from googleapiclient.discovery import build
+    from google_drive_uploader import GoogleDriveUploader
+
+    uploader = GoogleDriveUploader()
+    uploader.service = build('drive', 'v3', http=http, static_discovery=True)
+    return uploader
+
+
+def test_multi_gb_upload_keeps_rss_bounded(sparse_artifact, tmp_path, monkeypatch):
+    pytest.importorskip('googleapiclient')
+    import google_drive_uploader
+
+    baseline = current_rss()
+    if baseline is None:
+        pytest.skip('RSS를 확인할 수 없는 플랫폼')
+    monkeypatch.chdir(tmp_path)
+    stand_in = ResumableStandIn()
+
+    file_id = _drive_uploader(stand_in).upload_file(sparse_artifact, None, 'app-release.aab')
+
+    assert file_id == 'large-artifact'
+    assert stand_in.received == SPARSE_SIZE
+    assert stand_in.chunks == -(-SPARSE_SIZE // google_drive_uploader.UPLOAD_CHUNK_SIZE)
+    assert stand_in.markers == MARKERS
+    # 매핑된 창 하나와 복사한 청크 몇 개 분량만 허용 (파일 전체는 3GB)
+    assert stand_in.peak_rss - baseline < 4 * google_drive_uploader.UPLOAD_CHUNK_SIZE
+
+
+def test_upload_over_rss_limit_fails_cleanly(sparse_artifact, tmp_path, monkeypatch):
+    pytest.importorskip('googleapiclient')
+    import artifact_io
+
+    def over_limit(self):
+        raise MemoryError(f'RSS 상한 초과: {self.path}')
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(artifact_io.MappedFile, '_check_rss', over_limit)
+
+    assert _drive_uploader(ResumableStandIn()).upload_file(sparse_artifact, None, 'app-release.aab') is None
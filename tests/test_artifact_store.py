@@ -0,0 +1,66 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+import artifact_store
+from artifact_store import find_artifact, load_index, previous_published, record_publish, store_artifact
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(artifact_store, '_git', lambda *args: None)
+    return tmp_path
+
+
+def _store(store, version, build):
+    apk = store / f'app-{version}.apk'
+    apk.write_bytes(f'apk {version}+{build}'.encode())
+    return store_artifact(str(apk), version, build)
+
+
+def _rollback():
+    entry = previous_published()
+    record_publish(entry, f"https://example.com/{entry['version']}")
+    return entry['version']
+
+
+def test_repeated_rollback_walks_back_through_history(store):
+    for version, build in (('1.0.0', 1), ('1.1.0', 2), ('1.2.0', 3)):
+        record_publish(_store(store, version, build), f'https://example.com/{version}')
+
+    assert _rollback() == '1.1.0'
+    # 직전 rollback으로 기록된 항목(1.2.0 → 1.1.0) 사이를 오가지 않음
+    assert _rollback() == '1.0.0'
+    assert previous_published() is None
+
+
+def test_promote_of_new_build_after_rollback(store):
+    for version, build in (('1.0.0', 1), ('1.1.0', 2)):
+        record_publish(_store(store, version, build), f'https://example.com/{version}')
+    assert _rollback() == '1.0.0'
+    record_publish(_store(store, '1.1.1', 3), 'https://example.com/1.1.1')
+
+    assert previous_published()['version'] == '1.0.0'
+
+
+def _publish_many(path, worker, count):
+    os.chdir(path)
+    entry = find_artifact('1.0.0')
+    for n in range(count):
+        record_publish(entry, f'https://example.com/{worker}/{n}')
+
+
+def test_concurrent_publishes_keep_every_history_entry(store):
+    _store(store, '1.0.0', 1)
+    workers = [multiprocessing.Process(target=_publish_many, args=(str(store), worker, 20)) for worker in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(load_index()['history']) == 80
+    assert not os.path.exists(f'{artifact_store.INDEX_PATH}.tmp')
+    json.loads((store / artifact_store.INDEX_PATH).read_text(encoding='utf-8'))
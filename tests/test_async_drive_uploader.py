@@ -0,0 +1,180 @@
+import asyncio
+import itertools
+import os
+import re
+from types import SimpleNamespace
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+pytest.importorskip('google.auth')
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import async_drive_uploader
+from api_scheduler import ApiScheduler
+
+CHUNK_SIZE = 256 * 1024
+FILE_SIZE = 3 * CHUNK_SIZE + 1234
+
+
+class FakeDrive:
+    """Drive REST/재개 가능 업로드 대역 (실패 응답을 차례로 주입)"""
+
+    def __init__(self, session_failures=(), chunk_failures=()):
+        self.session_failures = list(session_failures)
+        self.chunk_failures = list(chunk_failures)
+        self.files = {}
+        self.sessions = {}
+        self.session_starts = 0
+        self.ids = itertools.count(1)
+        self.base_url = None
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get('/drive/v3/files', self.list_files)
+        app.router.add_post('/drive/v3/files', self.create_folder)
+        app.router.add_get('/drive/v3/files/{file_id}', self.get_file)
+        app.router.add_post('/drive/v3/files/{file_id}/permissions', self.add_permission)
+        app.router.add_delete('/drive/v3/files/{file_id}', self.delete_file)
+        app.router.add_post('/upload/drive/v3/files', self.start_session)
+        app.router.add_patch('/upload/drive/v3/files/{file_id}', self.start_session)
+        app.router.add_put('/session/{session_id}', self.put_chunk)
+        return app
+
+    async def list_files(self, request):
+        name = re.search(r"name='([^']+)'", request.query['q']).group(1)
+        return web.json_response({'files': [{'id': file_id, 'name': item['name']}
+                                            for file_id, item in self.files.items() if item['name'] == name]})
+
+    async def create_folder(self, request):
+        metadata = await request.json()
+        file_id = f'folder-{next(self.ids)}'
+        self.files[file_id] = {'name': metadata['name'], 'data': b'', 'public': False}
+        return web.json_response({'id': file_id})
+
+    async def get_file(self, request):
+        file_id = request.match_info['file_id']
+        permissions = [{'type': 'anyone', 'role': 'reader'}] if self.files[file_id]['public'] else []
+        return web.json_response({'webViewLink': f'https://drive.google.com/file/d/{file_id}/view',
+                                  'permissions': permissions})
+
+    async def add_permission(self, request):
+        self.files[request.match_info['file_id']]['public'] = True
+        return web.json_response({})
+
+    async def delete_file(self, request):
+        self.files.pop(request.match_info['file_id'])
+        return web.Response(status=204)
+
+    async def start_session(self, request):
+        self.session_starts += 1
+        if self.session_failures:
+            return web.Response(status=self.session_failures.pop(0), text='session start failed')
+        metadata = await request.json() if request.can_read_body else {}
+        session_id = str(next(self.ids))
+        self.sessions[session_id] = {
+            'file_id': request.match_info.get('file_id'),
+            'name': metadata.get('name'),
+            'size': int(request.headers['X-Upload-Content-Length']),
+            'data': bytearray(),
+        }
+        return web.Response(headers={'Location': f'{self.base_url}/session/{session_id}'})
+
+    async def put_chunk(self, request):
+        session = self.sessions[request.match_info['session_id']]
+        body = await request.read()
+        match = re.match(r'bytes (\d+)-(\d+)/(\d+)', request.headers['Content-Range'])
+        if match:
+            if self.chunk_failures and len(session['data']) >= CHUNK_SIZE:
+                return web.Response(status=self.chunk_failures.pop(0))
+            assert int(match.group(1)) == len(session['data'])
+            session['data'] += body
+        if len(session['data']) < session['size']:
+            headers = {'Range': f"bytes=0-{len(session['data']) - 1}"} if session['data'] else {}
+            return web.Response(status=308, headers=headers)
+        file_id = session['file_id'] or f'file-{next(self.ids)}'
+        item = self.files.setdefault(file_id, {'name': session['name'], 'public': False})
+        item['data'] = bytes(session['data'])
+        return web.json_response({'id': file_id})
+
+    def by_name(self, name):
+        return [(file_id, item) for file_id, item in self.files.items() if item['name'] == name]
+
+
+@pytest.fixture
+def apk(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(async_drive_uploader, 'CHUNK_SIZE', CHUNK_SIZE)
+    monkeypatch.setattr(async_drive_uploader, 'backoff_delay', lambda attempt: 0)
+    scheduler = ApiScheduler('drive', 1000.0, 20)
+    monkeypatch.setattr(async_drive_uploader, 'get_scheduler', lambda name: scheduler)
+    path = tmp_path / 'app-release.apk'
+    path.write_bytes(os.urandom(FILE_SIZE))
+    return str(path)
+
+
+def _run(drive, monkeypatch, scenario):
+    async def main():
+        server = TestServer(drive.app())
+        await server.start_server()
+        drive.base_url = str(server.make_url('')).rstrip('/')
+        monkeypatch.setattr(async_drive_uploader, 'DRIVE_API_URL', f'{drive.base_url}/drive/v3')
+        monkeypatch.setattr(async_drive_uploader, 'DRIVE_UPLOAD_URL', f'{drive.base_url}/upload/drive/v3')
+        uploader = async_drive_uploader.AsyncGoogleDriveUploader()
+        uploader.creds = SimpleNamespace(valid=True, token='test-token')
+        try:
+            async with uploader:
+                return await scenario(uploader)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_session_start_is_retried(apk, monkeypatch):
+    drive = FakeDrive(session_failures=[503, 429])
+
+    file_id = _run(drive, monkeypatch, lambda uploader: uploader.upload_file(apk, None, 'app.apk'))
+
+    assert drive.files[file_id]['data'] == _read(apk)
+    assert drive.session_starts == 3
+    assert async_drive_uploader.get_scheduler('drive').stats['throttled'] == 1
+
+
+def test_session_start_client_error_fails_upload(apk, monkeypatch):
+    drive = FakeDrive(session_failures=[400])
+
+    assert _run(drive, monkeypatch, lambda uploader: uploader.upload_file(apk, None, 'app.apk')) is None
+    assert drive.session_starts == 1
+
+
+def test_failed_chunk_resumes_from_committed_offset(apk, monkeypatch):
+    drive = FakeDrive(chunk_failures=[503])
+
+    file_id = _run(drive, monkeypatch, lambda uploader: uploader.upload_file(apk, None, 'app.apk'))
+
+    assert drive.files[file_id]['data'] == _read(apk)
+
+
+def test_publish_latest_replaces_stable_copy_in_place(apk, monkeypatch):
+    drive = FakeDrive()
+
+    async def publish_twice(uploader):
+        first = await uploader.upload_apks_and_get_links([apk], '1.2.3', publish_latest=True)
+        second = await uploader.upload_apks_and_get_links([apk], '1.2.4', publish_latest=True)
+        return first, second
+
+    first, second = _run(drive, monkeypatch, publish_twice)
+
+    assert len(first) == 1 and len(second) == 1
+    assert drive.by_name('SecureMemo_v1.2.3.apk') and drive.by_name('SecureMemo_v1.2.4.apk')
+    # 고정 파일은 하나뿐이고 공개 상태가 유지됨 (두 번째 배포는 내용만 교체)
+    [(latest_id, latest)] = drive.by_name('SecureMemo_latest.apk')
+    assert latest['public'] and latest['data'] == _read(apk)
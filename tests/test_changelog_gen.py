@@ -0,0 +1,57 @@
+import json
+import subprocess
+
+import pytest
+
+import changelog_gen
+
+
+def _git(repo, *args):
+    subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo, subject):
+    _git(repo, 'commit', '--allow-empty', '-q', '-m', subject)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, 'config', 'user.email', 'dev@example.com')
+    _git(tmp_path, 'config', 'user.name', 'dev')
+    _commit(tmp_path, 'feat: 첫 릴리즈')
+    _git(tmp_path, 'tag', '-a', 'v1.0.0', '-m', 'Release v1.0.0')
+    _commit(tmp_path, 'feat(memo): 메모 고정')
+    _commit(tmp_path, 'fix: 잠금 화면 깜빡임')
+    _commit(tmp_path, '🚀 Release v1.1.0+2')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _subjects(groups):
+    return [commit['subject'] for _, commits in groups for commit in commits]
+
+
+def test_notes_since_previous_tag(repo):
+    groups = changelog_gen.build_release_notes(current_tag='v1.1.0')
+    assert [title for title, _ in groups] == ['🆕 새로운 기능', '🐛 버그 수정']
+    assert _subjects(groups) == ['메모 고정', '잠금 화면 깜빡임']
+
+
+def test_notes_after_head_is_tagged(repo):
+    # 재개/재배포처럼 이번 릴리즈 태그가 이미 HEAD에 있어도 이전 릴리즈부터 계산
+    _git(repo, 'tag', '-a', 'v1.1.0', '-m', 'Release v1.1.0+2')
+
+    assert changelog_gen.find_previous_tag() == 'v1.1.0'
+    assert changelog_gen.find_previous_tag('v1.1.0') == 'v1.0.0'
+    assert _subjects(changelog_gen.build_release_notes(current_tag='v1.1.0')) == ['메모 고정', '잠금 화면 깜빡임']
+
+
+def test_cache_is_reused_and_extended(repo):
+    changelog_gen.build_release_notes(current_tag='v1.1.0')
+    with open(changelog_gen.CACHE_PATH, encoding='utf-8') as f:
+        assert json.load(f)['base'] == 'v1.0.0'
+
+    _commit(repo, 'perf: 검색 속도 개선')
+    assert _subjects(changelog_gen.build_release_notes(current_tag='v1.1.0')) == [
+        '메모 고정', '잠금 화면 깜빡임', '검색 속도 개선']
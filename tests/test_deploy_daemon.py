@@ -0,0 +1,53 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip('googleapiclient')
+pytest.importorskip('google_auth_oauthlib')
+
+import auto_deploy
+import deploy_daemon
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(deploy_daemon, 'GoogleDriveUploader', lambda: None)
+    return deploy_daemon.DeployDaemon(queue_dir=str(tmp_path / 'queue'))
+
+
+def _enqueue(daemon, name, request):
+    os.makedirs(daemon.queue_dir, exist_ok=True)
+    with open(os.path.join(daemon.queue_dir, name), 'w', encoding='utf-8') as f:
+        f.write(request if isinstance(request, str) else json.dumps(request))
+
+
+def _run_queue(daemon, monkeypatch, outcomes):
+    monkeypatch.setattr(auto_deploy, 'run_pipeline', lambda version_type, uploader, **options: outcomes.pop(0))
+    daemon._claim_queue_files()
+    while not daemon.requests.empty():
+        daemon._process(*daemon.requests.get())
+
+
+def test_finished_queue_files_are_cleaned_up(daemon, monkeypatch):
+    _enqueue(daemon, '01-patch.json', {'version_type': 'patch'})
+    _enqueue(daemon, '02-hotfix.json', {'version_type': 'current', 'release': False})
+
+    _run_queue(daemon, monkeypatch, [True, False])
+
+    # 성공한 요청은 삭제, 실패한 요청은 다시 제출할 수 있도록 failed/에 보관
+    assert sorted(os.listdir(daemon.queue_dir)) == ['failed', 'results.jsonl']
+    assert os.listdir(os.path.join(daemon.queue_dir, 'failed')) == ['02-hotfix.json']
+    with open(os.path.join(daemon.queue_dir, 'results.jsonl'), encoding='utf-8') as f:
+        assert [json.loads(line)['success'] for line in f] == [True, False]
+
+
+def test_invalid_queue_file_is_moved_to_failed(daemon, monkeypatch):
+    _enqueue(daemon, 'broken.json', '{not json')
+    _enqueue(daemon, 'bad-type.json', {'version_type': 'huge'})
+
+    _run_queue(daemon, monkeypatch, [])
+
+    assert os.listdir(daemon.queue_dir) == ['failed']
+    assert sorted(os.listdir(os.path.join(daemon.queue_dir, 'failed'))) == ['bad-type.json', 'broken.json']
+    assert daemon.processed == 0
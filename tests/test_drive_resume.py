@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('googleapiclient')
+
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpMockSequence
+
+import google_drive_uploader
+from google_drive_uploader import GoogleDriveUploader, query_upload_status
+
+SIZE = 10 * 1024 * 1024
+
+
+class StubResponse(dict):
+    def __init__(self, status, **headers):
+        super().__init__(headers)
+        self.status = status
+        self.reason = ''
+
+
+class StubHttp:
+    def __init__(self, response, content=b''):
+        self.response = response
+        self.content = content
+        self.calls = []
+
+    def request(self, uri, method, headers=None):
+        self.calls.append((uri, method, headers))
+        return self.response, self.content
+
+
+def _request(response, content=b'', resumable_uri='https://upload.example.com/session'):
+    return SimpleNamespace(resumable_uri=resumable_uri, resumable_progress=0,
+                           http=StubHttp(response, content),
+                           postproc=lambda resp, content: {'id': content.decode()})
+
+
+def test_308_moves_progress_to_committed_offset():
+    request = _request(StubResponse(308, range='bytes=0-4194303'))
+
+    status, response = query_upload_status(request, SIZE)
+
+    assert response is None
+    assert request.resumable_progress == status.resumable_progress == 4 * 1024 * 1024
+    uri, method, headers = request.http.calls[0]
+    assert (uri, method) == ('https://upload.example.com/session', 'PUT')
+    assert headers['Content-Range'] == f'bytes */{SIZE}'
+
+
+def test_308_without_range_restarts_from_zero():
+    request = _request(StubResponse(308))
+    request.resumable_progress = 8 * 1024 * 1024
+
+    status, response = query_upload_status(request, SIZE)
+
+    assert response is None and request.resumable_progress == 0
+
+
+def test_completed_upload_returns_response():
+    request = _request(StubResponse(200), b'file-id')
+
+    status, response = query_upload_status(request, SIZE)
+
+    assert status is None and response == {'id': 'file-id'}
+
+
+def test_session_not_started_skips_query():
+    request = _request(StubResponse(500), resumable_uri=None)
+
+    status, response = query_upload_status(request, SIZE)
+
+    assert response is None and status.resumable_progress == 0
+    assert not request.http.calls
+
+
+def test_unexpected_status_raises():
+    request = _request(StubResponse(503))
+
+    with pytest.raises(HttpError):
+        query_upload_status(request, SIZE)
+
+
+def test_failed_chunk_resumes_from_committed_offset(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(google_drive_uploader, 'backoff_delay', lambda attempt: 0)
+    monkeypatch.setattr(google_drive_uploader, 'UPLOAD_CHUNK_SIZE', 256 * 1024)
+    path = tmp_path / 'version.json'
+    path.write_bytes(b'x' * 600 * 1024)
+    http = HttpMockSequence([
+        ({'status': '200', 'location': 'https://upload.example.com/session'}, ''),
+        ({'status': '308', 'range': 'bytes=0-262143'}, ''),
+        ({'status': '503'}, 'backend error'),
+        # 실패로 보고된 두 번째 청크도 서버에는 커밋됨
+        ({'status': '308', 'range': 'bytes=0-524287'}, ''),
+        ({'status': '200'}, '{"id": "pinned-id"}'),
+    ])
+    sent = []
+    request = http.request
+
+    def record(uri, method='GET', body=None, headers=None, **kwargs):
+        sent.append((method, (headers or {}).get('Content-Range')))
+        return request(uri, method, body=body, headers=headers, **kwargs)
+
+    http.request = record
+    uploader = GoogleDriveUploader()
+    uploader.service = build('drive', 'v3', http=http, static_discovery=True)
+
+    assert uploader.upload_file(str(path), None, 'version.json', existing_file_id='pinned-id') == 'pinned-id'
+    # 오프셋은 한 번만 조회하고, 커밋된 바이트 이후만 다시 보냄
+    assert sent[1:] == [('PUT', 'bytes 0-262143/614400'), ('PUT', 'bytes 262144-524287/614400'),
+                        ('PUT', 'bytes */614400'), ('PUT', 'bytes 524288-614399/614400')]
+    assert uploader.last_upload_metrics.retries == 1
@@ -0,0 +1,155 @@
+from types import SimpleNamespace
+
+import pytest
+
+import drive_retention
+from api_scheduler import ApiScheduler
+from drive_retention import delete_files_batched, select_deletions
+
+
+def _apk(file_id, version):
+    return {'id': file_id, 'name': f'SecureMemo_v{version}.apk', 'size': 1024,
+            'version': tuple(map(int, version.split('.')))}
+
+
+def _names(files):
+    return [f['name'] for f in files]
+
+
+APKS = [_apk('id-190', '1.9.0'), _apk('id-200', '2.0.0'), _apk('id-290', '2.9.0'),
+        _apk('id-2100', '2.10.0'), _apk('id-2101', '2.10.1'), _apk('id-211', '2.11.0'),
+        _apk('id-300', '3.0.0'), _apk('id-301', '3.0.1')]
+
+
+def test_keeps_latest_by_numeric_version():
+    deletions, kept = select_deletions(APKS, 2, set(), set())
+
+    # 2.10.x는 문자열 순서가 아니라 숫자 순서로 2.9.0보다 최신
+    assert _names(kept) == ['SecureMemo_v3.0.1.apk', 'SecureMemo_v3.0.0.apk',
+                            'SecureMemo_v2.11.0.apk', 'SecureMemo_v1.9.0.apk']
+    assert _names(deletions) == ['SecureMemo_v2.10.1.apk', 'SecureMemo_v2.10.0.apk',
+                                 'SecureMemo_v2.9.0.apk', 'SecureMemo_v2.0.0.apk']
+
+
+def test_keeps_last_release_of_each_major():
+    deletions, kept = select_deletions(APKS, 0, set(), set())
+    assert _names(kept) == ['SecureMemo_v3.0.1.apk', 'SecureMemo_v2.11.0.apk', 'SecureMemo_v1.9.0.apk']
+    assert len(deletions) == len(APKS) - 3
+
+
+def test_protected_ids_and_names_are_kept():
+    deletions, kept = select_deletions(APKS, 1, {'id-200'}, {'SecureMemo_v2.9.0.apk'})
+    assert {'SecureMemo_v2.0.0.apk', 'SecureMemo_v2.9.0.apk'} <= set(_names(kept))
+    assert not {'id-200', 'id-290'} & {f['id'] for f in deletions}
+
+
+def test_keep_last_larger_than_folder_deletes_nothing():
+    deletions, kept = select_deletions(APKS, 100, set(), set())
+    assert deletions == [] and len(kept) == len(APKS)
+
+
+class StubHttpError(Exception):
+    def __init__(self, status, content=b''):
+        super().__init__(f'HTTP {status}')
+        self.resp = SimpleNamespace(status=status)
+        self.content = content
+
+
+class StubBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.request_ids = []
+
+    def add(self, request, request_id):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        self.service.batches.append(list(self.request_ids))
+        if self.service.batch_errors:
+            raise self.service.batch_errors.pop(0)
+        for request_id in self.request_ids:
+            errors = self.service.item_errors.get(request_id) or []
+            exception = errors.pop(0) if errors else None
+            if exception is None:
+                self.service.deleted.append(request_id)
+            self.callback(request_id, None, exception)
+
+
+class StubDriveService:
+    """배치 삭제 API만 구현한 Drive 대역 (항목별 오류를 차례로 반환)"""
+
+    def __init__(self, item_errors=None, batch_errors=None):
+        self.item_errors = item_errors or {}
+        self.batch_errors = batch_errors or []
+        self.batches = []
+        self.deleted = []
+
+    def new_batch_http_request(self, callback):
+        return StubBatch(self, callback)
+
+    def files(self):
+        return SimpleNamespace(delete=lambda fileId: fileId)
+
+
+@pytest.fixture(autouse=True)
+def scheduler(monkeypatch):
+    scheduler = ApiScheduler('drive', 1000.0, 20)
+    monkeypatch.setattr(drive_retention, 'get_scheduler', lambda name: scheduler)
+    return scheduler
+
+
+FILES = [_apk('a', '1.0.0'), _apk('b', '1.0.1'), _apk('c', '1.0.2')]
+
+
+def test_only_rate_limited_items_are_retried(scheduler):
+    service = StubDriveService({'b': [StubHttpError(429)],
+                                'c': [StubHttpError(403, b'userRateLimitExceeded')]})
+
+    deleted, failed = delete_files_batched(service, FILES)
+
+    assert service.batches == [['a', 'b', 'c'], ['b', 'c']]
+    assert [f['id'] for f in deleted] == ['a', 'b', 'c']
+    assert failed == []
+    assert scheduler.stats['throttled'] == 1
+
+
+def test_permanent_errors_are_not_retried():
+    service = StubDriveService({'a': [StubHttpError(404)], 'b': [StubHttpError(403, b'insufficientFilePermissions')]})
+
+    deleted, failed = delete_files_batched(service, FILES)
+
+    assert service.batches == [['a', 'b', 'c']]
+    assert [f['id'] for f in failed] == ['a', 'b']
+    assert [f['id'] for f in deleted] == ['c']
+
+
+def test_rate_limited_batch_is_sent_again():
+    service = StubDriveService(batch_errors=[StubHttpError(429)])
+
+    deleted, failed = delete_files_batched(service, FILES)
+
+    assert service.batches == [['a', 'b', 'c'], ['a', 'b', 'c']]
+    assert service.deleted == ['a', 'b', 'c']
+    assert [f['id'] for f in deleted] == ['a', 'b', 'c'] and failed == []
+
+
+def test_retry_budget_is_limited():
+    service = StubDriveService({'b': [StubHttpError(429)] * 10})
+
+    deleted, failed = delete_files_batched(service, FILES, max_retries=2)
+
+    assert service.batches == [['a', 'b', 'c'], ['b'], ['b']]
+    assert [f['id'] for f in deleted] == ['a', 'c']
+    assert [f['id'] for f in failed] == ['b']
+
+
+def test_batches_respect_bucket_size(scheduler):
+    files = [_apk(f'id-{n}', f'1.0.{n}') for n in range(45)]
+    service = StubDriveService()
+
+    deleted, _ = delete_files_batched(service, files)
+
+    assert [len(batch) for batch in service.batches] == [20, 20, 5]
+    assert len(deleted) == 45
+    assert scheduler.stats['calls'] == 45
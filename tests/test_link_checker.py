@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from link_checker import (DEAD, ERROR, OK, Link, LinkChecker, extract_links, find_current_link, find_problems,
+                          rewrite_text)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """다운로드 호스트 대역 (경로별로 정해진 응답)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self, code, headers=None, body=b''):
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _dispatch(self):
+        self.server.requests.append((self.command, self.path, self.headers.get('Range')))
+        if self.path == '/ok.apk':
+            self._respond(200)
+        elif self.path == '/gone.apk':
+            self._respond(404)
+        elif self.path == '/nohead.apk':
+            if self.command == 'HEAD':
+                self._respond(405)
+            else:
+                self._respond(206, {'Content-Range': 'bytes 0-0/1000'}, b'x')
+        elif self.path.startswith('/hop/'):
+            remaining = int(self.path.rsplit('/', 1)[1])
+            self._respond(302, {'Location': f'/hop/{remaining - 1}' if remaining > 1 else '/ok.apk'})
+        elif self.path == '/limited.apk':
+            self.server.limited_calls += 1
+            if self.server.limited_calls == 1:
+                self._respond(429, {'Retry-After': '0'})
+            else:
+                self._respond(200)
+        else:
+            self._respond(500)
+
+    do_HEAD = _dispatch
+    do_GET = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.limited_calls = 0
+    server.base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _check(server, *paths):
+    checker = LinkChecker(rate=100.0, burst=20, workers=4, timeout=5)
+    results = checker.check_all(f'{server.base_url}{path}' for path in paths)
+    return checker, {url[len(server.base_url):]: result for url, result in results.items()}
+
+
+def test_ok_and_dead(server):
+    _, results = _check(server, '/ok.apk', '/gone.apk')
+    assert results['/ok.apk']['status'] == OK
+    assert results['/gone.apk']['status'] == DEAD
+    assert results['/gone.apk']['code'] == 404
+
+
+def test_head_rejected_falls_back_to_range_get(server):
+    _, results = _check(server, '/nohead.apk')
+    assert results['/nohead.apk']['status'] == OK
+    assert results['/nohead.apk']['code'] == 206
+    assert ('GET', '/nohead.apk', 'bytes=0-0') in server.requests
+
+
+def test_redirect_chain(server):
+    _, results = _check(server, '/hop/3')
+    assert results['/hop/3']['status'] == OK
+    assert results['/hop/3']['final_url'] == f'{server.base_url}/ok.apk'
+
+
+def test_too_many_redirects(server):
+    _, results = _check(server, '/hop/10')
+    assert results['/hop/10']['status'] == ERROR
+
+
+def test_rate_limited_host_backs_off_and_retries(server):
+    checker, results = _check(server, '/limited.apk')
+    assert results['/limited.apk']['status'] == OK
+    limiter = checker.limiters['127.0.0.1']
+    assert limiter.stats['throttled'] == 1
+    assert server.limited_calls == 2
+
+
+def test_connection_error_is_not_dead():
+    checker = LinkChecker(rate=100.0, burst=20, workers=1, timeout=2)
+    result = checker.check_all(['http://127.0.0.1:1/app.apk'])['http://127.0.0.1:1/app.apk']
+    assert result['status'] == ERROR
+
+
+def test_rewrite_text_replaces_dead_and_stale_links():
+    text = ("[📱 APK 다운로드 (Google Drive)](https://example.com/old.apk)\n"
+            "- v1.0.1 (최신) → [다운로드 링크](https://example.com/new.apk)\n"
+            "- v1.0.0 → [다운로드 링크](https://example.com/gone.apk)\n"
+            "- v0.9.0 → [다운로드 링크](https://example.com/flaky.apk)\n")
+    links = extract_links(text, 'README.md')
+    results = {
+        'https://example.com/old.apk': {'status': OK, 'detail': 'HTTP 200'},
+        'https://example.com/new.apk': {'status': OK, 'detail': 'HTTP 200'},
+        'https://example.com/gone.apk': {'status': DEAD, 'detail': 'HTTP 404'},
+        'https://example.com/flaky.apk': {'status': ERROR, 'detail': 'HTTP 503'},
+    }
+    problems = find_problems(links, results, current_link='https://example.com/new.apk')
+    assert [(link.line, kind) for link, kind, _ in problems] == [(1, 'stale'), (3, DEAD), (4, ERROR)]
+
+    rewritten, replaced = rewrite_text(text, problems, 'https://example.com/new.apk')
+    assert replaced == 2
+    lines = rewritten.split('\n')
+    assert lines[0] == '[📱 APK 다운로드 (Google Drive)](https://example.com/new.apk)'
+    assert lines[2] == '- v1.0.0 → [다운로드 링크](https://example.com/new.apk)'
+    # 일시적인 실패는 교체하지 않음
+    assert 'flaky.apk' in lines[3]
+
+
+def test_rewrite_text_only_touches_reported_line():
+    text = "[a](https://example.com/gone.apk)\n[b](https://example.com/gone.apk)\n"
+    problems = [(Link('https://example.com/gone.apk', 'README.md', 2, False), DEAD, 'HTTP 404')]
+    rewritten, replaced = rewrite_text(text, problems, 'https://example.com/new.apk')
+    assert replaced == 1
+    assert rewritten == "[a](https://example.com/gone.apk)\n[b](https://example.com/new.apk)\n"
+
+
+def _write_release_records(tmp_path, manifest_age, history_age):
+    (tmp_path / 'version.json').write_text(json.dumps({'apk_url': 'https://example.com/manifest.apk'}))
+    mtime = time.time() - manifest_age.total_seconds()
+    os.utime(tmp_path / 'version.json', (mtime, mtime))
+    store = tmp_path / '.deploy' / 'artifacts'
+    store.mkdir(parents=True)
+    published_at = (datetime.now() - history_age).isoformat(timespec='seconds')
+    (store / 'index.json').write_text(json.dumps({'artifacts': [], 'history': [
+        {'sha256': 'a' * 64, 'version': '2.2.31', 'build': 119,
+         'link': 'https://example.com/published.apk', 'published_at': published_at}]}))
+
+
+def test_current_link_prefers_newer_publish_history(tmp_path, monkeypatch):
+    # auto_deploy는 version.json을 다시 쓰지 않으므로 방금 배포한 링크는 배포 이력에만 있음
+    monkeypatch.chdir(tmp_path)
+    _write_release_records(tmp_path, manifest_age=timedelta(days=3), history_age=timedelta(minutes=5))
+    assert find_current_link() == 'https://example.com/published.apk'
+
+
+def test_current_link_prefers_newer_version_json(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_release_records(tmp_path, manifest_age=timedelta(minutes=5), history_age=timedelta(days=3))
+    assert find_current_link() == 'https://example.com/manifest.apk'
+    assert find_current_link('https://example.com/explicit.apk') == 'https://example.com/explicit.apk'
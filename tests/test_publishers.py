@@ -0,0 +1,127 @@
+import os
+import threading
+
+import pytest
+
+from publishers import LocalDirPublisher, Publisher, S3Publisher, create_publisher
+
+PART_SIZE = 64 * 1024
+
+
+class StubS3Client:
+    """멀티파트 업로드 API만 구현한 메모리 S3 대역"""
+
+    def __init__(self, fail_part=None):
+        self.objects = {}
+        self.uploads = {}
+        self.aborted = []
+        self.fail_part = fail_part
+        self.lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[(Bucket, Key)] = Body.read()
+
+    def create_multipart_upload(self, Bucket, Key, ContentType=None):
+        upload_id = f'upload-{len(self.uploads) + 1}'
+        self.uploads[upload_id] = {}
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        if PartNumber == self.fail_part:
+            raise ConnectionError(f'part {PartNumber} 전송 실패')
+        with self.lock:
+            self.uploads[UploadId][PartNumber] = Body
+        return {'ETag': f'"etag-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        numbers = [part['PartNumber'] for part in MultipartUpload['Parts']]
+        assert numbers == sorted(parts)
+        assert [part['ETag'] for part in MultipartUpload['Parts']] == [f'"etag-{n}"' for n in numbers]
+        self.objects[(Bucket, Key)] = b''.join(parts[n] for n in numbers)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId, None)
+        self.aborted.append(UploadId)
+
+
+@pytest.fixture
+def apk(tmp_path):
+    path = tmp_path / 'app-release.apk'
+    # 마지막 파트가 짧도록 파트 크기의 배수가 아닌 크기
+    path.write_bytes(os.urandom(PART_SIZE * 5 + 1234))
+    return str(path)
+
+
+def test_publisher_is_abstract():
+    with pytest.raises(TypeError):
+        Publisher()
+
+
+def test_s3_multipart_upload_assembles_parts(apk):
+    client = StubS3Client()
+    publisher = S3Publisher('releases', 'apk', endpoint_url='http://127.0.0.1:9000',
+                            part_size=PART_SIZE, max_workers=4, client=client)
+
+    result = publisher.publish(apk, '2.2.31')
+
+    with open(apk, 'rb') as f:
+        assert client.objects[('releases', 'apk/SecureMemo_v2.2.31.apk')] == f.read()
+    assert result['url'] == 'http://127.0.0.1:9000/releases/apk/SecureMemo_v2.2.31.apk'
+    assert result['size'] == os.path.getsize(apk)
+    assert not client.uploads and not client.aborted
+
+
+def test_s3_small_file_uses_single_put(apk):
+    client = StubS3Client()
+    publisher = S3Publisher('releases', part_size=PART_SIZE * 10, client=client)
+
+    publisher.publish(apk, None)
+
+    assert ('releases', 'SecureMemo_latest.apk') in client.objects
+    assert not client.uploads
+
+
+def test_s3_multipart_failure_aborts_upload(apk):
+    client = StubS3Client(fail_part=3)
+    publisher = S3Publisher('releases', part_size=PART_SIZE, max_workers=4, client=client)
+
+    with pytest.raises(ConnectionError):
+        publisher.publish(apk, '2.2.31')
+
+    assert client.aborted == ['upload-1']
+    assert not client.uploads
+    assert not client.objects
+
+
+def test_local_dir_publisher(apk, tmp_path):
+    target = tmp_path / 'www'
+    result = create_publisher(f'local:{target}').publish(apk, '2.2.31')
+
+    assert isinstance(create_publisher(f'local:{target}'), LocalDirPublisher)
+    assert (target / 'SecureMemo_v2.2.31.apk').read_bytes() == open(apk, 'rb').read()
+    assert result['url'].startswith('file://')
+
+
+def test_s3_multipart_with_moto(apk, monkeypatch):
+    boto3 = pytest.importorskip('boto3')
+    moto = pytest.importorskip('moto')
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'test')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'test')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+
+    with moto.mock_aws():
+        client = boto3.client('s3')
+        client.create_bucket(Bucket='releases')
+        # S3는 마지막을 제외한 파트가 5MB 이상이어야 함
+        large = os.path.join(os.path.dirname(apk), 'large.apk')
+        with open(large, 'wb') as f:
+            f.write(os.urandom(5 * 1024 * 1024 * 2 + 1234))
+
+        publisher = S3Publisher('releases', part_size=5 * 1024 * 1024, client=client)
+        publisher.publish(large, '2.2.31')
+
+        body = client.get_object(Bucket='releases', Key='SecureMemo_v2.2.31.apk')['Body'].read()
+        with open(large, 'rb') as f:
+            assert body == f.read()
+        assert not client.list_multipart_uploads(Bucket='releases').get('Uploads')
@@ -0,0 +1,73 @@
+import subprocess
+
+import pytest
+
+import release_git
+from release_git import GitError, commit_files, commit_tag_and_push, snapshot_file
+
+
+def _git(repo, *args):
+    return subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True,
+                          text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, 'config', 'user.email', 'dev@example.com')
+    _git(tmp_path, 'config', 'user.name', 'dev')
+    (tmp_path / 'pubspec.yaml').write_text('version: 1.0.0+1\n', encoding='utf-8')
+    (tmp_path / 'CHANGELOG.md').write_text('# 변경사항\n\n', encoding='utf-8')
+    _git(tmp_path, 'add', '.')
+    _git(tmp_path, 'commit', '-q', '-m', 'init')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_snapshot_is_committed_instead_of_working_tree(repo):
+    # 배포 A가 잠금 안에서 쓰고 스냅숏을 찍은 뒤
+    (repo / 'pubspec.yaml').write_text('version: 1.0.1+2\n', encoding='utf-8')
+    (repo / 'CHANGELOG.md').write_text('# 변경사항\n\n## v1.0.1+2\n', encoding='utf-8')
+    snapshots = {path: snapshot_file(path) for path in ('pubspec.yaml', 'CHANGELOG.md')}
+    # 배포 B가 Git 단계 전에 같은 파일을 다시 수정
+    (repo / 'pubspec.yaml').write_text('version: 1.0.2+3\n', encoding='utf-8')
+    (repo / 'CHANGELOG.md').write_text('# 변경사항\n\n## v1.0.2+3\n## v1.0.1+2\n', encoding='utf-8')
+
+    commit = commit_tag_and_push(['pubspec.yaml', 'CHANGELOG.md'], 'Release v1.0.1+2', 'v1.0.1',
+                                 'Release v1.0.1+2', push=False, snapshots=snapshots)
+
+    assert _git(repo, 'rev-parse', 'HEAD') == commit == _git(repo, 'rev-parse', 'v1.0.1^{commit}')
+    assert _git(repo, 'show', 'v1.0.1:pubspec.yaml') == 'version: 1.0.1+2'
+    assert '1.0.2' not in _git(repo, 'show', 'v1.0.1:CHANGELOG.md')
+    # 작업 트리의 B 내용은 그대로 남아 B의 커밋에 들어감
+    assert (repo / 'pubspec.yaml').read_text(encoding='utf-8') == 'version: 1.0.2+3\n'
+    assert _git(repo, 'diff', '--name-only').split() == ['CHANGELOG.md', 'pubspec.yaml']
+
+
+def test_paths_without_snapshot_use_working_tree(repo):
+    (repo / 'pubspec.yaml').write_text('version: 1.0.1+2\n', encoding='utf-8')
+    (repo / 'README.md').write_text('readme\n', encoding='utf-8')
+
+    commit_files(['pubspec.yaml', 'README.md'], 'update', {'pubspec.yaml': None})
+
+    assert _git(repo, 'show', 'HEAD:pubspec.yaml') == 'version: 1.0.1+2'
+    assert _git(repo, 'show', 'HEAD:README.md') == 'readme'
+    assert _git(repo, 'status', '--porcelain') == ''
+
+
+def test_snapshot_of_missing_file_is_none(repo):
+    assert snapshot_file('missing.txt') is None
+
+
+def test_existing_tag_leaves_head_untouched(repo):
+    head = _git(repo, 'rev-parse', 'HEAD')
+    _git(repo, 'tag', '-a', 'v1.0.1', '-m', 'Release v1.0.1')
+    (repo / 'pubspec.yaml').write_text('version: 1.0.1+2\n', encoding='utf-8')
+    snapshots = {'pubspec.yaml': snapshot_file('pubspec.yaml')}
+
+    with pytest.raises(GitError):
+        commit_tag_and_push(['pubspec.yaml'], 'Release', 'v1.0.1', 'Release', push=False,
+                            snapshots=snapshots)
+
+    assert _git(repo, 'rev-parse', 'HEAD') == head
+    assert release_git._git('diff', '--cached', '--name-only') == ''
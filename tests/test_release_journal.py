@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from release_journal import ReleaseJournal, find_resumable, load_journals
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    return str(tmp_path / 'journal')
+
+
+def _create(journal_dir, version_type='current'):
+    return ReleaseJournal.create('2.2.31', 119, version_type, {'upload': True}, journal_dir=journal_dir)
+
+
+def test_redeploy_of_same_build_keeps_previous_journal(journal_dir):
+    first = _create(journal_dir, 'patch')
+    first.complete('version', version='2.2.31')
+    first.complete('build', apk_sha256='abc')
+    first.fail('publish')
+
+    second = _create(journal_dir)
+
+    assert first.path != second.path
+    assert os.path.basename(second.path) == 'v2.2.31+119.run2.json'
+    assert (first.run, second.run) == (1, 2)
+    # 이전 실행의 단계 기록은 그대로 남아 --resume으로 이어갈 수 있음
+    kept = ReleaseJournal.load(first.path)
+    assert kept.outputs('build') == {'apk_sha256': 'abc'}
+    assert kept.data['failed_stage'] == 'publish'
+
+
+def test_latest_run_is_resumed_first(journal_dir):
+    first = _create(journal_dir)
+    second = _create(journal_dir)
+    second.complete('version', version='2.2.31')
+
+    assert [journal.run for journal in load_journals(journal_dir)] == [2, 1]
+    assert find_resumable('2.2.31+119', journal_dir).path == second.path
+    second.finish()
+    assert find_resumable('2.2.31', journal_dir).path == first.path
+    assert '#2' in second.describe() and '#' not in first.describe()
+
+
+def test_reserved_empty_journal_is_skipped(journal_dir, capsys):
+    _create(journal_dir)
+    open(os.path.join(journal_dir, 'v2.2.32+120.json'), 'w').close()
+
+    assert [journal.version for journal in load_journals(journal_dir)] == ['2.2.31']
+    assert '읽을 수 없습니다' not in capsys.readouterr().out
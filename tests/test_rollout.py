@@ -0,0 +1,14 @@
+from rollout import effective_percentage, full_rollout_fields, rollout_fields
+
+
+def test_default_rollout_is_staged():
+    data = rollout_fields()
+    assert effective_percentage(data, 0) == 10
+    assert effective_percentage(data, 24) == 50
+    assert effective_percentage(data, 72) == 100
+
+
+def test_full_rollout_reaches_everyone_immediately():
+    data = full_rollout_fields()
+    assert data['ramp_schedule'] == []
+    assert effective_percentage(data, 0) == 100
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from rollout import full_rollout_fields
+from update_version import create_version_json, drive_download_url
+
+APK_SIZE = 3 * 1024 * 1024 + 321
+
+
+class ManifestHandler(BaseHTTPRequestHandler):
+    """배포 호스트 대역 (version.json은 ETag로 재검증, APK는 그대로 전송)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.path == '/version.json':
+            with open(self.server.manifest_path, 'rb') as f:
+                body = f.read()
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self._send(200, body, {'ETag': etag, 'Content-Type': 'application/json'})
+        elif self.path == '/app.apk':
+            self._send(200, self.server.apk_bytes, {'Content-Type': 'application/vnd.android.package-archive'})
+        else:
+            self._send(404, b'')
+
+    def _send(self, code, body, headers=None):
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def release_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    apk = tmp_path / 'app-release.apk'
+    apk.write_bytes(os.urandom(APK_SIZE))
+    return tmp_path
+
+
+@pytest.fixture
+def server(release_dir):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ManifestHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.manifest_path = str(release_dir / 'version.json')
+    server.apk_bytes = (release_dir / 'app-release.apk').read_bytes()
+    server.base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _fetch_manifest(url, cache):
+    """앱(UpdateService)과 같은 방식: 캐시한 ETag로 조건부 요청, 304면 캐시 재사용"""
+    request = urllib.request.Request(url)
+    if cache.get('etag'):
+        request.add_header('If-None-Match', cache['etag'])
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            cache['body'] = response.read()
+            cache['etag'] = response.headers.get('ETag')
+    except urllib.error.HTTPError as error:
+        if error.code != 304:
+            raise
+    return json.loads(cache['body'])
+
+
+def _download_verified(url, sha256, size):
+    """APK를 블록 단위로 받으며 해시 (전체를 메모리에 올리지 않음)"""
+    digest = hashlib.sha256()
+    received = 0
+    with urllib.request.urlopen(url, timeout=5) as response:
+        for block in iter(lambda: response.read(64 * 1024), b''):
+            digest.update(block)
+            received += len(block)
+    return received == size and digest.hexdigest() == sha256
+
+
+@pytest.mark.parametrize('link, expected', [
+    ('https://drive.google.com/file/d/1AbC-d_9/view?usp=sharing',
+     'https://drive.usercontent.google.com/download?id=1AbC-d_9&export=download&confirm=t'),
+    ('https://drive.google.com/open?id=1AbC-d_9',
+     'https://drive.usercontent.google.com/download?id=1AbC-d_9&export=download&confirm=t'),
+    ('https://drive.google.com/drive/folders', 'https://drive.google.com/drive/folders'),
+    ('http://127.0.0.1:8000/app.apk', 'http://127.0.0.1:8000/app.apk'),
+    (None, None),
+])
+def test_drive_download_url(link, expected):
+    assert drive_download_url(link) == expected
+
+
+def test_version_json_integrity_fields(release_dir):
+    link = 'https://drive.google.com/file/d/1AbC/view?usp=sharing'
+    create_version_json('2.2.31', 119, link, apk_path='app-release.apk')
+
+    data = json.loads((release_dir / 'version.json').read_text(encoding='utf-8'))
+    apk_bytes = (release_dir / 'app-release.apk').read_bytes()
+    assert (data['version'], data['build'], data['apk_url']) == ('2.2.31', 119, link)
+    assert data['apk_download_url'] == drive_download_url(link)
+    assert data['apk_sha256'] == hashlib.sha256(apk_bytes).hexdigest()
+    assert data['apk_size'] == APK_SIZE
+    # 새 릴리즈의 기본값은 단계적 배포
+    assert data['rollout_percentage'] == 10 and data['ramp_schedule']
+
+
+def test_version_json_without_apk_has_no_integrity_fields(release_dir):
+    create_version_json('2.2.31', 119, 'https://example.com/app.apk', rollout=full_rollout_fields(),
+                        apk_path='missing.apk')
+
+    data = json.loads((release_dir / 'version.json').read_text(encoding='utf-8'))
+    assert not {'apk_download_url', 'apk_sha256', 'apk_size'} & set(data)
+    assert data['rollout_percentage'] == 100 and data['ramp_schedule'] == []
+
+
+def test_manifest_is_revalidated_with_etag(server):
+    create_version_json('2.2.31', 119, f'{server.base_url}/app.apk', apk_path='app-release.apk')
+    cache = {}
+    url = f'{server.base_url}/version.json'
+
+    first = _fetch_manifest(url, cache)
+    # 바뀌지 않았으면 304 (본문 없이 캐시 재사용)
+    assert _fetch_manifest(url, cache) == first
+    assert server.requests[1] == ('/version.json', cache['etag'])
+
+    create_version_json('2.2.32', 120, f'{server.base_url}/app.apk', apk_path='app-release.apk')
+    assert _fetch_manifest(url, cache)['version'] == '2.2.32'
+
+
+def test_downloaded_apk_is_verified_against_manifest(server):
+    create_version_json('2.2.31', 119, f'{server.base_url}/app.apk', apk_path='app-release.apk')
+    manifest = _fetch_manifest(f'{server.base_url}/version.json', {})
+
+    assert _download_verified(manifest['apk_download_url'], manifest['apk_sha256'], manifest['apk_size'])
+
+    # 전송 중 변조되거나 다른 빌드가 올라가 있으면 거부
+    corrupted = bytearray(server.apk_bytes)
+    corrupted[APK_SIZE // 2] ^= 0xFF
+    server.apk_bytes = bytes(corrupted)
+    assert not _download_verified(manifest['apk_download_url'], manifest['apk_sha256'], manifest['apk_size'])
+    server.apk_bytes = server.apk_bytes[:-1]
+    assert not _download_verified(manifest['apk_download_url'], manifest['apk_sha256'], manifest['apk_size'])
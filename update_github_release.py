@@ -14,6 +14,8 @@ import sys
 import os
 from datetime import datetime
 
+from api_scheduler import COSMETIC, NORMAL, get_scheduler
+
 # GitHub 설정
 GITHUB_OWNER = "jiwoosoft"
 GITHUB_REPO = "android-memo"
@@ -41,7 +43,7 @@ def get_release_by_tag(tag_name, token):
     }
     
     try:
-        response = requests.get(url, headers=headers)
+        response = get_scheduler('github').request(lambda: requests.get(url, headers=headers), NORMAL)
         if response.status_code == 200:
             return response.json()
         else:
@@ -67,7 +69,9 @@ def update_release_body(release_id, new_body, token):
     }
     
     try:
-        response = requests.patch(url, headers=headers, json=data)
+        # 릴리즈 노트 갱신은 부가 작업이므로 가장 낮은 우선순위로 실행
+        response = get_scheduler('github').request(
+            lambda: requests.patch(url, headers=headers, json=data), COSMETIC)
         if response.status_code == 200:
             return response.json()
         else:
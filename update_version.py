@@ -11,16 +11,21 @@ Flutter 앱 전체 자동화 스크립트:
 
 import re
 import sys
+import atexit
 import subprocess
 import os
 import json
 from datetime import datetime
 from pathlib import Path
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.oauth2.credentials import Credentials
+
+import changelog_gen
+import gradle_cache
+import pub_cache
+import release_profiler
+from release_lock import atomic_write_text, release_lock
+from api_scheduler import CRITICAL, get_scheduler
+from rollout import rollout_fields
+from artifact_io import sha256_file
 
 GITHUB_REPO = "jiwoosoft/android-memo"
 APK_PATH = "build/app/outputs/flutter-apk/app-release.apk"
@@ -33,8 +38,7 @@ def read_file(filepath):
 
 
 def write_file(filepath, content):
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    atomic_write_text(filepath, content)
 
 
 def get_current_version():
@@ -51,7 +55,7 @@ def update_pubspec_version(major, minor, patch, build):
     return f"{major}.{minor}.{patch}", build
 
 
-def update_readme_version(version, link):
+def update_readme_version(version, link, summary=''):
     today = datetime.now().strftime('%Y.%m.%d')
     for file in ['README.md', 'releases/README.md']:
         if os.path.exists(file):
@@ -61,6 +65,8 @@ def update_readme_version(version, link):
                 content += "\n\n### 🚀 다운로드 히스토리\n"
 
             history_entry = f"- v{version} (최신) - {today} → [다운로드 링크]({link})"
+            if summary:
+                history_entry += f" · {summary}"
             content = re.sub(r'(### 🚀 다운로드 히스토리\n)', r'\1' + history_entry + '\n', content)
 
             content = re.sub(r'### 🚀 최신 버전 \(v\d+\.\d+\.\d+\)', f'### 🚀 최신 버전 (v{version})', content)
@@ -70,20 +76,13 @@ def update_readme_version(version, link):
             write_file(file, content)
 
 
-def create_release_entry(version, build, link):
+def create_release_entry(version, build, link, notes=None):
     today = datetime.now().strftime('%Y.%m.%d')
+    sections = changelog_gen.render_sections(notes or [])
     entry = f"""
 ## 📦 v{version} - {today}
 
-### 🆕 새로운 기능
--
-
-### 🔧 개선사항
--
-
-### 🐛 버그 수정
--
-
+{sections}
 ### 📱 기술적 변경사항
 - 빌드 번호: {build}
 - 패키지: com.jiwoosoft.secure_memo
@@ -101,7 +100,17 @@ def create_release_entry(version, build, link):
     write_file(changelog, new_content)
 
 
-def create_version_json(version: str, build: int, link: str):
+def drive_download_url(link):
+    """Drive 공유 링크를 앱이 직접 내려받을 수 있는 URL로 변환 (대용량 파일 확인 페이지 생략)"""
+    if 'drive.google.com' not in (link or ''):
+        return link
+    match = re.search(r'/d/([a-zA-Z0-9_-]+)', link) or re.search(r'[?&]id=([a-zA-Z0-9_-]+)', link)
+    if not match:
+        return link
+    return f"https://drive.usercontent.google.com/download?id={match.group(1)}&export=download&confirm=t"
+
+
+def create_version_json(version: str, build: int, link: str, rollout=None, apk_path=None, apk_sha256=None):
     data = {
         "version": version,
         "build": build,
@@ -109,14 +118,26 @@ def create_version_json(version: str, build: int, link: str):
         "release_date": datetime.now().strftime('%Y-%m-%d'),
         "description": f"{version} 버전 릴리즈"
     }
+    # 앱이 APK를 직접 내려받아 설치 전에 SHA-256을 검증하도록 무결성 정보 추가
+    if apk_path and os.path.exists(apk_path):
+        data["apk_download_url"] = drive_download_url(link)
+        data["apk_sha256"] = apk_sha256 or sha256_file(apk_path)
+        data["apk_size"] = os.path.getsize(apk_path)
+    # 단계적 배포 필드 (기본: 10% → 24시간 후 50% → 72시간 후 100%)
+    data.update(rollout or rollout_fields())
     with open("version.json", "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def run_flutter():
+def run_flutter(version=None, build=None):
+    # 할당받은 번호로 빌드 (그 사이 pubspec.yaml이 바뀌어도 영향 없음)
+    build_args = [f'--build-name={version}', f'--build-number={build}'] if version and build else []
     try:
-        subprocess.run(['flutter', 'pub', 'get'], check=True)
-        result = subprocess.run(['flutter', 'build', 'apk', '--release'], capture_output=True, text=True)
+        if not pub_cache.ensure_dependencies():
+            raise RuntimeError("flutter pub get 실패")
+        with gradle_cache.build_cache(f"{version}+{build}" if version and build else None):
+            result = subprocess.run(['flutter', 'build', 'apk', '--release', '--no-pub', *build_args],
+                                    capture_output=True, text=True)
         if result.returncode != 0:
             raise RuntimeError(f"APK 빌드 실패: {result.stderr}")
         print("✅ flutter build apk 성공")
@@ -124,16 +145,24 @@ def run_flutter():
         print("⚠️ Flutter가 설치되지 않았거나 PATH에 없습니다.")
 
 
+# 릴리즈 과정에서 이 스크립트가 수정하는 파일 (릴리즈 커밋에는 이 파일들만 포함)
+RELEASE_FILES = ['pubspec.yaml', 'README.md', 'releases/README.md', 'CHANGELOG.md', 'version.json']
+
+
 def git_commit_tag_push(version, update_type):
-    subprocess.run(['git', 'add', '.'], check=True)
+    from release_git import commit_tag_and_push
     msg = f"🚀 Release v{version} - {update_type} 업데이트"
-    subprocess.run(['git', 'commit', '-m', msg], check=True)
-    subprocess.run(['git', 'tag', '-a', f'v{version}', '-m', f'Release v{version}'], check=True)
-    subprocess.run(['git', 'push', 'origin', 'main'], check=True)
-    subprocess.run(['git', 'push', '--tags'], check=True)
+    paths = [path for path in RELEASE_FILES if os.path.exists(path)]
+    commit_tag_and_push(paths, msg, f'v{version}', f'Release v{version}')
 
 
 def upload_to_google_drive(apk_path, folder_id, version):
+    from googleapiclient.discovery import build
+    from googleapiclient.http import MediaFileUpload
+    from google.auth.transport.requests import Request
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.oauth2.credentials import Credentials
+
     SCOPES = ['https://www.googleapis.com/auth/drive.file']
     creds = None
 
@@ -157,35 +186,42 @@ def upload_to_google_drive(apk_path, folder_id, version):
         'parents': [folder_id]
     }
     media = MediaFileUpload(apk_path, mimetype='application/vnd.android.package-archive')
-    file = service.files().create(
+    file = get_scheduler('drive').execute(service.files().create(
         body=file_metadata,
         media_body=media,
         fields='id, webViewLink'
-    ).execute()
+    ), CRITICAL)
 
     print(f"✅ Google Drive 업로드 완료 → 링크: {file.get('webViewLink')}")
-    return file.get('webViewLink'), service
+    return file.get('webViewLink')
 
 
-def upload_version_json_to_drive(service, folder_id):
-    file_metadata = {'name': 'version.json', 'parents': [folder_id]}
-    media = MediaFileUpload('version.json', mimetype='application/json')
-    file = service.files().create(
-        body=file_metadata,
-        media_body=media,
-        fields='id, webViewLink'
-    ).execute()
-    print(f"✅ version.json 업로드 완료 → 링크: {file.get('webViewLink')}")
+def upload_version_json(folder_id):
+    """version.json 업로드 (google_drive_uploader와 같은 경로로 앱이 참조하는 VERSION_JSON_FILE_ID를 제자리 교체)"""
+    from google_drive_uploader import GoogleDriveUploader
+    uploader = GoogleDriveUploader(credentials_path='client_id.json')
+    if not uploader.authenticate() or not uploader.upload_version_json('version.json', folder_id):
+        sys.exit("❌ version.json 업로드 실패")
+    print("✅ version.json 업로드 완료")
 
 
 def main():
-    if len(sys.argv) != 2:
-        sys.exit("사용법: python update_version.py [patch|minor|major|build]")
-
-    update_type = sys.argv[1].lower()
+    args = sys.argv[1:]
+    profile = '--profile' in args
+    if profile:
+        args.remove('--profile')
+    if len(args) != 1:
+        sys.exit("사용법: python update_version.py [patch|minor|major|build] [--profile]")
+
+    update_type = args[0].lower()
     if update_type not in ['patch', 'minor', 'major', 'build']:
         sys.exit("업데이트 타입은 patch, minor, major, build 중 하나여야 합니다.")
 
+    if profile:
+        # sys.exit로 중단되는 경우에도 보고서가 남도록 종료 시점에 저장
+        release_profiler.start('update_version')
+        atexit.register(release_profiler.stop)
+
     current = get_current_version()
     if not current:
         sys.exit("❌ pubspec.yaml에서 버전 정보를 찾을 수 없습니다.")
@@ -196,7 +232,7 @@ def main():
     elif update_type == 'patch': patch += 1; build += 1
     elif update_type == 'build': build += 1
 
-    version, build = update_pubspec_version(major, minor, patch, build)
+    version = f"{major}.{minor}.{patch}"
     print(f"📋 현재 버전: {'.'.join(map(str, current[:3]))}+{current[3]}")
     print(f"🆕 새 버전: {version}+{build}")
     confirm = input(f"버전을 {version}+{build}로 업데이트하시겠습니까? (y/N): ").strip().lower()
@@ -205,24 +241,37 @@ def main():
         return
 
     print("🔄 버전 업데이트 시작...")
-    update_pubspec_version(major, minor, patch, build)
+    release_profiler.begin_stage('version')
+    with release_lock('version'):
+        # 확인을 기다리는 동안 다른 배포가 버전을 올렸다면 같은 번호를 쓰지 않도록 중단
+        if get_current_version() != current:
+            sys.exit("❌ 그 사이 다른 배포가 pubspec.yaml 버전을 변경했습니다. 다시 실행하세요.")
+        update_pubspec_version(major, minor, patch, build)
     print("✅ pubspec.yaml 업데이트 완료:", f"{version}+{build}")
 
-    run_flutter()
+    release_profiler.begin_stage('build')
+    with release_lock('build'):
+        run_flutter(version, build)
 
-    if not os.path.exists(APK_PATH):
-        sys.exit(f"❌ APK 파일을 찾을 수 없습니다: {APK_PATH}")
+        if not os.path.exists(APK_PATH):
+            sys.exit(f"❌ APK 파일을 찾을 수 없습니다: {APK_PATH}")
 
-    link, service = upload_to_google_drive(APK_PATH, GOOGLE_FOLDER_ID, version)
-    update_readme_version(version, link)
-    print("✅ README.md 버전 정보 업데이트 완료")
+    release_profiler.begin_stage('upload')
+    link = upload_to_google_drive(APK_PATH, GOOGLE_FOLDER_ID, version)
+    release_profiler.begin_stage('docs')
+    notes = changelog_gen.build_release_notes(current_tag=f'v{version}')
+    with release_lock('docs'):
+        update_readme_version(version, link, changelog_gen.summary_line(notes))
+        print("✅ README.md 버전 정보 업데이트 완료")
 
-    create_release_entry(version, build, link)
-    print(f"✅ CHANGELOG.md에 v{version} 항목 추가 완료")
+        create_release_entry(version, build, link, notes)
+        print(f"✅ CHANGELOG.md에 v{version} 항목 추가 완료")
 
-    create_version_json(version, build, link)
-    upload_version_json_to_drive(service, GOOGLE_FOLDER_ID)
+    release_profiler.begin_stage('version_json')
+    create_version_json(version, build, link, rollout=rollout_fields(), apk_path=APK_PATH)
+    upload_version_json(GOOGLE_FOLDER_ID)
 
+    release_profiler.begin_stage('git')
     try:
         git_commit_tag_push(version, update_type)
     except Exception as e:
@@ -234,7 +283,7 @@ def main():
     print(f"- 새 버전: {version}+{build}")
     print(f"- 업데이트 타입: {update_type}")
     print("\n📝 다음 단계:")
-    print("1. CHANGELOG.md에서 릴리즈 노트 작성")
+    print("1. CHANGELOG.md에서 자동 생성된 릴리즈 노트 확인")
     print("2. APK 파일을 Google Drive에 업로드")
     print("3. README.md의 Google Drive 링크 확인")
     print(f"4. Git 푸시: git push origin main && git push origin v{version}")
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+업로드 처리량 지표 수집 및 내보내기
+업로드마다 청크별 전송 속도, 재시도 횟수, 첫 응답까지의 시간(TTFB), 전체 전송 시간을 기록하고
+Prometheus node-exporter textfile(.prom)과 JSON 요약 파일로 저장합니다.
+
+출력 위치:
+  - 환경변수 UPLOAD_METRICS_DIR (기본: .deploy/metrics)
+  - node-exporter textfile collector 디렉터리를 지정하면 대시보드에서 바로 수집됩니다.
+"""
+
+import os
+import json
+import time
+from datetime import datetime
+
+from release_lock import atomic_write_text
+
+METRICS_DIR = os.environ.get('UPLOAD_METRICS_DIR', os.path.join('.deploy', 'metrics'))
+PROM_FILE_NAME = 'securememo_upload.prom'
+SUMMARY_FILE_NAME = 'upload_summary.json'
+
+# 이번 배포에서 완료된 업로드 지표 (여러 파일 업로드 시 함께 내보냄)
+# 같은 파일/백엔드를 다시 올리면 마지막 결과만 남겨 Prometheus 시계열이 중복되지 않도록 함
+_completed_uploads = {}
+
+
+def reset():
+    """배포 한 번 단위로 지표 초기화 (배포 데몬처럼 한 프로세스에서 여러 번 배포하는 경우)"""
+    _completed_uploads.clear()
+
+
+class UploadMetrics:
+    """업로드 한 건의 처리량 지표"""
+
+    def __init__(self, file_name, file_size, backend='sync'):
+        self.file_name = file_name
+        self.file_size = file_size
+        self.backend = backend
+        self.started_at = None
+        self.first_byte_at = None
+        self.finished_at = None
+        self.retries = 0
+        self.success = False
+        self.chunks = []
+        self._chunk_started = None
+
+    def start(self):
+        self.started_at = time.monotonic()
+        self._chunk_started = self.started_at
+
+    def chunk_sent(self, num_bytes):
+        """청크 하나의 전송 완료 기록 (num_bytes: 이번 청크에서 서버가 받은 바이트 수)"""
+        now = time.monotonic()
+        if self.first_byte_at is None:
+            self.first_byte_at = now
+        elapsed = max(now - self._chunk_started, 1e-9)
+        self.chunks.append({
+            'bytes': num_bytes,
+            'seconds': round(elapsed, 6),
+            'bytes_per_second': round(num_bytes / elapsed, 1),
+        })
+        self._chunk_started = now
+
+    def retry(self):
+        self.retries += 1
+        self._chunk_started = time.monotonic()
+
+    def finish(self, success):
+        self.finished_at = time.monotonic()
+        self.success = success
+        _completed_uploads.pop((self.file_name, self.backend), None)
+        _completed_uploads[(self.file_name, self.backend)] = self
+
+    @property
+    def total_seconds(self):
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def time_to_first_byte(self):
+        if self.started_at is None or self.first_byte_at is None:
+            return 0.0
+        return self.first_byte_at - self.started_at
+
+    @property
+    def average_bytes_per_second(self):
+        if not self.total_seconds:
+            return 0.0
+        return sum(c['bytes'] for c in self.chunks) / self.total_seconds
+
+    def to_dict(self):
+        rates = sorted(c['bytes_per_second'] for c in self.chunks)
+        return {
+            'file_name': self.file_name,
+            'file_size': self.file_size,
+            'backend': self.backend,
+            'success': self.success,
+            'retries': self.retries,
+            'time_to_first_byte_seconds': round(self.time_to_first_byte, 6),
+            'total_seconds': round(self.total_seconds, 6),
+            'average_bytes_per_second': round(self.average_bytes_per_second, 1),
+            'min_chunk_bytes_per_second': rates[0] if rates else 0.0,
+            'median_chunk_bytes_per_second': rates[len(rates) // 2] if rates else 0.0,
+            'max_chunk_bytes_per_second': rates[-1] if rates else 0.0,
+            'chunks': self.chunks,
+        }
+
+    def print_summary(self):
+        print(f"📊 업로드 지표: 평균 {self.average_bytes_per_second / 1024 / 1024:.2f}MB/s, "
+              f"TTFB {self.time_to_first_byte:.2f}s, 전체 {self.total_seconds:.1f}s, "
+              f"재시도 {self.retries}회")
+
+
+def _prom_labels(metrics):
+    return f'file="{metrics.file_name}",backend="{metrics.backend}"'
+
+
+def render_prometheus(uploads):
+    """node-exporter textfile 형식의 지표 문자열 생성"""
+    series = [
+        ('securememo_upload_bytes', 'gauge', '업로드한 파일 크기 (바이트)',
+         lambda m: m.file_size),
+        ('securememo_upload_success', 'gauge', '업로드 성공 여부 (1: 성공)',
+         lambda m: int(m.success)),
+        ('securememo_upload_retries', 'gauge', '업로드 중 재시도 횟수',
+         lambda m: m.retries),
+        ('securememo_upload_time_to_first_byte_seconds', 'gauge', '첫 청크 응답까지 걸린 시간',
+         lambda m: round(m.time_to_first_byte, 6)),
+        ('securememo_upload_duration_seconds', 'gauge', '전체 전송 시간',
+         lambda m: round(m.total_seconds, 6)),
+        ('securememo_upload_throughput_bytes_per_second', 'gauge', '평균 전송 속도',
+         lambda m: round(m.average_bytes_per_second, 1)),
+        ('securememo_upload_chunks', 'gauge', '전송한 청크 수',
+         lambda m: len(m.chunks)),
+    ]
+
+    lines = []
+    for name, metric_type, help_text, value in series:
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        for metrics in uploads:
+            lines.append(f'{name}{{{_prom_labels(metrics)}}} {value(metrics)}')
+
+    name = 'securememo_upload_chunk_throughput_bytes_per_second'
+    lines.append(f'# HELP {name} 청크별 전송 속도 분포')
+    lines.append(f'# TYPE {name} gauge')
+    for metrics in uploads:
+        summary = metrics.to_dict()
+        for stat in ('min', 'median', 'max'):
+            lines.append(f'{name}{{{_prom_labels(metrics)},stat="{stat}"}} '
+                         f'{summary[f"{stat}_chunk_bytes_per_second"]}')
+
+    lines.append('# HELP securememo_upload_last_run_timestamp_seconds 마지막 지표 기록 시각')
+    lines.append('# TYPE securememo_upload_last_run_timestamp_seconds gauge')
+    lines.append(f'securememo_upload_last_run_timestamp_seconds {int(time.time())}')
+    return '\n'.join(lines) + '\n'
+
+
+def export_metrics(metrics_dir=None):
+    """이번 배포에서 완료된 업로드 지표를 .prom / JSON 파일로 저장"""
+    if not _completed_uploads:
+        return None
+
+    metrics_dir = metrics_dir or METRICS_DIR
+    uploads = list(_completed_uploads.values())
+    try:
+        os.makedirs(metrics_dir, exist_ok=True)
+        # node-exporter가 쓰는 도중의 파일을 읽지 않도록 원자적으로 교체
+        prom_path = os.path.join(metrics_dir, PROM_FILE_NAME)
+        atomic_write_text(prom_path, render_prometheus(uploads))
+
+        summary = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'uploads': [m.to_dict() for m in uploads],
+        }
+        summary_path = os.path.join(metrics_dir, SUMMARY_FILE_NAME)
+        atomic_write_text(summary_path, json.dumps(summary, ensure_ascii=False, indent=2))
+
+        print(f"📊 업로드 지표 저장: {prom_path}")
+        return summary
+    except OSError as e:
+        print(f"⚠️ 업로드 지표 저장 실패: {e}")
+        return None